@@ -0,0 +1,78 @@
+"""Compare current TSDataset.to_dataset / to_flatten with the previous pandas-based implementations."""
+import timeit
+from typing import Any
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from etna.datasets import TSDataset
+from etna.datasets import generate_ar_df
+
+N_SEGMENTS = (1000, 10000, 100000)
+PERIODS = 100
+REPEATS = 3
+
+
+def to_dataset_pivot(df: pd.DataFrame) -> pd.DataFrame:
+    df_copy = df.copy(deep=True)
+    df_copy["timestamp"] = pd.to_datetime(df_copy["timestamp"])
+    df_copy["segment"] = df_copy["segment"].astype(str)
+    df_copy = df_copy.pivot(index="timestamp", columns="segment")
+    df_copy = df_copy.reorder_levels([1, 0], axis=1)
+    df_copy.columns.names = ["segment", "feature"]
+    df_copy = df_copy.sort_index(axis=1, level=(0, 1))
+    return df_copy
+
+
+def to_flatten_loop(df: pd.DataFrame) -> pd.DataFrame:
+    segments = df.columns.get_level_values("segment").unique()
+    dtypes = df.dtypes
+    category_columns = dtypes[dtypes == "category"].index.get_level_values(1).unique()
+    columns = df.columns.get_level_values("feature").unique()
+    df_dict: Dict[str, Any] = {}
+    df_dict["timestamp"] = np.tile(df.index, len(segments))
+    df_dict["segment"] = np.repeat(segments, len(df.index))
+    if "target" in columns:
+        df_dict["target"] = None
+    for column in columns:
+        df_cur = df.loc[:, pd.IndexSlice[:, column]]
+        if column in category_columns:
+            df_dict[column] = pd.api.types.union_categoricals([df_cur[col] for col in df_cur.columns])
+        else:
+            stacked = df_cur.values.T.ravel()
+            df_dict[column] = pd.Series(stacked, dtype=df_cur.dtypes[0])
+    return pd.DataFrame(df_dict)
+
+
+def generate_df(n_segments: int) -> pd.DataFrame:
+    df = generate_ar_df(periods=PERIODS, start_time="2021-01-01", n_segments=n_segments, random_seed=0)
+    df["exog_int"] = np.arange(len(df))
+    df["exog_Int64"] = pd.array(np.arange(len(df)), dtype="Int64")
+    df["exog_cat"] = pd.Categorical(np.arange(len(df)) % 7)
+    return df
+
+
+def bench(func, *args) -> float:
+    return min(timeit.repeat(lambda: func(*args), number=1, repeat=REPEATS))
+
+
+if __name__ == "__main__":
+    rows = []
+    for n_segments in N_SEGMENTS:
+        for name, columns in (("float", ["target"]), ("mixed", None)):
+            df = generate_df(n_segments=n_segments)
+            if columns is not None:
+                df = df[["timestamp", "segment"] + columns]
+            df_wide = TSDataset.to_dataset(df)
+            rows.append(
+                {
+                    "n_segments": n_segments,
+                    "dtypes": name,
+                    "to_dataset_old": bench(to_dataset_pivot, df),
+                    "to_dataset_new": bench(TSDataset.to_dataset, df),
+                    "to_flatten_old": bench(to_flatten_loop, df_wide),
+                    "to_flatten_new": bench(TSDataset.to_flatten, df_wide),
+                }
+            )
+    print(pd.DataFrame(rows).to_string(index=False))
@@ -0,0 +1,68 @@
+"""Compare current TSDataset.describe with the previous implementation that loops over the segments."""
+import timeit
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from etna.datasets import TSDataset
+from etna.datasets import generate_ar_df
+
+N_SEGMENTS = (1000, 10000, 50000)
+PERIODS = 100
+REPEATS = 3
+
+
+def gather_segments_data_loop(ts: TSDataset, segments: Sequence[str]) -> Dict[str, List[Any]]:
+    segments_dict: Dict[str, list] = {
+        "start_timestamp": [],
+        "end_timestamp": [],
+        "length": [],
+        "num_missing": [],
+    }
+    for segment in segments:
+        segment_series = ts[:, segment, "target"]
+        first_index = segment_series.first_valid_index()
+        last_index = segment_series.last_valid_index()
+        segment_series = segment_series.loc[first_index:last_index]
+        segments_dict["start_timestamp"].append(first_index)
+        segments_dict["end_timestamp"].append(last_index)
+        segments_dict["length"].append(segment_series.shape[0])
+        segments_dict["num_missing"].append(pd.isna(segment_series).sum())
+    return segments_dict
+
+
+def generate_ts(n_segments: int) -> TSDataset:
+    df = generate_ar_df(periods=PERIODS, start_time="2021-01-01", n_segments=n_segments, random_seed=0)
+    df = TSDataset.to_dataset(df)
+    rng = np.random.default_rng(0)
+    # segments start at different timestamps and have gaps inside
+    starts = rng.integers(0, PERIODS // 2, size=n_segments)
+    values = df.values
+    values[np.arange(PERIODS)[:, None] < starts[None, :]] = np.NaN
+    values[rng.random(values.shape) < 0.05] = np.NaN
+    df.loc[:, :] = values
+    return TSDataset(df=df, freq="D")
+
+
+def bench(func, *args) -> float:
+    return min(timeit.repeat(lambda: func(*args), number=1, repeat=REPEATS))
+
+
+if __name__ == "__main__":
+    rows = []
+    for n_segments in N_SEGMENTS:
+        ts = generate_ts(n_segments=n_segments)
+        segments = ts.segments
+        rows.append(
+            {
+                "n_segments": n_segments,
+                "gather_segments_data_old": bench(gather_segments_data_loop, ts, segments),
+                "gather_segments_data_new": bench(ts._gather_segments_data, segments),
+                "describe_new": bench(ts.describe),
+            }
+        )
+    print(pd.DataFrame(rows).to_string(index=False))
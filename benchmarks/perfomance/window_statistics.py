@@ -0,0 +1,49 @@
+"""Compare sliding order statistics in window statistics transforms with aggregation of the materialized windows."""
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from etna.transforms import MADTransform
+from etna.transforms import MedianTransform
+from etna.transforms import QuantileTransform
+from etna.transforms.math.statistics import _rolling_count
+
+WINDOWS = (7, 30, 365, 1000)
+N_SEGMENTS = 10
+PERIODS = 5000
+REPEATS = 3
+
+
+def generate_values() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(PERIODS, N_SEGMENTS))
+    x[rng.random(x.shape) < 0.05] = np.NaN
+    return x
+
+
+def bench(func, **kwargs) -> float:
+    return min(timeit.repeat(lambda: func(**kwargs), number=1, repeat=REPEATS))
+
+
+if __name__ == "__main__":
+    x = generate_values()
+    rows = []
+    for window in WINDOWS:
+        counts = _rolling_count(x, window, 1)
+        for transform in (
+            MedianTransform(in_column="target", window=window),
+            QuantileTransform(in_column="target", quantile=0.9, window=window),
+            MADTransform(in_column="target", window=window),
+        ):
+            # compile the kernels before measurement
+            transform._aggregate_rolling(x=x, window=window, counts=counts)
+            rows.append(
+                {
+                    "transform": transform.__class__.__name__,
+                    "window": window,
+                    "sliding_window": bench(transform._aggregate_sliding_window, x=x),
+                    "rolling": bench(transform._aggregate_rolling, x=x, window=window, counts=counts),
+                }
+            )
+    print(pd.DataFrame(rows).to_string(index=False))
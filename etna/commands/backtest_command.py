@@ -7,11 +7,11 @@ from typing import Sequence
 from typing import Union
 
 import hydra_slayer
-import pandas as pd
 import typer
 from omegaconf import OmegaConf
 from typing_extensions import Literal
 
+from etna.commands.utils import read_dataset
 from etna.datasets import TSDataset
 from etna.pipeline import Pipeline
 
@@ -19,10 +19,10 @@ from etna.pipeline import Pipeline
 def backtest(
     config_path: Path = typer.Argument(..., help="path to yaml config with desired pipeline"),
     backtest_config_path: Path = typer.Argument(..., help="path to backtest config file"),
-    target_path: Path = typer.Argument(..., help="path to csv with data to forecast"),
+    target_path: Path = typer.Argument(..., help="path to csv or parquet with data to forecast"),
     freq: str = typer.Argument(..., help="frequency of timestamp in files in pandas format"),
     output_path: Path = typer.Argument(..., help="where to save forecast"),
-    exog_path: Optional[Path] = typer.Argument(default=None, help="path to csv with exog data"),
+    exog_path: Optional[Path] = typer.Argument(default=None, help="path to csv or parquet with exog data"),
     known_future: Optional[List[str]] = typer.Argument(
         None,
         help="list of all known_future columns (regressor "
@@ -32,6 +32,8 @@ def backtest(
 ):
     """Command to run backtest with etna without coding.
 
+    Data can be read from csv, parquet file or the directory with parquet dataset partitioned by segment.
+
     Expected format of csv with target timeseries:
 
     \b
@@ -65,15 +67,12 @@ def backtest(
     pipeline_configs = OmegaConf.to_object(OmegaConf.load(config_path))
     backtest_configs = OmegaConf.to_object(OmegaConf.load(backtest_config_path))
 
-    df_timeseries = pd.read_csv(target_path, parse_dates=["timestamp"])
-
-    df_timeseries = TSDataset.to_dataset(df_timeseries)
+    df_timeseries = read_dataset(target_path)
 
     df_exog = None
     k_f: Union[Literal["all"], Sequence[Any]] = ()
     if exog_path:
-        df_exog = pd.read_csv(exog_path, parse_dates=["timestamp"])
-        df_exog = TSDataset.to_dataset(df_exog)
+        df_exog = read_dataset(exog_path)
         k_f = "all" if not known_future else known_future
 
     tsdataset = TSDataset(df=df_timeseries, freq=freq, df_exog=df_exog, known_future=k_f)
@@ -7,21 +7,22 @@ from typing import Sequence
 from typing import Union
 
 import hydra_slayer
-import pandas as pd
 import typer
 from omegaconf import OmegaConf
 from typing_extensions import Literal
 
+from etna.commands.utils import read_dataset
+from etna.commands.utils import write_flat_dataframe
 from etna.datasets import TSDataset
 from etna.pipeline import Pipeline
 
 
 def forecast(
     config_path: Path = typer.Argument(..., help="path to yaml config with desired pipeline"),
-    target_path: Path = typer.Argument(..., help="path to csv with data to forecast"),
+    target_path: Path = typer.Argument(..., help="path to csv or parquet with data to forecast"),
     freq: str = typer.Argument(..., help="frequency of timestamp in files in pandas format"),
-    output_path: Path = typer.Argument(..., help="where to save forecast"),
-    exog_path: Optional[Path] = typer.Argument(None, help="path to csv with exog data"),
+    output_path: Path = typer.Argument(..., help="where to save forecast, csv or parquet"),
+    exog_path: Optional[Path] = typer.Argument(None, help="path to csv or parquet with exog data"),
     forecast_config_path: Optional[Path] = typer.Argument(None, help="path to yaml config with forecast params"),
     raw_output: bool = typer.Argument(False, help="by default we return only forecast without features"),
     known_future: Optional[List[str]] = typer.Argument(
@@ -33,6 +34,8 @@ def forecast(
 ):
     """Command to make forecast with etna without coding.
 
+    Data can be read from csv, parquet file or the directory with parquet dataset partitioned by segment.
+
     Expected format of csv with target timeseries:
 
     \b
@@ -70,15 +73,12 @@ def forecast(
         forecast_params_config = {}
     forecast_params: Dict[str, Any] = hydra_slayer.get_from_params(**forecast_params_config)
 
-    df_timeseries = pd.read_csv(target_path, parse_dates=["timestamp"])
-
-    df_timeseries = TSDataset.to_dataset(df_timeseries)
+    df_timeseries = read_dataset(target_path)
 
     df_exog = None
     k_f: Union[Literal["all"], Sequence[Any]] = ()
     if exog_path:
-        df_exog = pd.read_csv(exog_path, parse_dates=["timestamp"])
-        df_exog = TSDataset.to_dataset(df_exog)
+        df_exog = read_dataset(exog_path)
         k_f = "all" if not known_future else known_future
 
     tsdataset = TSDataset(df=df_timeseries, freq=freq, df_exog=df_exog, known_future=k_f)
@@ -89,10 +89,10 @@ def forecast(
 
     flatten = forecast.to_pandas(flatten=True)
     if raw_output:
-        (flatten.to_csv(output_path, index=False))
+        write_flat_dataframe(flatten, output_path)
     else:
         quantile_columns = [column for column in flatten.columns if column.startswith("target_0.")]
-        (flatten[["timestamp", "segment", "target"] + quantile_columns].to_csv(output_path, index=False))
+        write_flat_dataframe(flatten[["timestamp", "segment", "target"] + quantile_columns], output_path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import pandas as pd
+
+from etna.datasets import TSDataset
+from etna.datasets import read_parquet
+from etna.datasets.io import _check_parquet_available
+
+PARQUET_SUFFIXES = (".parquet", ".pq")
+
+
+def _is_parquet(path: Path) -> bool:
+    """Check if the path points to parquet file or to the directory with partitioned parquet dataset."""
+    return path.is_dir() or path.suffix in PARQUET_SUFFIXES
+
+
+def read_dataset(path: Path) -> pd.DataFrame:
+    """Read dataset in long format from csv or parquet and convert it into ETNA wide format.
+
+    Parameters
+    ----------
+    path:
+        path to csv file, parquet file or the directory with partitioned parquet dataset
+
+    Returns
+    -------
+    :
+        dataframe in ETNA wide format
+    """
+    if _is_parquet(path):
+        return read_parquet(path)
+    df = pd.read_csv(path, parse_dates=["timestamp"])
+    return TSDataset.to_dataset(df)
+
+
+def write_flat_dataframe(df: pd.DataFrame, path: Path):
+    """Write dataframe in long format into csv or parquet depending on the suffix of the path.
+
+    Parameters
+    ----------
+    df:
+        dataframe in long format
+    path:
+        path to the output file
+    """
+    if path.suffix in PARQUET_SUFFIXES:
+        _check_parquet_available()
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
@@ -4,6 +4,8 @@ from etna.datasets.datasets_generation import generate_from_patterns_df
 from etna.datasets.datasets_generation import generate_hierarchical_df
 from etna.datasets.datasets_generation import generate_periodic_df
 from etna.datasets.hierarchical_structure import HierarchicalStructure
+from etna.datasets.io import read_parquet
+from etna.datasets.io import write_parquet
 from etna.datasets.tsdataset import TSDataset
 from etna.datasets.utils import duplicate_data
 from etna.datasets.utils import set_columns_wide
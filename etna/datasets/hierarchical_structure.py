@@ -6,8 +6,8 @@ from typing import List
 from typing import Optional
 from typing import Tuple
 
+import numpy as np
 from scipy.sparse import csr_matrix
-from scipy.sparse import lil_matrix
 
 from etna.core import BaseMixin
 
@@ -45,6 +45,8 @@ class HierarchicalStructure(BaseMixin):
             segment: level for level in self._level_series for segment in self._level_series[level]
         }
 
+        self._summing_matrices: Dict[Tuple[str, str], csr_matrix] = {}
+
     @staticmethod
     def _get_level_names(level_names: Optional[List[str]], tree_depth: int) -> List[str]:
         """Assign level names if not provided."""
@@ -142,7 +144,8 @@ class HierarchicalStructure(BaseMixin):
         Returns
         -------
         :
-            Summing matrix from source level to target level
+            Summing matrix from source level to target level, it is computed once for each pair of levels
+            and shared between the calls, so it shouldn't be modified
 
         """
         try:
@@ -154,21 +157,36 @@ class HierarchicalStructure(BaseMixin):
         if target_idx > source_idx:
             raise ValueError("Target level must be higher or equal in hierarchy than source level!")
 
-        target_level_segment = self.get_level_segments(target_level)
-        source_level_segment = self.get_level_segments(source_level)
-        summing_matrix = lil_matrix((len(target_level_segment), len(source_level_segment)), dtype="int32")
-
-        current_source_segment_id = 0
-        for current_target_segment_id, segment in enumerate(target_level_segment):
-            num_reachable_leafs_left = self._segment_num_reachable_leafs[segment]
+        key = (target_level, source_level)
+        if key not in self._summing_matrices:
+            self._summing_matrices[key] = self._make_summing_matrix(
+                target_level=target_level, source_level=source_level
+            )
+        return self._summing_matrices[key]
 
-            while num_reachable_leafs_left > 0:
-                source_segment = source_level_segment[current_source_segment_id]
-                num_reachable_leafs_left -= self._segment_num_reachable_leafs[source_segment]
-                summing_matrix[current_target_segment_id, current_source_segment_id] = 1
-                current_source_segment_id += 1
+    def _make_summing_matrix(self, target_level: str, source_level: str) -> csr_matrix:
+        """Make summing matrix by matching each source segment with the target segment that covers its leafs.
 
-        return summing_matrix.tocsr()
+        Segments on each level are in BFS order, so the leafs of the segments on each level are consecutive.
+        """
+        target_num_leafs = self._get_level_num_reachable_leafs(target_level)
+        source_num_leafs = self._get_level_num_reachable_leafs(source_level)
+
+        source_first_leafs = np.cumsum(source_num_leafs) - source_num_leafs
+        target_ids = np.searchsorted(np.cumsum(target_num_leafs), source_first_leafs, side="right")
+        source_ids = np.arange(len(source_num_leafs))
+
+        summing_matrix = csr_matrix(
+            (np.ones(len(source_ids), dtype="int32"), (target_ids, source_ids)),
+            shape=(len(target_num_leafs), len(source_num_leafs)),
+        )
+        return summing_matrix
+
+    def _get_level_num_reachable_leafs(self, level_name: str) -> np.ndarray:
+        """Get number of reachable leafs for each segment of the level."""
+        return np.array(
+            [self._segment_num_reachable_leafs[segment] for segment in self._level_series[level_name]], dtype=np.int64
+        )
 
     def get_level_segments(self, level_name: str) -> List[str]:
         """Get all segments from particular level."""
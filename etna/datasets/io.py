@@ -0,0 +1,120 @@
+import pathlib
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import pandas as pd
+
+from etna.datasets.utils import _long_to_wide
+from etna.settings import _module_available
+
+TTimestamp = Union[str, pd.Timestamp]
+
+
+def _check_parquet_available():
+    """Check that the parquet engine is installed."""
+    if not (_module_available("pyarrow") or _module_available("fastparquet")):
+        raise ImportError("etna[parquet] is not available, to install it, run `pip install etna[parquet]`.")
+
+
+def _get_parquet_filters(
+    segments: Optional[Sequence[str]], start_timestamp: Optional[TTimestamp], end_timestamp: Optional[TTimestamp]
+) -> Optional[List[Tuple[str, str, Any]]]:
+    """Get filters to push down to the parquet reader."""
+    filters: List[Tuple[str, str, Any]] = []
+    if segments is not None:
+        filters.append(("segment", "in", list(segments)))
+    if start_timestamp is not None:
+        filters.append(("timestamp", ">=", pd.Timestamp(start_timestamp)))
+    if end_timestamp is not None:
+        filters.append(("timestamp", "<=", pd.Timestamp(end_timestamp)))
+    return filters if len(filters) > 0 else None
+
+
+def read_parquet(
+    path: Union[str, pathlib.Path],
+    features: Optional[Sequence[str]] = None,
+    segments: Optional[Sequence[str]] = None,
+    start_timestamp: Optional[TTimestamp] = None,
+    end_timestamp: Optional[TTimestamp] = None,
+) -> pd.DataFrame:
+    """Read parquet dataset in long format into ETNA wide format.
+
+    Dataset can be a single file or a directory partitioned by segment, e.g. written by :py:func:`write_parquet`.
+    Selection of features, segments and time range is pushed down to the reader,
+    so the rows and columns that aren't selected aren't read.
+
+    Reading requires ``pyarrow`` or ``fastparquet`` to be installed, e.g. with ``pip install etna[parquet]``.
+
+    Parameters
+    ----------
+    path:
+        path to the parquet file or to the directory with partitioned dataset
+    features:
+        features to read, if None all the features are read
+    segments:
+        segments to read, if None all the segments are read
+    start_timestamp:
+        first timestamp to read, if None the data is read from the beginning
+    end_timestamp:
+        last timestamp to read, if None the data is read till the end
+
+    Returns
+    -------
+    :
+        dataframe in ETNA wide format
+
+    Raises
+    ------
+    ImportError:
+        if parquet engine isn't installed
+
+    Examples
+    --------
+    >>> from etna.datasets import TSDataset
+    >>> from etna.datasets import generate_const_df
+    >>> df = generate_const_df(periods=30, start_time="2021-06-01", n_segments=2, scale=1)
+    >>> write_parquet(TSDataset.to_dataset(df), "data.parquet", partition_by_segment=True)  # doctest: +SKIP
+    >>> read_parquet("data.parquet", segments=["segment_0"], end_timestamp="2021-06-03")  # doctest: +SKIP
+    segment    segment_0
+    feature       target
+    timestamp
+    2021-06-01      1.00
+    2021-06-02      1.00
+    2021-06-03      1.00
+    """
+    _check_parquet_available()
+    columns = None if features is None else ["timestamp", "segment"] + list(features)
+    filters = _get_parquet_filters(segments=segments, start_timestamp=start_timestamp, end_timestamp=end_timestamp)
+    df = pd.read_parquet(path, columns=columns, filters=filters)
+    return _long_to_wide(df)
+
+
+def write_parquet(df: pd.DataFrame, path: Union[str, pathlib.Path], partition_by_segment: bool = False):
+    """Write dataframe in ETNA wide format into parquet dataset in long format.
+
+    Writing requires ``pyarrow`` or ``fastparquet`` to be installed, e.g. with ``pip install etna[parquet]``.
+
+    Parameters
+    ----------
+    df:
+        dataframe in ETNA wide format
+    path:
+        path to the parquet file or to the directory with partitioned dataset
+    partition_by_segment:
+        if True, dataset is written into the directory with one partition per segment
+
+    Raises
+    ------
+    ImportError:
+        if parquet engine isn't installed
+    """
+    from etna.datasets.tsdataset import TSDataset
+
+    _check_parquet_available()
+    df_flat = TSDataset.to_flatten(df)
+    partition_cols = ["segment"] if partition_by_segment else None
+    df_flat.to_parquet(path, index=False, partition_cols=partition_cols)
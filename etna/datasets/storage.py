@@ -0,0 +1,648 @@
+import pathlib
+from enum import Enum
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+
+class DataStorage(str, Enum):
+    """Enum for different types of :py:class:`~etna.datasets.tsdataset.TSDataset` storage."""
+
+    #: data is kept in the wide ``pd.DataFrame``
+    pandas = "pandas"
+    #: data is kept in the contiguous ``(time, segment, feature)`` numpy block
+    array = "array"
+
+    @classmethod
+    def _missing_(cls, value):
+        raise NotImplementedError(
+            f"{value} is not a valid {cls.__name__}. Only {', '.join([repr(m.value) for m in cls])} storages allowed"
+        )
+
+
+def _dtype_to_json(dtype: Any) -> Dict[str, Any]:
+    """Convert dtype of the feature into json serializable representation."""
+    if isinstance(dtype, pd.CategoricalDtype):
+        return {"categories": dtype.categories.tolist(), "ordered": bool(dtype.ordered)}
+    return {"name": str(dtype)}
+
+
+def _dtype_from_json(dtype_json: Dict[str, Any]) -> Any:
+    """Restore dtype of the feature from its json serializable representation."""
+    if "categories" in dtype_json:
+        return pd.CategoricalDtype(categories=dtype_json["categories"], ordered=dtype_json["ordered"])
+    return pd.api.types.pandas_dtype(dtype_json["name"])
+
+
+def _is_same_dtype(dtype: Any, other_dtype: Any) -> bool:
+    """Check that dtypes are the same, categorical dtypes should have the same categories in the same order."""
+    if isinstance(dtype, pd.CategoricalDtype) and isinstance(other_dtype, pd.CategoricalDtype):
+        return dtype.categories.equals(other_dtype.categories) and dtype.ordered == other_dtype.ordered
+    return dtype == other_dtype
+
+
+def _positions_to_slice(positions: Sequence[int]) -> Union[slice, List[int]]:
+    """Convert positions into slice if they form contiguous ascending range."""
+    if len(positions) > 0 and positions[-1] - positions[0] == len(positions) - 1:
+        if all(positions[i + 1] - positions[i] == 1 for i in range(len(positions) - 1)):
+            return slice(positions[0], positions[-1] + 1)
+    return list(positions)
+
+
+class ArrayStorage:
+    """Columnar storage of the wide dataframe as a contiguous ``(time, segment, feature)`` numpy block.
+
+    Every feature is kept as a numeric slice of the block, categorical features are kept as integer codes
+    of the union of the categories of all the segments.
+    Original dtypes of the features are remembered and restored when pandas frame is built,
+    categorical dtypes are restored for each segment separately.
+
+    The block is allocated with a spare capacity along the feature and the time axes, so adding new features
+    or appending new timestamps doesn't copy the whole block every time.
+    Features are physically stored in the order of addition,
+    but all the pandas frames are built with the features sorted by name.
+
+    Notes
+    -----
+    Storage requires all the segments to have the same set of features.
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        index: pd.DatetimeIndex,
+        segments: List[str],
+        features: List[str],
+        dtypes: Dict[str, Any],
+        segment_dtypes: Optional[Dict[Tuple[str, str], Any]] = None,
+    ):
+        """Init ArrayStorage.
+
+        Parameters
+        ----------
+        values:
+            block of shape ``(time, segment, feature)`` or with a spare capacity along the time and feature axes
+        index:
+            timestamps of the block
+        segments:
+            names of the segments in the order of the block
+        features:
+            names of the features in the order of the block
+        dtypes:
+            original dtypes of the features
+        segment_dtypes:
+            original dtypes of the ``(segment, feature)`` columns that differ from the dtypes of their features
+        """
+        if values.ndim != 3 or values.shape[0] < len(index) or values.shape[1] != len(segments):
+            raise ValueError("Shape of values doesn't match the index and the segments!")
+        if values.shape[2] < len(features):
+            raise ValueError("Shape of values doesn't match the features!")
+        self._values = values
+        self.index = index
+        self._segments = list(segments)
+        self._segment_to_idx: Dict[str, int] = {segment: i for i, segment in enumerate(self._segments)}
+        self._features = list(features)
+        self._feature_to_idx: Dict[str, int] = {feature: i for i, feature in enumerate(self._features)}
+        self._dtypes = dict(dtypes)
+        self._segment_dtypes: Dict[Tuple[str, str], Any] = {} if segment_dtypes is None else dict(segment_dtypes)
+        self._columns: Optional[pd.MultiIndex] = None
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Dtype of the block."""
+        return self._values.dtype
+
+    @property
+    def values(self) -> np.ndarray:
+        """Block of shape ``(time, segment, feature)`` with features in order of addition."""
+        return self._values[: len(self.index), :, : len(self._features)]
+
+    @property
+    def segments(self) -> List[str]:
+        """Sorted list of segments."""
+        return list(self._segments)
+
+    @property
+    def features(self) -> List[str]:
+        """Sorted list of features."""
+        return sorted(self._features)
+
+    @property
+    def dtypes(self) -> Dict[str, Any]:
+        """Original dtypes of the features."""
+        return dict(self._dtypes)
+
+    @property
+    def segment_dtypes(self) -> Dict[Tuple[str, str], Any]:
+        """Original dtypes of the ``(segment, feature)`` columns that differ from the dtypes of their features."""
+        return dict(self._segment_dtypes)
+
+    @property
+    def columns(self) -> pd.MultiIndex:
+        """Columns of the wide dataframe in ETNA format."""
+        if self._columns is None:
+            self._columns = pd.MultiIndex.from_product([self._segments, self.features], names=("segment", "feature"))
+        return self._columns
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """Shape of the block: number of timestamps, segments and features."""
+        return len(self.index), len(self._segments), len(self._features)
+
+    @staticmethod
+    def _check_frame(df: pd.DataFrame) -> Tuple[List[str], List[str]]:
+        """Check that frame is in ETNA wide format with the same features for all the segments."""
+        if not isinstance(df.columns, pd.MultiIndex) or list(df.columns.names) != ["segment", "feature"]:
+            raise ValueError("Dataframe should be in ETNA wide format!")
+        segments = sorted(df.columns.get_level_values("segment").unique())
+        features = sorted(df.columns.get_level_values("feature").unique())
+        if len(df.columns) != len(segments) * len(features) or df.columns.has_duplicates:
+            raise ValueError("All the segments should have the same set of features!")
+        return segments, features
+
+    @staticmethod
+    def _encode_column(column: pd.Series, dtype: Any, categories: Optional[pd.Index]) -> np.ndarray:
+        """Encode one column of the wide dataframe into numeric array."""
+        if categories is not None:
+            codes = pd.Categorical(column, categories=categories).codes
+            return np.where(codes == -1, np.nan, codes).astype(dtype)
+        return column.to_numpy(dtype=dtype, na_value=np.nan)
+
+    @classmethod
+    def _encode_frame(
+        cls, df: pd.DataFrame, segments: List[str], features: List[str], dtype: Any
+    ) -> Tuple[np.ndarray, Dict[str, Any], Dict[Tuple[str, str], Any]]:
+        """Encode the wide dataframe into the block of shape ``(time, segment, feature)``.
+
+        Returns the block, dtypes of the features and dtypes of the columns that differ from the dtypes of the features.
+        """
+        dtypes = df.dtypes
+        if len(df.columns) > 0 and all(current_dtype == dtype for current_dtype in dtypes):
+            # fast path: the whole dataframe is a single numeric block
+            positions = df.columns.get_indexer(pd.MultiIndex.from_product([segments, features]))
+            values = df.values[:, positions].reshape(len(df), len(segments), len(features))
+            return values, {feature: np.dtype(dtype) for feature in features}, {}
+
+        values = np.empty((len(df), len(segments), len(features)), dtype=dtype)
+        features_dtypes: Dict[str, Any] = {}
+        segment_dtypes: Dict[Tuple[str, str], Any] = {}
+        for feature_idx, feature in enumerate(features):
+            feature_dtypes = [dtypes[(segment, feature)] for segment in segments]
+            categories = None
+            if all(isinstance(feature_dtype, pd.CategoricalDtype) for feature_dtype in feature_dtypes):
+                categories = feature_dtypes[0].categories
+                for feature_dtype in feature_dtypes[1:]:
+                    categories = categories.append(feature_dtype.categories.difference(categories, sort=False))
+                feature_dtype = pd.CategoricalDtype(categories=categories)
+                for segment, segment_dtype in zip(segments, feature_dtypes):
+                    if not _is_same_dtype(segment_dtype, feature_dtype):
+                        segment_dtypes[(segment, feature)] = segment_dtype
+            elif all(
+                pd.api.types.is_numeric_dtype(feature_dtype) and not isinstance(feature_dtype, pd.CategoricalDtype)
+                for feature_dtype in feature_dtypes
+            ):
+                feature_dtype = feature_dtypes[0] if len(set(map(str, feature_dtypes))) == 1 else np.dtype(dtype)
+            else:
+                raise ValueError(
+                    f"Feature {feature} has dtype that can't be kept in array storage, "
+                    f"only numeric and categorical features are supported!"
+                )
+            for segment_idx, segment in enumerate(segments):
+                values[:, segment_idx, feature_idx] = cls._encode_column(
+                    column=df[(segment, feature)], dtype=dtype, categories=categories
+                )
+            features_dtypes[feature] = feature_dtype
+        return values, features_dtypes, segment_dtypes
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, dtype: Any = np.float64) -> "ArrayStorage":
+        """Create storage from the wide dataframe.
+
+        Parameters
+        ----------
+        df:
+            dataframe in ETNA wide format
+        dtype:
+            dtype of the block
+
+        Returns
+        -------
+        :
+            created storage
+
+        Raises
+        ------
+        ValueError:
+            if segments have different sets of features
+        ValueError:
+            if some feature has dtype that isn't numeric or categorical
+        """
+        segments, features = cls._check_frame(df)
+        values, dtypes, segment_dtypes = cls._encode_frame(df=df, segments=segments, features=features, dtype=dtype)
+        values = np.ascontiguousarray(values)
+        return cls(
+            values=values,
+            index=df.index,
+            segments=segments,
+            features=features,
+            dtypes=dtypes,
+            segment_dtypes=segment_dtypes,
+        )
+
+    def _decode_column(self, values: np.ndarray, segment: str, feature: str) -> Any:
+        """Restore original dtype of the column."""
+        feature_dtype = self._dtypes[feature]
+        if feature_dtype == values.dtype:
+            return values
+        if isinstance(feature_dtype, pd.CategoricalDtype):
+            codes = np.where(np.isnan(values), -1, values).astype(np.int64)
+            column = pd.Categorical.from_codes(codes, dtype=feature_dtype)
+            segment_dtype = self._segment_dtypes.get((segment, feature))
+            if segment_dtype is not None:
+                column = column.set_categories(segment_dtype.categories, ordered=segment_dtype.ordered)
+            return column
+        if isinstance(feature_dtype, np.dtype):
+            if np.isnan(values).any():
+                return values
+            return values.astype(feature_dtype)
+        return pd.array(values, dtype=feature_dtype)
+
+    @staticmethod
+    def _get_positions(names: Sequence[str], name_to_idx: Dict[str, int]) -> List[int]:
+        """Get positions of the names in the block."""
+        try:
+            return [name_to_idx[name] for name in names]
+        except KeyError as e:
+            raise KeyError(f"{e.args[0]} is not present in the dataset!")
+
+    def get_values(
+        self, segments: Optional[Sequence[str]] = None, features: Optional[Sequence[str]] = None
+    ) -> np.ndarray:
+        """Get block of values for the given segments and features.
+
+        The view on the storage is returned if it is possible, otherwise the copy is made.
+
+        Parameters
+        ----------
+        segments:
+            segments to select, if None all the segments are selected
+        features:
+            features to select, if None all the features are selected in sorted order
+
+        Returns
+        -------
+        :
+            block of shape ``(time, segment, feature)``
+        """
+        segments = self._segments if segments is None else segments
+        features = self.features if features is None else features
+        segments_positions = _positions_to_slice(self._get_positions(segments, self._segment_to_idx))
+        features_positions = _positions_to_slice(self._get_positions(features, self._feature_to_idx))
+        block = self._values[: len(self.index)]
+        if isinstance(segments_positions, slice) or isinstance(features_positions, slice):
+            return block[:, segments_positions, :][:, :, features_positions]
+        return block[np.ix_(np.arange(len(self.index)), segments_positions, features_positions)]
+
+    def to_frame(
+        self,
+        segments: Optional[Sequence[str]] = None,
+        features: Optional[Sequence[str]] = None,
+        copy: bool = True,
+        read_only: bool = False,
+    ) -> pd.DataFrame:
+        """Build the wide dataframe in ETNA format.
+
+        Columns are ordered in the order of given segments and features.
+
+        Parameters
+        ----------
+        segments:
+            segments to select, if None all the segments are selected
+        features:
+            features to select, if None all the features are selected in sorted order
+        copy:
+            if False, the dataframe is allowed to share memory with the storage
+        read_only:
+            if True, the data of the dataframe that shares memory with the storage is marked as non-writeable
+
+        Returns
+        -------
+        :
+            dataframe in ETNA wide format
+        """
+        segments = self._segments if segments is None else list(segments)
+        features = self.features if features is None else list(features)
+        values = self.get_values(segments=segments, features=features)
+        columns = pd.MultiIndex.from_product([segments, features], names=("segment", "feature"))
+        num_timestamps, num_segments, num_features = values.shape
+
+        if all(self._dtypes[feature] == values.dtype for feature in features):
+            values_2d = values.reshape(num_timestamps, num_segments * num_features)
+            if np.shares_memory(values_2d, self._values):
+                if copy:
+                    # plain array is created, so the copy isn't treated as a memory-mapped block by ``joblib``
+                    values_2d = np.array(values_2d)
+                elif read_only:
+                    values_2d = values_2d.view()
+                    values_2d.flags.writeable = False
+            return pd.DataFrame(values_2d, index=self.index, columns=columns, copy=False)
+
+        data = {}
+        for segment_idx, segment in enumerate(segments):
+            for feature_idx, feature in enumerate(features):
+                data[segment_idx * num_features + feature_idx] = self._decode_column(
+                    values=values[:, segment_idx, feature_idx], segment=segment, feature=feature
+                )
+        df = pd.DataFrame(data, index=self.index)
+        df.columns = columns
+        return df
+
+    def slice_timestamps(self, start: Optional[int] = None, stop: Optional[int] = None) -> "ArrayStorage":
+        """Get storage with the slice of timestamps that shares the block with this storage.
+
+        Block is marked as read-only in both storages, so it is copied by the storage that modifies it first.
+
+        Parameters
+        ----------
+        start:
+            position of the first timestamp of the slice, if None the slice starts from the beginning
+        stop:
+            position after the last timestamp of the slice, if None the slice ends at the end
+
+        Returns
+        -------
+        :
+            storage with the slice of timestamps
+        """
+        if self._values.flags.writeable:
+            self._values = self._values.view()
+            self._values.flags.writeable = False
+        start, stop, _ = slice(start, stop).indices(len(self.index))
+        stop = max(start, stop)
+        return ArrayStorage(
+            values=self._values[start:stop, :, : len(self._features)],
+            index=self.index[start:stop],
+            segments=self._segments,
+            features=self._features,
+            dtypes=self._dtypes,
+            segment_dtypes=self._segment_dtypes,
+        )
+
+    def _reserve(self, num_features: int):
+        """Make sure that the block has enough capacity to keep the given number of features."""
+        capacity = self._values.shape[2]
+        if num_features <= capacity and self._values.flags.writeable:
+            return
+        new_capacity = max(num_features, int(1.5 * capacity))
+        values = np.empty((self._values.shape[0], len(self._segments), new_capacity), dtype=self.dtype)
+        values[: len(self.index), :, : len(self._features)] = self.values
+        self._values = values
+
+    def _reserve_timestamps(self, num_timestamps: int):
+        """Make sure that the block has enough capacity to keep the given number of timestamps."""
+        capacity = self._values.shape[0]
+        if num_timestamps <= capacity and self._values.flags.writeable:
+            return
+        new_capacity = max(num_timestamps, int(1.5 * capacity))
+        values = np.empty((new_capacity, len(self._segments), self._values.shape[2]), dtype=self.dtype)
+        values[: len(self.index), :, : len(self._features)] = self.values
+        self._values = values
+
+    def _ensure_writeable(self):
+        """Copy the block if it can't be written into."""
+        if not self._values.flags.writeable:
+            self._values = self.values.copy()
+
+    def _update_dtypes(self, dtypes: Dict[str, Any], segment_dtypes: Dict[Tuple[str, str], Any]):
+        """Update dtypes of the features and of their columns."""
+        self._dtypes.update(dtypes)
+        self._segment_dtypes = {
+            key: segment_dtype for key, segment_dtype in self._segment_dtypes.items() if key[1] not in dtypes
+        }
+        self._segment_dtypes.update(segment_dtypes)
+
+    def _align_frame(self, df: pd.DataFrame) -> Optional[Tuple[pd.DataFrame, List[str]]]:
+        """Align the frame with the storage, return None if it is impossible."""
+        try:
+            segments, features = self._check_frame(df)
+        except ValueError:
+            return None
+        if segments != self._segments:
+            return None
+        if not df.index.equals(self.index):
+            if not df.index.isin(self.index).all():
+                return None
+            df = df.reindex(self.index)
+        return df, features
+
+    def set_features(self, df: pd.DataFrame) -> bool:
+        """Replace values of the existing features with the values from the wide dataframe.
+
+        Values at the timestamps that aren't present in ``df`` are set to NaN.
+
+        Parameters
+        ----------
+        df:
+            dataframe in ETNA wide format
+
+        Returns
+        -------
+        :
+            False if the dataframe can't be aligned with the storage and nothing is done, True otherwise
+        """
+        aligned = self._align_frame(df)
+        if aligned is None:
+            return False
+        df, features = aligned
+        if not set(features).issubset(self._feature_to_idx):
+            return False
+        values, dtypes, segment_dtypes = self._encode_frame(
+            df=df, segments=self._segments, features=features, dtype=self.dtype
+        )
+        self._ensure_writeable()
+        for feature_idx, feature in enumerate(features):
+            self._values[: len(self.index), :, self._feature_to_idx[feature]] = values[:, :, feature_idx]
+        self._update_dtypes(dtypes=dtypes, segment_dtypes=segment_dtypes)
+        return True
+
+    def add_features(self, df: pd.DataFrame) -> bool:
+        """Add new features from the wide dataframe.
+
+        Values at the timestamps that aren't present in ``df`` are set to NaN.
+
+        Parameters
+        ----------
+        df:
+            dataframe in ETNA wide format
+
+        Returns
+        -------
+        :
+            False if the dataframe can't be aligned with the storage and nothing is done, True otherwise
+        """
+        aligned = self._align_frame(df)
+        if aligned is None:
+            return False
+        df, features = aligned
+        if len(set(features) & set(self._feature_to_idx)) > 0:
+            return False
+        values, dtypes, segment_dtypes = self._encode_frame(
+            df=df, segments=self._segments, features=features, dtype=self.dtype
+        )
+        num_features = len(self._features)
+        self._reserve(num_features + len(features))
+        self._values[: len(self.index), :, num_features : num_features + len(features)] = values
+        for feature in features:
+            self._feature_to_idx[feature] = len(self._features)
+            self._features.append(feature)
+        self._update_dtypes(dtypes=dtypes, segment_dtypes=segment_dtypes)
+        self._columns = None
+        return True
+
+    def append_timestamps(self, df: pd.DataFrame) -> bool:
+        """Append values at the new timestamps from the wide dataframe to the end of the storage.
+
+        Features that aren't present in ``df`` are set to NaN at the new timestamps.
+
+        Parameters
+        ----------
+        df:
+            dataframe in ETNA wide format with timestamps after the last timestamp of the storage
+
+        Returns
+        -------
+        :
+            False if the dataframe can't be appended to the storage and nothing is done, True otherwise
+        """
+        try:
+            segments, features = self._check_frame(df)
+        except ValueError:
+            return False
+        if segments != self._segments or not set(features).issubset(self._feature_to_idx):
+            return False
+        if len(df) == 0 or (len(self.index) > 0 and df.index.min() <= self.index.max()):
+            return False
+        values, dtypes, segment_dtypes = self._encode_frame(
+            df=df, segments=self._segments, features=features, dtype=self.dtype
+        )
+        for feature in features:
+            # codes of categorical feature are valid only for the same categories
+            is_categorical = isinstance(self._dtypes[feature], pd.CategoricalDtype) or isinstance(
+                dtypes[feature], pd.CategoricalDtype
+            )
+            if is_categorical and not _is_same_dtype(self._dtypes[feature], dtypes[feature]):
+                return False
+            if is_categorical and not all(
+                _is_same_dtype(self._segment_dtypes.get((segment, feature)), segment_dtypes.get((segment, feature)))
+                for segment in self._segments
+            ):
+                return False
+
+        num_timestamps = len(self.index)
+        self._reserve_timestamps(num_timestamps + len(df))
+        block = self._values[num_timestamps : num_timestamps + len(df)]
+        block[:, :, : len(self._features)] = np.nan
+        for feature_idx, feature in enumerate(features):
+            block[:, :, self._feature_to_idx[feature]] = values[:, :, feature_idx]
+        self.index = self.index.append(df.index)
+        return True
+
+    def drop_features(self, features: Sequence[str]):
+        """Drop features from the storage.
+
+        Parameters
+        ----------
+        features:
+            features to drop, unknown features are ignored
+        """
+        positions = sorted(self._feature_to_idx[feature] for feature in set(features) if feature in self._feature_to_idx)
+        if len(positions) == 0:
+            return
+        keep = [i for i in range(len(self._features)) if i not in set(positions)]
+        self._ensure_writeable()
+        self._values[:, :, : len(keep)] = self._values[:, :, keep]
+        self._features = [self._features[i] for i in keep]
+        self._feature_to_idx = {feature: i for i, feature in enumerate(self._features)}
+        self._dtypes = {feature: self._dtypes[feature] for feature in self._features}
+        self._segment_dtypes = {
+            key: segment_dtype for key, segment_dtype in self._segment_dtypes.items() if key[1] in self._dtypes
+        }
+        self._columns = None
+
+    def save(self, path: pathlib.Path, name: str) -> Dict[str, Any]:
+        """Save the storage into the directory as raw ``.npy`` files.
+
+        Block of values is saved into ``<name>.npy``, timestamps are saved into ``<name>_index.npy``.
+
+        Parameters
+        ----------
+        path:
+            directory to save the storage into
+        name:
+            name of the files with the data
+
+        Returns
+        -------
+        :
+            json serializable metadata required to load the storage
+        """
+        np.save(path / f"{name}.npy", np.ascontiguousarray(self.values))
+        np.save(path / f"{name}_index.npy", self.index.values)
+        return {
+            "index_name": self.index.name,
+            "freq": self.index.freqstr,
+            "segments": self._segments,
+            "features": self._features,
+            "dtypes": {feature: _dtype_to_json(self._dtypes[feature]) for feature in self._features},
+            "segment_dtypes": [
+                [segment, feature, _dtype_to_json(segment_dtype)]
+                for (segment, feature), segment_dtype in self._segment_dtypes.items()
+            ],
+        }
+
+    @classmethod
+    def load(
+        cls, path: pathlib.Path, name: str, metadata: Dict[str, Any], mmap_mode: Optional[str] = "r"
+    ) -> "ArrayStorage":
+        """Load the storage saved with :py:meth:`save`.
+
+        Parameters
+        ----------
+        path:
+            directory with the saved storage
+        name:
+            name of the files with the data
+        metadata:
+            metadata returned by :py:meth:`save`
+        mmap_mode:
+            mode of :py:func:`numpy.load` to memory-map the block of values, if None the block is read into memory
+
+        Returns
+        -------
+        :
+            loaded storage
+        """
+        values = np.load(path / f"{name}.npy", mmap_mode=mmap_mode)
+        index = pd.DatetimeIndex(
+            np.load(path / f"{name}_index.npy"), freq=metadata["freq"], name=metadata["index_name"]
+        )
+        dtypes = {feature: _dtype_from_json(dtype_json) for feature, dtype_json in metadata["dtypes"].items()}
+        segment_dtypes = {
+            (segment, feature): _dtype_from_json(dtype_json)
+            for segment, feature, dtype_json in metadata.get("segment_dtypes", [])
+        }
+        return cls(
+            values=values,
+            index=index,
+            segments=metadata["segments"],
+            features=metadata["features"],
+            dtypes=dtypes,
+            segment_dtypes=segment_dtypes,
+        )
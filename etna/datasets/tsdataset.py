@@ -1,5 +1,8 @@
+import json
 import math
+import pathlib
 import warnings
+import weakref
 from copy import copy
 from copy import deepcopy
 from typing import TYPE_CHECKING
@@ -11,6 +14,7 @@ from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Set
 from typing import Tuple
 from typing import Union
 
@@ -21,7 +25,10 @@ from typing_extensions import Literal
 
 from etna import SETTINGS
 from etna.datasets.hierarchical_structure import HierarchicalStructure
+from etna.datasets.storage import ArrayStorage
+from etna.datasets.storage import DataStorage
 from etna.datasets.utils import _TorchDataset
+from etna.datasets.utils import _long_to_wide
 from etna.datasets.utils import get_level_dataframe
 from etna.datasets.utils import inverse_transform_target_components
 from etna.datasets.utils import match_target_quantiles
@@ -111,6 +118,10 @@ class TSDataset:
         df_exog: Optional[pd.DataFrame] = None,
         known_future: Union[Literal["all"], Sequence] = (),
         hierarchical_structure: Optional[HierarchicalStructure] = None,
+        storage: str = DataStorage.pandas,
+        dtype: Optional[Union[str, np.dtype]] = None,
+        lazy_exog: bool = False,
+        trusted: bool = False,
     ):
         """Init TSDataset.
 
@@ -127,46 +138,283 @@ class TSDataset:
             if "all" value is given, all columns are meant to be regressors
         hierarchical_structure:
             Structure of the levels in the hierarchy. If None, there is no hierarchical structure in the dataset.
+        storage:
+            Storage of the data:
+
+            * If "pandas", data is kept in the wide ``pd.DataFrame``;
+
+            * If "array", data is kept in the contiguous ``(time, segment, feature)`` numpy block,
+              pandas dataframes are built only when they are requested.
+              All the segments should have the same set of numeric or categorical features.
+              Access to :py:attr:`df` converts the dataset into the "pandas" storage.
+        dtype:
+            Floating dtype of the numeric data, e.g. "float32" to halve the memory footprint of the dataset.
+            If given, floating columns of ``df``, ``df_exog`` and of the features added by the transforms
+            are cast to it, in "array" storage the block is allocated with this dtype.
+            Categorical features are still kept as integer codes in "array" storage.
+            If None, dtypes of the columns are kept as is.
+        lazy_exog:
+            If True, ``df_exog`` isn't merged into ``df``, its features are joined on demand
+            over the timestamps of the dataset only when they are requested,
+            e.g. by :py:meth:`to_pandas` or :py:meth:`get_features_view` with ``required_features`` of the transform.
+            Access to :py:attr:`df` joins all the remaining exogenous features.
+        trusted:
+            If True, ``df`` and ``df_exog`` are considered to be already prepared,
+            e.g. taken from another dataset: they have string segments, sorted columns and sorted unique timestamps.
+            In that case they aren't copied and their index is checked to be regular with ``freq``
+            only by its first timestamp, last timestamp and length. They shouldn't be modified after that.
+            If the check fails, dataset is created in a usual way.
+
+        Raises
+        ------
+        ValueError:
+            if "array" storage is used and data can't be kept in it
+        ValueError:
+            if ``dtype`` isn't a floating dtype
         """
-        self.raw_df = self._prepare_df(df)
-        self.raw_df.index = pd.to_datetime(self.raw_df.index)
+        self.storage = DataStorage(storage)
+        self.dtype: Optional[np.dtype] = None
+        if dtype is not None:
+            self.dtype = np.dtype(dtype)
+            if self.dtype.kind != "f":
+                raise ValueError(f"Only floating dtypes are supported, {self.dtype} is given!")
+        self._df: pd.DataFrame
+        self._array_storage: Optional[ArrayStorage] = None
+        self._df_is_shared = False
+        self._slices_refs: List["weakref.ref[TSDataset]"] = []
+        self._timestamp_positions_cache: Optional[Tuple[pd.DatetimeIndex, np.ndarray]] = None
+        self.lazy_exog = lazy_exog
+        self._lazy_exog_features: List[str] = []
+        self._pending_features: List[pd.DataFrame] = []
+        self._defer_features_merge = False
+
         self.freq = freq
         self.df_exog = None
 
-        self.raw_df.index = pd.to_datetime(self.raw_df.index)
-
-        try:
-            inferred_freq = pd.infer_freq(self.raw_df.index)
-        except ValueError:
-            warnings.warn("TSDataset freq can't be inferred")
-            inferred_freq = None
-
-        if inferred_freq != self.freq:
-            warnings.warn(
-                f"You probably set wrong freq. Discovered freq in you data is {inferred_freq}, you set {self.freq}"
-            )
+        trusted = trusted and self._is_regular_index(df.index, freq=self.freq)
+        if trusted:
+            self.raw_df = self._set_index_freq(df, freq=self.freq)
+        else:
+            self.raw_df = self._prepare_df(df)
+            self.raw_df.index = pd.to_datetime(self.raw_df.index)
+            # inferring freq is redundant for the index with the same freq, if the freq can be inferred from it
+            index = self.raw_df.index
+            if len(index) < 3 or index.freq is None or index.freqstr != self.freq:
+                try:
+                    inferred_freq = pd.infer_freq(self.raw_df.index)
+                except ValueError:
+                    warnings.warn("TSDataset freq can't be inferred")
+                    inferred_freq = None
+
+                if inferred_freq != self.freq:
+                    warnings.warn(
+                        f"You probably set wrong freq. Discovered freq in you data is {inferred_freq}, "
+                        f"you set {self.freq}"
+                    )
 
-        self.raw_df = self.raw_df.asfreq(self.freq)
+                self.raw_df = self.raw_df.asfreq(self.freq)
+        self.raw_df = self._cast_to_dtype(self.raw_df)
 
-        self.df = self.raw_df.copy(deep=True)
+        # raw_df isn't modified inplace, so df shares the data with it until the first modification
+        self._set_stored_df(self.raw_df)
+        self._df_is_shared = True
 
         self.known_future = self._check_known_future(known_future, df_exog)
         self._regressors = copy(self.known_future)
 
         self.hierarchical_structure = hierarchical_structure
-        self.current_df_level: Optional[str] = self._get_dataframe_level(df=self.df)
+        self.current_df_level: Optional[str] = self._get_dataframe_level(df=self._df)
         self.current_df_exog_level: Optional[str] = None
 
         if df_exog is not None:
-            self.df_exog = df_exog.copy(deep=True)
-            self.df_exog.index = pd.to_datetime(self.df_exog.index)
+            if trusted and isinstance(df_exog.index, pd.DatetimeIndex):
+                # exogenous data isn't modified inplace, so it can be shared
+                self.df_exog = df_exog
+            else:
+                self.df_exog = df_exog.copy(deep=True)
+                self.df_exog.index = pd.to_datetime(self.df_exog.index)
+            self.df_exog = self._cast_to_dtype(self.df_exog)
             self.current_df_exog_level = self._get_dataframe_level(df=self.df_exog)
-            if self.current_df_level == self.current_df_exog_level:
-                self.df = self._merge_exog(self.df)
+            if self.current_df_level == self.current_df_exog_level and not self.lazy_exog:
+                self._set_stored_df(self._merge_exog(self._df))
 
         self._target_components_names: Tuple[str, ...] = tuple()
 
-        self.df = self.df.sort_index(axis=1, level=("segment", "feature"))
+        # sorting copies the whole dataframe, so it is skipped for already sorted columns
+        if not self._df.columns.is_monotonic_increasing:
+            self._set_stored_df(self._df.sort_index(axis=1, level=("segment", "feature")))
+
+        if self.df_exog is not None and self.current_df_level == self.current_df_exog_level and self.lazy_exog:
+            df_regressors = self.df_exog.loc[:, pd.IndexSlice[:, self.known_future]]
+            self._check_regressors(df=self._df, df_regressors=df_regressors)
+            stored_features = set(self._df.columns.get_level_values("feature"))
+            self._lazy_exog_features = [
+                feature
+                for feature in self.df_exog.columns.get_level_values("feature").unique()
+                if feature not in stored_features
+            ]
+
+        if self.storage is DataStorage.array:
+            self._array_storage = ArrayStorage.from_frame(
+                self._df, dtype=np.float64 if self.dtype is None else self.dtype
+            )
+            del self._df
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """Wide dataframe with the data of the dataset.
+
+        In case of "array" storage the dataframe is built on the first access
+        and becomes the main storage of the data, because it can be modified by the caller.
+        If the dataframe shares the data with another dataset, the data is copied on the first access.
+        Lazily attached exogenous features are joined into the dataframe on the first access.
+        """
+        if len(self._lazy_exog_features) > 0:
+            self._materialize_exog(features=self._lazy_exog_features)
+        return self._get_stored_df()
+
+    @df.setter
+    def df(self, value: pd.DataFrame):
+        self._set_stored_df(value)
+        self._lazy_exog_features = []
+        self._pending_features = []
+
+    def _get_stored_df(self, merge_pending: bool = True) -> pd.DataFrame:
+        """Get dataframe with the stored data of the dataset that is allowed to be modified.
+
+        If ``merge_pending`` is False, features added by the running transforms aren't merged into the result.
+        """
+        if merge_pending:
+            self._merge_pending_features()
+        if self._array_storage is not None:
+            # read-only or memory-mapped block is copied into memory: frames over the memory-mapped block are strided
+            # views that can't be passed to the workers of ``joblib`` correctly
+            values = self._array_storage.values
+            self._df = self._array_storage.to_frame(copy=isinstance(values, np.memmap) or not values.flags.writeable)
+            self._array_storage = None
+        elif self._df_is_shared or self._has_sharing_slices():
+            self._df = self._df.copy(deep=True)
+        self._df_is_shared = False
+        self._slices_refs = []
+        return self._df
+
+    def _has_sharing_slices(self) -> bool:
+        """Check if some of the slices made by :py:meth:`_slice_timestamps` still share the stored dataframe."""
+        for slice_ref in self._slices_refs:
+            ts_slice = slice_ref()
+            if ts_slice is not None and ts_slice._df_is_shared:
+                return True
+        return False
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get state of the dataset without the references to the slices, they can't be pickled."""
+        state = self.__dict__.copy()
+        state["_slices_refs"] = []
+        return state
+
+    def _set_stored_df(self, value: pd.DataFrame):
+        """Replace the stored dataframe keeping lazily attached exogenous features."""
+        self._df = self._cast_to_dtype(value)
+        self._array_storage = None
+        self._df_is_shared = False
+        self._slices_refs = []
+
+    def _get_stored_df_view(self, merge_pending: bool = True) -> pd.DataFrame:
+        """Get dataframe with the stored data of the dataset that isn't allowed to be modified.
+
+        In case of "array" storage the dataframe is built without converting the dataset into "pandas" storage.
+        Lazily attached exogenous features aren't included.
+        If ``merge_pending`` is False, features added by the running transforms aren't merged into the result.
+        """
+        if merge_pending:
+            self._merge_pending_features()
+        if self._array_storage is not None:
+            return self._array_storage.to_frame(copy=False, read_only=True)
+        return self._df
+
+    def _get_df_view(self) -> pd.DataFrame:
+        """Get dataframe with all the data of the dataset that isn't allowed to be modified.
+
+        Lazily attached exogenous features are joined over the timestamps of the dataset.
+        """
+        df = self._get_stored_df_view()
+        if len(self._lazy_exog_features) == 0:
+            return df
+        df_exog = self._get_exog_frame(features=self._lazy_exog_features)
+        return pd.concat((df, df_exog), axis=1).sort_index(axis=1, level=("segment", "feature"))
+
+    def _get_exog_columns(self, features: Sequence[str]) -> pd.MultiIndex:
+        """Get columns of ``df_exog`` with the given features of the segments of the dataset."""
+        columns = self.df_exog.columns  # type: ignore
+        segments_mask = columns.get_level_values("segment").isin(self.segments)
+        return columns[segments_mask & columns.get_level_values("feature").isin(features)]
+
+    def _get_exog_frame(self, features: Sequence[str]) -> pd.DataFrame:
+        """Get exogenous features of the segments of the dataset over the timestamps of the dataset."""
+        columns = self._get_exog_columns(features=features)
+        return self._cast_to_dtype(self.df_exog.reindex(index=self.index, columns=columns))  # type: ignore
+
+    def _materialize_exog(self, features: Sequence[str]):
+        """Move lazily attached exogenous features into the stored data."""
+        df_exog = self._get_exog_frame(features=features)
+        features_set = set(features)
+        self._lazy_exog_features = [feature for feature in self._lazy_exog_features if feature not in features_set]
+        if self._array_storage is None or not self._array_storage.add_features(df_exog):
+            df = pd.concat((self._get_stored_df_view(), df_exog), axis=1)
+            self._set_stored_df(df.sort_index(axis=1, level=("segment", "feature")))
+
+    def _get_pending_features(self) -> Set[str]:
+        """Get features added by the running transforms that aren't merged into the stored data yet."""
+        return {
+            feature
+            for df_pending in self._pending_features
+            for feature in df_pending.columns.get_level_values("feature").unique()
+        }
+
+    def _merge_pending_features(self):
+        """Merge features added by the running transforms into the stored data with one concatenation and sorting."""
+        pending_features = [df_pending for df_pending in self._pending_features if df_pending.shape[1] > 0]
+        self._pending_features = []
+        if len(pending_features) == 0:
+            return
+        df_update = pd.concat(pending_features, axis=1)
+        if self._array_storage is None or not self._array_storage.add_features(df_update):
+            df = pd.concat((self._get_stored_df_view(), df_update), axis=1)
+            self._set_stored_df(df.sort_index(axis=1))
+
+    def _run_transforms(self, transforms: Sequence["Transform"], fit: bool):
+        """Run transforms merging the features added by them into the stored data only once in the end.
+
+        While transforms are running, added features are kept aside and the transforms read them on demand,
+        features that are dropped by the following transforms are never merged.
+        Access to the whole data, e.g. to :py:attr:`df`, merges the features immediately.
+        """
+        self._defer_features_merge = True
+        try:
+            for transform in transforms:
+                tslogger.log(f"Transform {repr(transform)} is applied to dataset")
+                if fit:
+                    transform.fit_transform(self)
+                else:
+                    transform.transform(self)
+        finally:
+            self._defer_features_merge = False
+            self._merge_pending_features()
+
+    def _cast_to_dtype(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast floating columns of the dataframe to the dtype of the dataset, dataframe isn't copied if possible."""
+        if self.dtype is None:
+            return df
+        columns_to_cast = [
+            column
+            for column, column_dtype in df.dtypes.items()
+            if isinstance(column_dtype, np.dtype) and column_dtype.kind == "f" and column_dtype != self.dtype
+        ]
+        if len(columns_to_cast) == 0:
+            return df
+        if len(columns_to_cast) == len(df.columns):
+            return df.astype(self.dtype)
+        return df.astype({column: self.dtype for column in columns_to_cast})
 
     def _get_dataframe_level(self, df: pd.DataFrame) -> Optional[str]:
         """Return the level of the passed dataframe in hierarchical structure."""
@@ -188,43 +436,102 @@ class TSDataset:
     def transform(self, transforms: Sequence["Transform"]):
         """Apply given transform to the data."""
         self._check_endings(warning=True)
-        for transform in transforms:
-            tslogger.log(f"Transform {repr(transform)} is applied to dataset")
-            transform.transform(self)
+        self._run_transforms(transforms=transforms, fit=False)
 
     def fit_transform(self, transforms: Sequence["Transform"]):
         """Fit and apply given transforms to the data."""
         self._check_endings(warning=True)
-        for transform in transforms:
-            tslogger.log(f"Transform {repr(transform)} is applied to dataset")
-            transform.fit_transform(self)
+        self._run_transforms(transforms=transforms, fit=True)
 
     @staticmethod
     def _prepare_df(df: pd.DataFrame) -> pd.DataFrame:
         # cast segment to str type
         df_copy = df.copy(deep=True)
+        if all(isinstance(segment, str) for segment in df.columns.get_level_values("segment").unique()):
+            return df_copy
         columns_frame = df.columns.to_frame()
         columns_frame["segment"] = columns_frame["segment"].astype(str)
         df_copy.columns = pd.MultiIndex.from_frame(columns_frame)
         return df_copy
 
+    @staticmethod
+    def _is_regular_index(index: pd.Index, freq: str) -> bool:
+        """Check that index is sorted, unique and regular with the given freq.
+
+        Regularity is checked by the first and last timestamps and length of the index.
+        """
+        if not isinstance(index, pd.DatetimeIndex) or len(index) == 0:
+            return False
+        if not (index.is_monotonic_increasing and index.is_unique):
+            return False
+        offset = pd.tseries.frequencies.to_offset(freq)
+        if index.freq is not None:
+            return index.freq == offset
+        return index[0] + (len(index) - 1) * offset == index[-1]
+
+    @staticmethod
+    def _set_index_freq(df: pd.DataFrame, freq: str) -> pd.DataFrame:
+        """Set freq of the regular index without copying the data of the dataframe."""
+        if df.index.freq is not None:
+            return df
+        df = df.copy(deep=False)
+        df.index = pd.date_range(start=df.index[0], periods=len(df.index), freq=freq, name=df.index.name)
+        return df
+
     def __repr__(self):
-        return self.df.__repr__()
+        return self._get_df_view().__repr__()
 
     def _repr_html_(self):
-        return self.df._repr_html_()
+        return self._get_df_view()._repr_html_()
 
     def __getitem__(self, item):
+        df_view = self._get_df_view()
         if isinstance(item, slice) or isinstance(item, str):
-            df = self.df.loc[self.idx[item]]
+            df = df_view.loc[self.idx[item]]
         elif len(item) == 2 and item[0] is Ellipsis:
-            df = self.df.loc[self.idx[:], self.idx[:, item[1]]]
+            df = df_view.loc[self.idx[:], self.idx[:, item[1]]]
         elif len(item) == 2 and item[1] is Ellipsis:
-            df = self.df.loc[self.idx[item[0]]]
+            df = df_view.loc[self.idx[item[0]]]
         else:
-            df = self.df.loc[self.idx[item[0]], self.idx[item[1], item[2]]]
+            df = df_view.loc[self.idx[item[0]], self.idx[item[1], item[2]]]
         first_valid_idx = df.first_valid_index()
         df = df.loc[first_valid_idx:]
+        if self._array_storage is not None:
+            df = df.copy()
+        return df
+
+    @staticmethod
+    def _get_transforms_required_history(transforms: Sequence["Transform"]) -> Optional[int]:
+        """Get number of the previous timestamps required to apply the transforms one after another."""
+        required_history = 0
+        for transform in transforms:
+            transform_required_history = transform.required_history
+            if transform_required_history is None:
+                return None
+            required_history += transform_required_history
+        return required_history
+
+    def _extend_categories(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Extend categories of the categorical columns of ``df`` by the categories of the same columns of the dataset.
+
+        Categories of the features computed only on the tail of the dataset can miss the values from the history.
+        """
+        categorical_columns = [column for column, dtype in df.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)]
+        stored_columns = set(self.columns)
+        categorical_columns = [column for column in categorical_columns if column in stored_columns]
+        if len(categorical_columns) == 0:
+            return df
+
+        features = sorted({feature for _, feature in categorical_columns})
+        df_train = self.get_features_view(features=features)
+        for column in categorical_columns:
+            train_dtype = df_train[column].dtype
+            if not isinstance(train_dtype, pd.CategoricalDtype):
+                continue
+            categories = df[column].cat.categories
+            extended_categories = train_dtype.categories.union(categories)
+            if not extended_categories.equals(categories):
+                df[column] = df[column].cat.set_categories(extended_categories)
         return df
 
     def make_future(
@@ -234,6 +541,11 @@ class TSDataset:
 
         The result dataset doesn't contain quantiles and target components.
 
+        If all the transforms define :py:attr:`~etna.transforms.base.Transform.required_history`,
+        they are applied only to the last timestamps they need, otherwise they are applied to the whole history.
+        In the first case categories of the categorical features are extended by the categories
+        of the same features in the dataset, features missing in the dataset have only the categories seen in the tail.
+
         Parameters
         ----------
         future_steps:
@@ -275,17 +587,25 @@ class TSDataset:
         2021-07-04          33          38    NaN          73          78    NaN
         """
         self._check_endings(warning=True)
-        max_date_in_dataset = self.df.index.max()
+        max_date_in_dataset = self.index.max()
         future_dates = pd.date_range(
             start=max_date_in_dataset, periods=future_steps + 1, freq=self.freq, closed="right"
         )
 
-        new_index = self.raw_df.index.append(future_dates)
-        df = self.raw_df.reindex(new_index)
+        raw_df = self.raw_df
+        required_history = self._get_transforms_required_history(transforms=transforms)
+        if required_history is not None:
+            # transforms are applied only to the history required to compute the returned timestamps
+            raw_df = raw_df.iloc[max(len(raw_df) - required_history - tail_steps, 0) :]
+
+        new_index = raw_df.index.append(future_dates)
+        df = raw_df.reindex(new_index)
         df.index.name = "timestamp"
 
-        if self.df_exog is not None and self.current_df_level == self.current_df_exog_level:
-            df = self._merge_exog(df)
+        is_exog_merged = self.df_exog is not None and self.current_df_level == self.current_df_exog_level
+        if is_exog_merged:
+            if not self.lazy_exog:
+                df = self._merge_exog(df)
 
             # check if we have enough values in regressors
             if self.regressors:
@@ -306,27 +626,51 @@ class TSDataset:
             df = df.drop(columns=list(self.target_quantiles_names), level="feature")
 
         # Here only df is required, other metadata is not necessary to build the dataset
-        ts = TSDataset(df=df, freq=self.freq)
+        ts = TSDataset(df=df, freq=self.freq, storage=self.storage, dtype=self.dtype)
+        if is_exog_merged and self.lazy_exog:
+            # exogenous features are joined only when they are requested by the transforms
+            stored_features = set(df.columns.get_level_values("feature"))
+            ts.df_exog = self.df_exog
+            ts._lazy_exog_features = [
+                feature
+                for feature in self.df_exog.columns.get_level_values("feature").unique()  # type: ignore
+                if feature not in stored_features
+            ]
         for transform in transforms:
             tslogger.log(f"Transform {repr(transform)} is applied to dataset")
             transform.transform(ts)
+        if len(ts._lazy_exog_features) > 0:
+            # remaining exogenous features are joined only over the returned timestamps
+            ts = ts.tsdataset_idx_slice(start_idx=-(future_steps + tail_steps))
         df = ts.to_pandas()
 
         future_dataset = df.tail(future_steps + tail_steps).copy(deep=True)
+        if required_history is not None:
+            future_dataset = self._extend_categories(future_dataset)
 
         future_dataset = future_dataset.sort_index(axis=1, level=(0, 1))
-        future_ts = TSDataset(df=future_dataset, freq=self.freq, hierarchical_structure=self.hierarchical_structure)
+        future_ts = TSDataset(
+            df=future_dataset,
+            freq=self.freq,
+            hierarchical_structure=self.hierarchical_structure,
+            storage=self.storage,
+            dtype=self.dtype,
+            lazy_exog=self.lazy_exog,
+        )
 
         # can't put known_future into constructor, _check_known_future fails with df_exog=None
         future_ts.known_future = deepcopy(self.known_future)
         future_ts._regressors = deepcopy(self.regressors)
         if self.df_exog is not None:
-            future_ts.df_exog = self.df_exog.copy(deep=True)
+            # exogenous data isn't modified inplace, so it can be shared in lazy mode
+            future_ts.df_exog = self.df_exog if self.lazy_exog else self.df_exog.copy(deep=True)
         return future_ts
 
     def tsdataset_idx_slice(self, start_idx: Optional[int] = None, end_idx: Optional[int] = None) -> "TSDataset":
         """Return new TSDataset with integer-location based indexing.
 
+        Slice shares the data with this dataset, the data is copied by the dataset that modifies it first.
+
         Parameters
         ----------
         start_idx:
@@ -339,16 +683,47 @@ class TSDataset:
         :
             TSDataset based on indexing slice.
         """
-        df_slice = self.df.iloc[start_idx:end_idx].copy(deep=True)
-        tsdataset_slice = TSDataset(df=df_slice, freq=self.freq)
-        # can't put known_future into constructor, _check_known_future fails with df_exog=None
-        tsdataset_slice.known_future = deepcopy(self.known_future)
-        tsdataset_slice._regressors = deepcopy(self.regressors)
-        if self.df_exog is not None:
-            tsdataset_slice.df_exog = self.df_exog.copy(deep=True)
-        tsdataset_slice._target_components_names = deepcopy(self._target_components_names)
+        tsdataset_slice = self._slice_timestamps(start=start_idx, stop=end_idx)
+        tsdataset_slice.raw_df = tsdataset_slice._get_stored_df_view()
         return tsdataset_slice
 
+    def _slice_timestamps(self, start: Optional[int] = None, stop: Optional[int] = None) -> "TSDataset":
+        """Get dataset with the slice of timestamps that shares the data with this dataset.
+
+        Data isn't copied on slicing, it is copied by the dataset that modifies it first.
+        This dataset copies the data only if the slice still shares it, so the slices that are already modified
+        or deleted don't cause the copies.
+        ``raw_df`` of the slice isn't set.
+        """
+        self._merge_pending_features()
+        ts = self.__class__.__new__(self.__class__)
+        ts.storage = self.storage
+        ts.dtype = self.dtype
+        ts.lazy_exog = self.lazy_exog
+        ts._lazy_exog_features = list(self._lazy_exog_features)
+        ts._pending_features = []
+        ts._defer_features_merge = False
+        ts.freq = self.freq
+        ts._array_storage = None
+        ts._df_is_shared = False
+        ts._slices_refs = []
+        ts._timestamp_positions_cache = None
+        if self._array_storage is not None:
+            ts._array_storage = self._array_storage.slice_timestamps(start=start, stop=stop)
+        else:
+            ts._df = self._df.iloc[start:stop]
+            ts._df_is_shared = True
+            self._slices_refs = [slice_ref for slice_ref in self._slices_refs if slice_ref() is not None]
+            self._slices_refs.append(weakref.ref(ts))
+        ts.df_exog = self.df_exog
+        ts.known_future = deepcopy(self.known_future)
+        ts._regressors = deepcopy(self.regressors)
+        ts._target_components_names = deepcopy(self._target_components_names)
+        ts.hierarchical_structure = self.hierarchical_structure
+        ts.current_df_level = self.current_df_level
+        ts.current_df_exog_level = self.current_df_exog_level
+        return ts
+
     @staticmethod
     def _check_known_future(
         known_future: Union[Literal["all"], Sequence], df_exog: Optional[pd.DataFrame]
@@ -414,8 +789,8 @@ class TSDataset:
 
     def _check_endings(self, warning=False):
         """Check that all targets ends at the same timestamp."""
-        max_index = self.df.index.max()
-        if np.any(pd.isna(self.df.loc[max_index, pd.IndexSlice[:, "target"]])):
+        max_index = self.index.max()
+        if np.any(pd.isna(self._get_stored_df_view(merge_pending=False).loc[max_index, pd.IndexSlice[:, "target"]])):
             if warning:
                 warnings.warn(
                     "Segments contains NaNs in the last timestamps."
@@ -476,7 +851,9 @@ class TSDataset:
         >>> ts.segments
         ['segment_0', 'segment_1']
         """
-        return self.df.columns.get_level_values("segment").unique().tolist()
+        if self._array_storage is not None:
+            return self._array_storage.segments
+        return self._get_stored_df_view(merge_pending=False).columns.get_level_values("segment").unique().tolist()
 
     @property
     def regressors(self) -> List[str]:
@@ -553,8 +930,8 @@ class TSDataset:
             k = len(segments)
         columns_num = min(2, k)
         rows_num = math.ceil(k / columns_num)
-        start = self.df.index.min() if start is None else pd.Timestamp(start)
-        end = self.df.index.max() if end is None else pd.Timestamp(end)
+        start = self.index.min() if start is None else pd.Timestamp(start)
+        end = self.index.max() if end is None else pd.Timestamp(end)
 
         figsize = (figsize[0] * columns_num, figsize[1] * rows_num)
         _, ax = plt.subplots(rows_num, columns_num, figsize=figsize, squeeze=False)
@@ -609,32 +986,62 @@ class TSDataset:
         3 2021-06-04  segment_0    1.0
         4 2021-06-05  segment_0    1.0
         """
+        return TSDataset._flatten(df, features=features, segment_codes=False)
+
+    @staticmethod
+    def _flatten(
+        df: pd.DataFrame, features: Union[Literal["all"], Sequence[str]] = "all", segment_codes: bool = False
+    ) -> pd.DataFrame:
+        """Flatten dataframe in ETNA format.
+
+        If ``segment_codes`` is True, "segment" column contains int32 codes of the segments,
+        i.e. their positions in ``df.columns.get_level_values("segment").unique()``, instead of their names.
+        """
         segments = df.columns.get_level_values("segment").unique()
-        dtypes = df.dtypes
-        category_columns = dtypes[dtypes == "category"].index.get_level_values(1).unique()
         if isinstance(features, str):
             if features != "all":
                 raise ValueError("The only possible literal is 'all'")
         else:
-            df = df.loc[:, pd.IndexSlice[segments, features]].copy()
+            df = df.loc[:, pd.IndexSlice[segments, features]]
+        dtypes = df.dtypes
         columns = df.columns.get_level_values("feature").unique()
+        num_timestamps, num_segments, num_columns = len(df.index), len(segments), len(columns)
+        # positions[i, j] is the position of the j-th feature of the i-th segment in df
+        positions = df.columns.get_indexer(pd.MultiIndex.from_product([segments, columns]))
+        positions = positions.reshape(num_segments, num_columns)
 
         # flatten dataframe
         df_dict: Dict[str, Any] = {}
-        df_dict["timestamp"] = np.tile(df.index, len(segments))
-        df_dict["segment"] = np.repeat(segments, len(df.index))
+        df_dict["timestamp"] = np.tile(df.index, num_segments)
+        if segment_codes:
+            df_dict["segment"] = np.repeat(np.arange(num_segments, dtype=np.int32), num_timestamps)
+        else:
+            df_dict["segment"] = np.repeat(segments, num_timestamps)
         if "target" in columns:
             # set this value to lock position of key "target" in output dataframe columns
             # None is a placeholder, actual column value will be assigned in the following cycle
             df_dict["target"] = None
-        for column in columns:
-            df_cur = df.loc[:, pd.IndexSlice[:, column]]
-            if column in category_columns:
-                df_dict[column] = pd.api.types.union_categoricals([df_cur[col] for col in df_cur.columns])
-            else:
+
+        if len(set(dtypes)) == 1 and isinstance(dtypes.iloc[0], np.dtype) and (positions >= 0).all():
+            # fast path: the whole dataframe is a single numpy block, stack it with one reshape
+            values = df.values[:, positions.ravel()].reshape(num_timestamps, num_segments, num_columns)
+            values = values.transpose(1, 0, 2).reshape(num_segments * num_timestamps, num_columns)
+            for column_idx, column in enumerate(columns):
+                df_dict[column] = values[:, column_idx]
+            return pd.DataFrame(df_dict)
+
+        for column_idx, column in enumerate(columns):
+            column_positions = positions[:, column_idx]
+            column_positions = column_positions[column_positions >= 0]
+            df_cur = df.iloc[:, column_positions]
+            if isinstance(df_cur.dtypes.iloc[0], pd.CategoricalDtype):
+                df_dict[column] = pd.api.types.union_categoricals([df_cur.iloc[:, i] for i in range(df_cur.shape[1])])
+            elif all(isinstance(dtype, np.dtype) for dtype in df_cur.dtypes):
                 stacked = df_cur.values.T.ravel()
-                # creating series is necessary for dtypes like "Int64", "boolean", otherwise they will be objects
-                df_dict[column] = pd.Series(stacked, dtype=df_cur.dtypes[0])
+                df_dict[column] = pd.Series(stacked, dtype=df_cur.dtypes.iloc[0])
+            else:
+                # concatenation keeps dtypes like "Int64", "boolean" without conversion into objects
+                df_dict[column] = pd.concat([df_cur.iloc[:, i] for i in range(df_cur.shape[1])], ignore_index=True)
         df_flat = pd.DataFrame(df_dict)
 
         return df_flat
@@ -694,11 +1101,97 @@ class TSDataset:
         if not flatten:
             if isinstance(features, str):
                 if features == "all":
-                    return self.df.copy()
+                    return self._get_df_view().copy()
                 raise ValueError("The only possible literal is 'all'")
-            segments = self.columns.get_level_values("segment").unique().tolist()
-            return self.df.loc[:, self.idx[segments, features]].copy()
-        return self.to_flatten(self.df, features=features)
+            df_with_pending = self._get_features_with_pending(features=features)
+            if df_with_pending is not None:
+                return df_with_pending
+            df_with_exog = self._get_features_with_exog(features=features)
+            if df_with_exog is not None:
+                return df_with_exog
+            if self._array_storage is not None:
+                return self._array_storage.to_frame(features=features)
+            # selection with lists of labels already makes a copy
+            return self._get_stored_df_view(merge_pending=False).loc[:, self.idx[self.segments, features]]
+        return self.to_flatten(self._get_df_view(), features=features)
+
+    def _to_flatten_coded(
+        self, features: Union[Literal["all"], Sequence[str]] = "all"
+    ) -> Tuple[pd.DataFrame, pd.Index]:
+        """Get flattened dataframe with int32 codes of the segments in "segment" column.
+
+        Codes are positions of the segments in the returned index, names should be restored by it
+        only when the result leaves the library, e.g. with ``segments.take(codes)``.
+        """
+        df = self._get_df_view()
+        segments = df.columns.get_level_values("segment").unique()
+        return self._flatten(df, features=features, segment_codes=True), segments
+
+    def get_features_view(self, features: Union[Literal["all"], Sequence[str]] = "all") -> pd.DataFrame:
+        """Get read-only projection of the dataset on the given features in a wide format.
+
+        Unlike :py:meth:`to_pandas` this method doesn't copy the data if it is possible,
+        so the result shouldn't be modified. Use it for the computations that only read the data.
+
+        Parameters
+        ----------
+        features:
+            List of features to return.
+            If "all", return all the features in the dataset.
+
+        Returns
+        -------
+        :
+            dataframe in ETNA wide format that can share memory with the dataset
+
+        Raises
+        ------
+        ValueError:
+            If the incorrect literal is given as ``features``
+        """
+        if isinstance(features, str):
+            if features == "all":
+                return self._get_df_view()
+            raise ValueError("The only possible literal is 'all'")
+        df_with_pending = self._get_features_with_pending(features=features)
+        if df_with_pending is not None:
+            return df_with_pending
+        df_with_exog = self._get_features_with_exog(features=features)
+        if df_with_exog is not None:
+            return df_with_exog
+        if self._array_storage is not None:
+            return self._array_storage.to_frame(features=features, copy=False, read_only=True)
+        return self._get_stored_df_view(merge_pending=False).loc[:, self.idx[self.segments, features]]
+
+    def _get_features_with_pending(self, features: Sequence[str]) -> Optional[pd.DataFrame]:
+        """Get features joining the requested features added by the running transforms, None if none is requested."""
+        pending_features = self._get_pending_features()
+        requested_pending_features = {feature for feature in features if feature in pending_features}
+        if len(requested_pending_features) == 0:
+            return None
+        dfs = []
+        for df_pending in self._pending_features:
+            df_pending_features = df_pending.columns.get_level_values("feature").unique()
+            cur_features = [feature for feature in df_pending_features if feature in requested_pending_features]
+            if len(cur_features) > 0:
+                dfs.append(df_pending.loc[:, self.idx[:, cur_features]])
+        other_features = [feature for feature in features if feature not in pending_features]
+        if len(other_features) > 0:
+            dfs.append(self.to_pandas(features=other_features))
+        return pd.concat(dfs, axis=1).sort_index(axis=1, level=("segment", "feature"))
+
+    def _get_features_with_exog(self, features: Sequence[str]) -> Optional[pd.DataFrame]:
+        """Get features joining the requested lazily attached exogenous features, None if none of them is requested."""
+        lazy_exog_features = set(self._lazy_exog_features)
+        exog_features = [feature for feature in features if feature in lazy_exog_features]
+        if len(exog_features) == 0:
+            return None
+        df_exog = self._get_exog_frame(features=exog_features)
+        stored_features = [feature for feature in features if feature not in lazy_exog_features]
+        if len(stored_features) == 0:
+            return df_exog.sort_index(axis=1, level=("segment", "feature"))
+        df = self.to_pandas(features=stored_features)
+        return pd.concat((df, df_exog), axis=1).sort_index(axis=1, level=("segment", "feature"))
 
     @staticmethod
     def to_dataset(df: pd.DataFrame) -> pd.DataFrame:
@@ -755,17 +1248,7 @@ class TSDataset:
         2021-01-04           3           8
         2021-01-05           4           9
         """
-        df_copy = df.copy(deep=True)
-        df_copy["timestamp"] = pd.to_datetime(df_copy["timestamp"])
-        df_copy["segment"] = df_copy["segment"].astype(str)
-        feature_columns = df_copy.columns.tolist()
-        feature_columns.remove("timestamp")
-        feature_columns.remove("segment")
-        df_copy = df_copy.pivot(index="timestamp", columns="segment")
-        df_copy = df_copy.reorder_levels([1, 0], axis=1)
-        df_copy.columns.names = ["segment", "feature"]
-        df_copy = df_copy.sort_index(axis=1, level=(0, 1))
-        return df_copy
+        return _long_to_wide(df)
 
     @staticmethod
     def _hierarchical_structure_from_level_columns(
@@ -863,23 +1346,23 @@ class TSDataset:
 
         if test_end is None:
             if test_start is not None and test_size is not None:
-                test_start_idx = self.df.index.get_loc(test_start)
-                if test_start_idx + test_size > len(self.df.index):
+                test_start_idx = self.get_timestamp_position(test_start)
+                if test_start_idx + test_size > len(self.index):
                     raise ValueError(
-                        f"test_size is {test_size}, but only {len(self.df.index) - test_start_idx} available with your test_start"
+                        f"test_size is {test_size}, but only {len(self.index) - test_start_idx} available with your test_start"
                     )
-                test_end_defined = self.df.index[test_start_idx + test_size]
+                test_end_defined = self.index[test_start_idx + test_size]
             elif test_size is not None and train_end is not None:
-                test_start_idx = self.df.index.get_loc(train_end)
-                test_start = self.df.index[test_start_idx + 1]
-                test_end_defined = self.df.index[test_start_idx + test_size]
+                test_start_idx = self.get_timestamp_position(train_end)
+                test_start = self.index[test_start_idx + 1]
+                test_end_defined = self.index[test_start_idx + test_size]
             else:
-                test_end_defined = self.df.index.max()
+                test_end_defined = self.index.max()
         else:
             test_end_defined = test_end
 
         if train_start is None:
-            train_start_defined = self.df.index.min()
+            train_start_defined = self.index.min()
         else:
             train_start_defined = train_start
 
@@ -888,26 +1371,26 @@ class TSDataset:
 
         if test_size is None:
             if train_end is None:
-                test_start_idx = self.df.index.get_loc(test_start)
-                train_end_defined = self.df.index[test_start_idx - 1]
+                test_start_idx = self.get_timestamp_position(test_start)
+                train_end_defined = self.index[test_start_idx - 1]
             else:
                 train_end_defined = train_end
 
             if test_start is None:
-                train_end_idx = self.df.index.get_loc(train_end)
-                test_start_defined = self.df.index[train_end_idx + 1]
+                train_end_idx = self.get_timestamp_position(train_end)
+                test_start_defined = self.index[train_end_idx + 1]
             else:
                 test_start_defined = test_start
         else:
             if test_start is None:
-                test_start_idx = self.df.index.get_loc(test_end_defined)
-                test_start_defined = self.df.index[test_start_idx - test_size + 1]
+                test_start_idx = self.get_timestamp_position(test_end_defined)
+                test_start_defined = self.index[test_start_idx - test_size + 1]
             else:
                 test_start_defined = test_start
 
             if train_end is None:
-                test_start_idx = self.df.index.get_loc(test_start_defined)
-                train_end_defined = self.df.index[test_start_idx - 1]
+                test_start_idx = self.get_timestamp_position(test_start_defined)
+                train_end_defined = self.index[test_start_idx - 1]
             else:
                 train_end_defined = train_end
 
@@ -928,6 +1411,9 @@ class TSDataset:
 
         In case of inconsistencies between ``test_size`` and (``test_start``, ``test_end``), ``test_size`` is ignored
 
+        If the dataset has no features except the ones from ``raw_df`` and ``df_exog``,
+        generated datasets share the data with this dataset, the data is copied by the dataset that modifies it first.
+
         Parameters
         ----------
         train_start:
@@ -980,38 +1466,99 @@ class TSDataset:
             train_start, train_end, test_start, test_end, test_size
         )
 
-        if pd.Timestamp(test_end_defined) > self.df.index.max():
-            warnings.warn(f"Max timestamp in df is {self.df.index.max()}.")
-        if pd.Timestamp(train_start_defined) < self.df.index.min():
-            warnings.warn(f"Min timestamp in df is {self.df.index.min()}.")
+        if pd.Timestamp(test_end_defined) > self.index.max():
+            warnings.warn(f"Max timestamp in df is {self.index.max()}.")
+        if pd.Timestamp(train_start_defined) < self.index.min():
+            warnings.warn(f"Min timestamp in df is {self.index.min()}.")
 
-        train_df = self.df[train_start_defined:train_end_defined][self.raw_df.columns]  # type: ignore
         train_raw_df = self.raw_df[train_start_defined:train_end_defined]  # type: ignore
+        test_raw_df = self.raw_df[train_start_defined:test_end_defined]  # type: ignore
+
+        # datasets without the features added after the creation share the data with this dataset
+        expected_columns = set(self.raw_df.columns)
+        if self.df_exog is not None and self.current_df_level == self.current_df_exog_level:
+            expected_columns |= set(self.df_exog.columns)
+        if expected_columns == set(self.columns):
+            train_slice = self.index.slice_indexer(train_start_defined, train_end_defined)
+            train = self._slice_timestamps(start=train_slice.start, stop=train_slice.stop)
+            train.raw_df = train_raw_df
+            test_slice = self.index.slice_indexer(test_start_defined, test_end_defined)
+            test = self._slice_timestamps(start=test_slice.start, stop=test_slice.stop)
+            test.raw_df = test_raw_df
+            return train, test
+
+        df_view = self._get_stored_df_view()
+        train_df = df_view[train_start_defined:train_end_defined][self.raw_df.columns]  # type: ignore
         train = TSDataset(
             df=train_df,
             df_exog=self.df_exog,
             freq=self.freq,
             known_future=self.known_future,
             hierarchical_structure=self.hierarchical_structure,
+            storage=self.storage,
+            dtype=self.dtype,
+            lazy_exog=self.lazy_exog,
         )
         train.raw_df = train_raw_df
         train._regressors = deepcopy(self.regressors)
         train._target_components_names = deepcopy(self.target_components_names)
 
-        test_df = self.df[test_start_defined:test_end_defined][self.raw_df.columns]  # type: ignore
-        test_raw_df = self.raw_df[train_start_defined:test_end_defined]  # type: ignore
+        test_df = df_view[test_start_defined:test_end_defined][self.raw_df.columns]  # type: ignore
         test = TSDataset(
             df=test_df,
             df_exog=self.df_exog,
             freq=self.freq,
             known_future=self.known_future,
             hierarchical_structure=self.hierarchical_structure,
+            storage=self.storage,
+            dtype=self.dtype,
+            lazy_exog=self.lazy_exog,
         )
         test.raw_df = test_raw_df
         test._regressors = deepcopy(self.regressors)
         test._target_components_names = deepcopy(self.target_components_names)
         return train, test
 
+    def select_segments(self, segments: Sequence[str]) -> "TSDataset":
+        """Return new TSDataset with the given segments.
+
+        All the features of the segments are kept. Hierarchical structure isn't kept,
+        because the segments can be only a part of the hierarchical level.
+
+        Parameters
+        ----------
+        segments:
+            segments to select
+
+        Returns
+        -------
+        :
+            TSDataset with the given segments
+
+        Raises
+        ------
+        ValueError:
+            if some of the segments aren't present in the dataset
+        """
+        unknown_segments = set(segments) - set(self.segments)
+        if len(unknown_segments) > 0:
+            raise ValueError(f"Segments {sorted(unknown_segments)} aren't present in the dataset!")
+
+        df_view = self._get_stored_df_view()
+        df = df_view.loc[:, df_view.columns.get_level_values("segment").isin(segments)]
+        ts = TSDataset(
+            df=df, freq=self.freq, storage=self.storage, dtype=self.dtype, lazy_exog=self.lazy_exog, trusted=True
+        )
+        ts.raw_df = self.raw_df.loc[:, self.raw_df.columns.get_level_values("segment").isin(segments)]
+        ts.known_future = deepcopy(self.known_future)
+        ts._regressors = deepcopy(self.regressors)
+        ts._target_components_names = deepcopy(self._target_components_names)
+        # exogenous data from the other hierarchical level can't be used without the hierarchy
+        if self.df_exog is not None and self.current_df_level == self.current_df_exog_level:
+            ts.df_exog = self.df_exog.loc[:, self.df_exog.columns.get_level_values("segment").isin(segments)]
+            ts._lazy_exog_features = list(self._lazy_exog_features)
+        return ts
+
     def update_columns_from_pandas(self, df_update: pd.DataFrame):
         """Update the existing columns in the dataset with the new values from pandas dataframe.
 
@@ -1025,9 +1572,15 @@ class TSDataset:
             Dataframe with new values in wide ETNA format.
         """
         columns_to_update = sorted(set(df_update.columns.get_level_values("feature")))
-        self.df.loc[:, self.idx[self.segments, columns_to_update]] = df_update.loc[
-            : self.df.index.max(), self.idx[self.segments, columns_to_update]
-        ]
+        if len(set(columns_to_update) & self._get_pending_features()) > 0:
+            self._merge_pending_features()
+        exog_features_to_update = set(columns_to_update) & set(self._lazy_exog_features)
+        if len(exog_features_to_update) > 0:
+            self._materialize_exog(features=sorted(exog_features_to_update))
+        df_update = self._cast_to_dtype(df_update.loc[: self.index.max(), self.idx[self.segments, columns_to_update]])
+        if self._array_storage is not None and self._array_storage.set_features(df_update):
+            return
+        self._get_stored_df(merge_pending=False).loc[:, self.idx[self.segments, columns_to_update]] = df_update
 
     def add_columns_from_pandas(
         self, df_update: pd.DataFrame, update_exog: bool = False, regressors: Optional[List[str]] = None
@@ -1046,7 +1599,13 @@ class TSDataset:
         regressors:
             List of regressors in the passed dataframe.
         """
-        self.df = pd.concat((self.df, df_update[: self.df.index.max()]), axis=1).sort_index(axis=1)
+        df_update = self._cast_to_dtype(df_update)
+        df_update_cropped = df_update[: self.index.max()]
+        if self._defer_features_merge:
+            self._pending_features.append(df_update_cropped)
+        elif self._array_storage is None or not self._array_storage.add_features(df_update_cropped):
+            df = pd.concat((self._get_stored_df_view(), df_update_cropped), axis=1)
+            self._set_stored_df(df.sort_index(axis=1))
         if update_exog:
             if self.df_exog is None:
                 self.df_exog = df_update
@@ -1055,6 +1614,74 @@ class TSDataset:
         if regressors is not None:
             self._regressors = list(set(self._regressors) | set(regressors))
 
+    def append(self, df_new: pd.DataFrame, df_exog_new: Optional[pd.DataFrame] = None):
+        """Append new observations to the end of the dataset inplace.
+
+        Only the new rows are processed: their frequency is checked, they are merged with the exogenous data
+        and written after the last timestamp of the dataset. In case of "array" storage the block is extended
+        with a spare capacity, so the daily appends don't copy the whole history.
+
+        Features that aren't present in ``df_new`` and ``df_exog`` are set to NaN at the new timestamps.
+
+        Parameters
+        ----------
+        df_new:
+            Dataframe in ETNA wide format with the new observations, it should have the same columns
+            as the dataframe the dataset was created from.
+        df_exog_new:
+            Dataframe in ETNA wide format with the new exogenous data, it should have the same columns as ``df_exog``.
+            Exogenous data starting from the first timestamp of ``df_exog_new`` is replaced with it.
+
+        Raises
+        ------
+        ValueError:
+            If columns of ``df_new`` don't match the columns of the dataset
+        ValueError:
+            If ``df_new`` doesn't start after the last timestamp of the dataset
+        ValueError:
+            If timestamps of ``df_new`` don't match the frequency of the dataset
+        ValueError:
+            If ``df_exog_new`` is given, but the dataset doesn't have exogenous data
+        ValueError:
+            If columns of ``df_exog_new`` don't match the columns of ``df_exog``
+        """
+        self._merge_pending_features()
+        df_new = self._prepare_df(df_new)
+        df_new.index = pd.to_datetime(df_new.index)
+        if set(df_new.columns) != set(self.raw_df.columns):
+            raise ValueError("Columns of df_new should match the columns of the dataset!")
+
+        last_timestamp = self.index.max()
+        if df_new.index.min() <= last_timestamp:
+            raise ValueError(f"New observations should start after the last timestamp of the dataset {last_timestamp}!")
+        new_index = pd.date_range(start=last_timestamp, end=df_new.index.max(), freq=self.freq)[1:]
+        if not df_new.index.isin(new_index).all():
+            raise ValueError(f"Timestamps of df_new don't match the frequency of the dataset {self.freq}!")
+        df_new = self._cast_to_dtype(df_new.reindex(index=new_index, columns=self.raw_df.columns))
+        df_new.index.name = self.raw_df.index.name
+
+        if df_exog_new is not None:
+            if self.df_exog is None:
+                raise ValueError("Dataset doesn't have exogenous data to append to!")
+            df_exog_new = self._cast_to_dtype(self._prepare_df(df_exog_new))
+            df_exog_new.index = pd.to_datetime(df_exog_new.index)
+            if set(df_exog_new.columns) != set(self.df_exog.columns):
+                raise ValueError("Columns of df_exog_new should match the columns of df_exog!")
+            df_exog_old = self.df_exog[self.df_exog.index < df_exog_new.index.min()]
+            self.df_exog = pd.concat((df_exog_old, df_exog_new[self.df_exog.columns]))
+
+        self.raw_df = pd.concat((self.raw_df, df_new))
+
+        df_rows = df_new
+        if self.df_exog is not None and self.current_df_level == self.current_df_exog_level:
+            df_rows = pd.concat((df_rows, self.df_exog.reindex(new_index)), axis=1)
+        if len(self._lazy_exog_features) > 0:
+            # lazily attached features are joined over the new timestamps on demand
+            df_rows = df_rows.loc[:, ~df_rows.columns.get_level_values("feature").isin(self._lazy_exog_features)]
+        if self._array_storage is None or not self._array_storage.append_timestamps(df_rows):
+            df_stored = self._get_stored_df_view()
+            self._set_stored_df(pd.concat((df_stored, df_rows.reindex(columns=df_stored.columns))))
+
     def drop_features(self, features: List[str], drop_from_exog: bool = False):
         """Drop columns with features from the dataset.
 
@@ -1077,7 +1704,23 @@ class TSDataset:
                 "Target components can't be dropped from the dataset using this method! Use `drop_target_components` method!"
             )
 
-        dfs = [("df", self.df)]
+        lazy_features_to_remove = set(self._lazy_exog_features) & set(features)
+        self._lazy_exog_features = [
+            feature for feature in self._lazy_exog_features if feature not in lazy_features_to_remove
+        ]
+
+        # features added by the running transforms are dropped before being merged into the stored data
+        pending_features_to_remove = self._get_pending_features() & set(features)
+        if len(pending_features_to_remove) > 0:
+            self._pending_features = [
+                df_pending.drop(
+                    columns=list(set(df_pending.columns.get_level_values("feature")) & pending_features_to_remove),
+                    level="feature",
+                )
+                for df_pending in self._pending_features
+            ]
+
+        dfs = [("df", self._get_stored_df_view(merge_pending=False))]
         if drop_from_exog:
             dfs.append(("df_exog", self.df_exog))
 
@@ -1085,10 +1728,18 @@ class TSDataset:
             columns_in_df = df.columns.get_level_values("feature")
             columns_to_remove = list(set(columns_in_df) & set(features))
             unknown_columns = set(features) - set(columns_to_remove)
+            if name == "df":
+                unknown_columns -= lazy_features_to_remove | pending_features_to_remove
             if len(unknown_columns) > 0:
                 warnings.warn(f"Features {unknown_columns} are not present in {name}!")
             if len(columns_to_remove) > 0:
-                df.drop(columns=columns_to_remove, level="feature", inplace=True)
+                # dataframes can be shared with the slices of the dataset, so they aren't modified inplace
+                if name == "df_exog":
+                    self.df_exog = df.drop(columns=columns_to_remove, level="feature")
+                elif self._array_storage is not None:
+                    self._array_storage.drop_features(columns_to_remove)
+                else:
+                    self._set_stored_df(df.drop(columns=columns_to_remove, level="feature"))
         self._regressors = list(set(self._regressors) - set(features))
 
     @property
@@ -1100,7 +1751,44 @@ class TSDataset:
         pd.core.indexes.datetimes.DatetimeIndex
             timestamp index of TSDataset
         """
-        return self.df.index
+        if self._array_storage is not None:
+            return self._array_storage.index
+        return self._get_stored_df_view(merge_pending=False).index
+
+    def _get_timestamps_ns(self) -> np.ndarray:
+        """Get timestamps of the index as int64 nanoseconds, the array is cached until the index is changed."""
+        index = self.index
+        if self._timestamp_positions_cache is None or self._timestamp_positions_cache[0] is not index:
+            timestamps_ns = index.values.astype("datetime64[ns]").view(np.int64)
+            self._timestamp_positions_cache = (index, timestamps_ns)
+        return self._timestamp_positions_cache[1]
+
+    def get_timestamp_position(self, timestamp: TTimestamp) -> int:
+        """Get integer position of the timestamp in the index of the dataset.
+
+        Position is found by binary search over the cached int64 representation of the index.
+
+        Parameters
+        ----------
+        timestamp:
+            Timestamp to find.
+
+        Returns
+        -------
+        :
+            Position of the timestamp in :py:attr:`index`.
+
+        Raises
+        ------
+        KeyError:
+            If timestamp is not present in the dataset
+        """
+        timestamps_ns = self._get_timestamps_ns()
+        timestamp_ns = pd.Timestamp(timestamp).value
+        position = int(np.searchsorted(timestamps_ns, timestamp_ns))
+        if position == len(timestamps_ns) or timestamps_ns[position] != timestamp_ns:
+            raise KeyError(f"Timestamp {timestamp} is not present in the dataset!")
+        return position
 
     def level_names(self) -> Optional[List[str]]:
         """Return names of the levels in the hierarchical structure."""
@@ -1164,6 +1852,9 @@ class TSDataset:
             df_exog=self.df_exog,
             known_future=self.known_future,
             hierarchical_structure=self.hierarchical_structure,
+            storage=self.storage,
+            dtype=self.dtype,
+            lazy_exog=self.lazy_exog,
         )
 
         if len(self.target_components_names) > 0:
@@ -1203,9 +1894,12 @@ class TSDataset:
             raise ValueError("Components don't sum up to target!")
 
         self._target_components_names = tuple(components_names)
-        self.df = (
-            pd.concat((self.df, target_components_df), axis=1)
-            .loc[self.df.index]
+        target_components_df = self._cast_to_dtype(target_components_df)
+        if self._array_storage is not None and self._array_storage.add_features(target_components_df):
+            return
+        self._set_stored_df(
+            pd.concat((self._get_stored_df_view(), target_components_df), axis=1)
+            .loc[self.index]
             .sort_index(axis=1, level=("segment", "feature"))
         )
 
@@ -1224,7 +1918,12 @@ class TSDataset:
     def drop_target_components(self):
         """Drop target components from dataset."""
         if len(self.target_components_names) > 0:  # for pandas >=1.1, <1.2
-            self.df.drop(columns=list(self.target_components_names), level="feature", inplace=True)
+            if self._array_storage is not None:
+                self._array_storage.drop_features(self.target_components_names)
+            else:
+                self._set_stored_df(
+                    self._get_stored_df_view().drop(columns=list(self.target_components_names), level="feature")
+                )
             self._target_components_names = ()
 
     @property
@@ -1236,7 +1935,17 @@ class TSDataset:
         pd.core.indexes.multi.MultiIndex
             multiindex of dataframe with target and features.
         """
-        return self.df.columns
+        if self._array_storage is not None:
+            columns = self._array_storage.columns
+        else:
+            columns = self._get_stored_df_view(merge_pending=False).columns
+        if len(self._lazy_exog_features) > 0:
+            columns = columns.append(self._get_exog_columns(features=self._lazy_exog_features)).sort_values()
+        if len(self._pending_features) > 0:
+            for df_pending in self._pending_features:
+                columns = columns.append(df_pending.columns)
+            columns = columns.sort_values()
+        return columns
 
     @property
     def loc(self) -> pd.core.indexing._LocIndexer:
@@ -1257,7 +1966,7 @@ class TSDataset:
         pd.Dataframe
             is_null dataframe
         """
-        return self.df.isnull()
+        return self._get_df_view().isnull()
 
     def head(self, n_rows: int = 5) -> pd.DataFrame:
         """Return the first ``n_rows`` rows.
@@ -1281,7 +1990,7 @@ class TSDataset:
         pd.DataFrame
             the first ``n_rows`` rows or 5 by default.
         """
-        return self.df.head(n_rows)
+        return self._get_df_view().head(n_rows)
 
     def tail(self, n_rows: int = 5) -> pd.DataFrame:
         """Return the last ``n_rows`` rows.
@@ -1306,13 +2015,13 @@ class TSDataset:
             the last ``n_rows`` rows or 5 by default.
 
         """
-        return self.df.tail(n_rows)
+        return self._get_df_view().tail(n_rows)
 
     def _gather_common_data(self) -> Dict[str, Any]:
         """Gather information about dataset in general."""
         common_dict: Dict[str, Any] = {
             "num_segments": len(self.segments),
-            "num_exogs": self.df.columns.get_level_values("feature").difference(["target"]).nunique(),
+            "num_exogs": self.columns.get_level_values("feature").difference(["target"]).nunique(),
             "num_regressors": len(self.regressors),
             "num_known_future": len(self.known_future),
             "freq": self.freq,
@@ -1321,25 +2030,42 @@ class TSDataset:
         return common_dict
 
     def _gather_segments_data(self, segments: Sequence[str]) -> Dict[str, List[Any]]:
-        """Gather information about each segment."""
-        # gather segment information
-        segments_dict: Dict[str, list] = {
-            "start_timestamp": [],
-            "end_timestamp": [],
-            "length": [],
-            "num_missing": [],
-        }
+        """Gather information about each segment.
 
-        for segment in segments:
-            segment_series = self[:, segment, "target"]
-            first_index = segment_series.first_valid_index()
-            last_index = segment_series.last_valid_index()
-            segment_series = segment_series.loc[first_index:last_index]
-            segments_dict["start_timestamp"].append(first_index)
-            segments_dict["end_timestamp"].append(last_index)
-            segments_dict["length"].append(segment_series.shape[0])
-            segments_dict["num_missing"].append(pd.isna(segment_series).sum())
+        Information is computed for all the segments at once by the reductions over the matrix of targets.
+        """
+        df_view = self._get_stored_df_view()
+        target_columns = pd.MultiIndex.from_arrays([list(segments), ["target"] * len(segments)])
+        target_positions = df_view.columns.get_indexer(target_columns)
+        if np.any(target_positions == -1):
+            unknown_segments = [segment for segment, position in zip(segments, target_positions) if position == -1]
+            raise KeyError(f"Segments {unknown_segments} aren't present in the dataset!")
+
+        is_valid = pd.notna(df_view.iloc[:, target_positions].to_numpy())
+        num_timestamps = is_valid.shape[0]
+        has_valid = is_valid.any(axis=0)
+        first_positions = is_valid.argmax(axis=0)
+        last_positions = num_timestamps - 1 - is_valid[::-1].argmax(axis=0)
+
+        # segments without valid values are described by the whole index
+        lengths = np.where(has_valid, last_positions - first_positions + 1, num_timestamps)
+        num_missing = lengths - is_valid.sum(axis=0)
+        # segments without valid values have no start and end timestamps like in ``first_valid_index``
+        start_timestamps = [
+            timestamp if is_segment_valid else None
+            for timestamp, is_segment_valid in zip(self.index[first_positions], has_valid)
+        ]
+        end_timestamps = [
+            timestamp if is_segment_valid else None
+            for timestamp, is_segment_valid in zip(self.index[last_positions], has_valid)
+        ]
 
+        segments_dict: Dict[str, list] = {
+            "start_timestamp": start_timestamps,
+            "end_timestamp": end_timestamps,
+            "length": lengths.tolist(),
+            "num_missing": num_missing.tolist(),
+        }
         return segments_dict
 
     def describe(self, segments: Optional[Sequence[str]] = None) -> pd.DataFrame:
@@ -1544,3 +2270,120 @@ class TSDataset:
         ts_samples = [samples for df_segment in ts_segments for samples in make_samples(df_segment)]
 
         return _TorchDataset(ts_samples=ts_samples)
+
+    def save_mmap(self, path: Union[str, pathlib.Path]):
+        """Save the dataset into the directory in the format that can be memory-mapped.
+
+        Data of ``df``, ``raw_df`` and ``df_exog`` is saved as ``.npy`` blocks of shape ``(time, segment, feature)``.
+        Index, frequency, regressors and hierarchical structure are saved into ``metadata.json``.
+
+        Parameters
+        ----------
+        path:
+            Directory to save the dataset into, it is created if it doesn't exist.
+
+        Raises
+        ------
+        ValueError:
+            if some dataframe of the dataset can't be kept in "array" storage
+        """
+        path = pathlib.Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        self._merge_pending_features()
+
+        block_dtype = np.float64 if self.dtype is None else self.dtype
+        array_storage = self._array_storage
+        if array_storage is None:
+            array_storage = ArrayStorage.from_frame(self._df, dtype=block_dtype)
+        frames_metadata: Dict[str, Optional[Dict[str, Any]]] = {
+            "df": array_storage.save(path=path, name="df"),
+            "raw_df": ArrayStorage.from_frame(self.raw_df, dtype=block_dtype).save(path=path, name="raw_df"),
+            "df_exog": None,
+        }
+        if self.df_exog is not None:
+            frames_metadata["df_exog"] = ArrayStorage.from_frame(self.df_exog, dtype=block_dtype).save(
+                path=path, name="df_exog"
+            )
+
+        hierarchical_structure = None
+        if self.hierarchical_structure is not None:
+            hierarchical_structure = {
+                "level_structure": self.hierarchical_structure.level_structure,
+                "level_names": self.hierarchical_structure.level_names,
+            }
+        metadata = {
+            "freq": self.freq,
+            "dtype": None if self.dtype is None else self.dtype.name,
+            "lazy_exog": self.lazy_exog,
+            "lazy_exog_features": self._lazy_exog_features,
+            "known_future": self.known_future,
+            "regressors": self._regressors,
+            "target_components_names": list(self._target_components_names),
+            "hierarchical_structure": hierarchical_structure,
+            "current_df_level": self.current_df_level,
+            "current_df_exog_level": self.current_df_exog_level,
+            "frames": frames_metadata,
+        }
+        with open(path / "metadata.json", "w") as f:
+            json.dump(metadata, f)
+
+    @classmethod
+    def load_mmap(cls, path: Union[str, pathlib.Path], mmap_mode: Optional[str] = "r") -> "TSDataset":
+        """Load the dataset saved with :py:meth:`save_mmap`.
+
+        The dataset is loaded in "array" storage attached to the memory-mapped block of ``df``,
+        so the data is read from disk only when it is accessed.
+        The block is copied into memory on the first modification of the data.
+        ``raw_df`` and ``df_exog`` are read into memory.
+
+        Memory-mapped block is passed to the workers of ``joblib`` by the file name,
+        so the workers of the backtest can share one dataset.
+
+        Parameters
+        ----------
+        path:
+            Directory with the saved dataset.
+        mmap_mode:
+            Mode of :py:func:`numpy.load` to memory-map the blocks, if None the blocks are read into memory.
+
+        Returns
+        -------
+        :
+            Loaded dataset.
+        """
+        path = pathlib.Path(path)
+        with open(path / "metadata.json", "r") as f:
+            metadata = json.load(f)
+        frames_metadata = metadata["frames"]
+
+        ts = cls.__new__(cls)
+        ts.storage = DataStorage.array
+        ts.dtype = None if metadata.get("dtype") is None else np.dtype(metadata["dtype"])
+        ts.lazy_exog = metadata.get("lazy_exog", False)
+        ts._lazy_exog_features = metadata.get("lazy_exog_features", [])
+        ts._pending_features = []
+        ts._defer_features_merge = False
+        ts._df_is_shared = False
+        ts._slices_refs = []
+        ts._timestamp_positions_cache = None
+        ts.freq = metadata["freq"]
+        ts._array_storage = ArrayStorage.load(path=path, name="df", metadata=frames_metadata["df"], mmap_mode=mmap_mode)
+        # frames are materialized in memory, views over the memory-mapped blocks can't be pickled correctly
+        ts.raw_df = ArrayStorage.load(
+            path=path, name="raw_df", metadata=frames_metadata["raw_df"], mmap_mode=mmap_mode
+        ).to_frame(copy=True)
+        ts.df_exog = None
+        if frames_metadata["df_exog"] is not None:
+            ts.df_exog = ArrayStorage.load(
+                path=path, name="df_exog", metadata=frames_metadata["df_exog"], mmap_mode=mmap_mode
+            ).to_frame(copy=True)
+
+        ts.known_future = metadata["known_future"]
+        ts._regressors = metadata["regressors"]
+        ts._target_components_names = tuple(metadata["target_components_names"])
+        ts.hierarchical_structure = None
+        if metadata["hierarchical_structure"] is not None:
+            ts.hierarchical_structure = HierarchicalStructure(**metadata["hierarchical_structure"])
+        ts.current_df_level = metadata["current_df_level"]
+        ts.current_df_exog_level = metadata["current_df_exog_level"]
+        return ts
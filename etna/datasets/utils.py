@@ -8,6 +8,8 @@ from typing import Set
 import numpy as np
 import pandas as pd
 from scipy.sparse import csr_matrix
+from scipy.sparse import identity
+from scipy.sparse import kron
 
 from etna import SETTINGS
 
@@ -181,6 +183,60 @@ def set_columns_wide(
     return df_left
 
 
+def _long_to_wide(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert dataframe from long format into ETNA wide format without pivoting.
+
+    Every value of the long dataframe is put into its cell of the wide dataframe by the positions
+    of its timestamp and segment, so the conversion takes linear time in the number of rows.
+
+    Parameters
+    ----------
+    df:
+        dataframe with columns "timestamp", "segment" and features
+
+    Returns
+    -------
+    :
+        dataframe in ETNA wide format with sorted segments and features
+
+    Raises
+    ------
+    ValueError:
+        if there are duplicate pairs of timestamp and segment
+    """
+    timestamp_codes, timestamps = pd.factorize(pd.to_datetime(df["timestamp"]), sort=True)
+    segment_codes, segments = pd.factorize(df["segment"].astype(str), sort=True)
+    features = sorted(set(df.columns) - {"timestamp", "segment"})
+    num_timestamps, num_segments, num_features = len(timestamps), len(segments), len(features)
+
+    # positions of the rows in the wide block of shape (segment, timestamp), -1 marks the missing values
+    flat_positions = segment_codes.astype(np.int64) * num_timestamps + timestamp_codes
+    if len(flat_positions) > 0 and np.bincount(flat_positions).max() > 1:
+        raise ValueError("Index contains duplicate entries, cannot reshape")
+    indexer = np.full(num_segments * num_timestamps, -1, dtype=np.int64)
+    indexer[flat_positions] = np.arange(len(df))
+
+    index = pd.DatetimeIndex(timestamps, name="timestamp")
+    columns = pd.MultiIndex.from_product([segments.tolist(), features], names=("segment", "feature"))
+    features_values = [pd.api.extensions.take(df[feature].values, indexer, allow_fill=True) for feature in features]
+
+    dtypes = {values.dtype for values in features_values}
+    if all(isinstance(values, np.ndarray) for values in features_values) and len(dtypes) == 1:
+        # fast path: all the features are kept in one numpy block
+        block = np.stack(features_values, axis=-1).reshape(num_segments, num_timestamps, num_features)
+        block = block.transpose(1, 0, 2).reshape(num_timestamps, num_segments * num_features)
+        return pd.DataFrame(block, index=index, columns=columns, copy=False)
+
+    data = {}
+    for segment_idx in range(num_segments):
+        start, end = segment_idx * num_timestamps, (segment_idx + 1) * num_timestamps
+        for feature_idx, values in enumerate(features_values):
+            data[segment_idx * num_features + feature_idx] = values[start:end]
+    df_wide = pd.DataFrame(data, index=index)
+    df_wide.columns = columns
+    return df_wide
+
+
 def match_target_quantiles(features: Set[str]) -> Set[str]:
     """Find quantiles in dataframe columns."""
     pattern = re.compile("target_\d+\.\d+$")
@@ -239,29 +295,18 @@ def get_level_dataframe(
     if num_target_level_segments != mapping_matrix.shape[0]:
         raise ValueError("Number of target level segments do not match mapping matrix number of columns!")
 
-    # Slice should be done by source_level_segments -- to fix the order of segments for mapping matrix,
-    # by num_columns -- to fix the order of columns to create correct index in the end
-    source_level_data = df.loc[
-        pd.IndexSlice[:], pd.IndexSlice[source_level_segments, column_names]
-    ].values  # shape: (t, num_source_level_segments * num_columns)
-
-    source_level_data = source_level_data.reshape(
-        (-1, num_source_level_segments, num_columns)
-    )  # shape: (t, num_source_level_segments, num_columns)
-    source_level_data = np.swapaxes(source_level_data, 1, 2)  # shape: (t, num_columns, num_source_level_segments)
-    source_level_data = source_level_data.reshape(
-        (-1, num_source_level_segments)
-    )  # shape: (t * num_columns, num_source_level_segments)
-
-    target_level_data = source_level_data @ mapping_matrix.T
-
-    target_level_data = target_level_data.reshape(
-        (-1, num_columns, num_target_level_segments)
-    )  # shape: (t, num_columns, num_target_level_segments)
-    target_level_data = np.swapaxes(target_level_data, 1, 2)  # shape: (t, num_target_level_segments, num_columns)
-    target_level_data = target_level_data.reshape(
-        (-1, num_columns * num_target_level_segments)
-    )  # shape: (t, num_target_level_segments * num_columns)
+    # Data is taken in the order of source_level_segments -- to match the columns of the mapping matrix,
+    # features of each segment are taken in the order of column_names -- to create correct index in the end
+    source_level_columns = pd.MultiIndex.from_product([source_level_segments, column_names])
+    source_level_positions = df.columns.get_indexer(source_level_columns)
+    if np.any(source_level_positions == -1):
+        raise ValueError("All the segments of provided dataframe should have the same features!")
+    source_level_data = df.iloc[:, source_level_positions].values  # shape: (t, num_source_level_segments * num_columns)
+
+    # each feature is mapped independently, so the mapping of all the features is done by one product
+    # with block matrix that maps the feature of each source segment into the same feature of target segment
+    features_mapping_matrix = kron(mapping_matrix, identity(num_columns, dtype=mapping_matrix.dtype), format="csr")
+    target_level_data = source_level_data @ features_mapping_matrix.T  # shape: (t, num_target_segments * num_columns)
 
     target_level_segments = pd.MultiIndex.from_product(
         [target_level_segments, column_names], names=["segment", "feature"]
@@ -668,9 +668,10 @@ class DeepBaseModel(DeepBaseAbstractModel, SaveNNMixin, NonPredictionIntervalCon
         predictions = self.raw_predict(test_dataset)
         end_idx = len(ts.index)
         future_ts = ts.tsdataset_idx_slice(start_idx=end_idx - prediction_size, end_idx=end_idx)
+        # we don't want to change dtype after assignment, but there can happen cast to float32
+        dtype = np.float64 if future_ts.dtype is None else future_ts.dtype
         for (segment, feature_nm), value in predictions.items():
-            # we don't want to change dtype after assignment, but there can happen cast to float32
-            future_ts.df.loc[:, pd.IndexSlice[segment, feature_nm]] = value[:prediction_size, :].astype(np.float64)
+            future_ts.df.loc[:, pd.IndexSlice[segment, feature_nm]] = value[:prediction_size, :].astype(dtype)
 
         return future_ts
 
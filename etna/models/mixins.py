@@ -420,25 +420,29 @@ class PerSegmentModelMixin(ModelForecastingMixin):
             Dataset with predictions
         """
         result_list = list()
-        df = ts.to_pandas()
+        # read-only view is enough, the features of each segment are copied by ``reset_index``
+        df = ts.get_features_view()
         models = self._get_model()
-        for segment in ts.segments:
+        # segments are matched by int codes instead of names, names are restored in the end
+        df_flat, segments = ts._to_flatten_coded()
+        for segment_code, segment in enumerate(segments):
             if segment not in models:
                 raise NotImplementedError("Per-segment models can't make predictions on new segments!")
             segment_model = models[segment]
             segment_predict = self._make_predictions_segment(
                 model=segment_model, segment=segment, df=df, prediction_method=prediction_method, **kwargs
             )
+            segment_predict["segment"] = np.int32(segment_code)
             result_list.append(segment_predict)
 
         result_df = pd.concat(result_list, ignore_index=True)
         result_df = result_df.set_index(["timestamp", "segment"])
-        df = ts.to_pandas(flatten=True)
-        df = df.set_index(["timestamp", "segment"])
+        df = df_flat.set_index(["timestamp", "segment"])
         # clear values to be filled, otherwise during in-sample prediction new values won't be set
         columns_to_clear = result_df.columns.intersection(df.columns)
         df.loc[result_df.index, columns_to_clear] = np.NaN
         df = df.combine_first(result_df).reset_index()
+        df["segment"] = segments.take(df["segment"].values)
 
         df = TSDataset.to_dataset(df)
         ts.df = df
@@ -533,7 +537,7 @@ class MultiSegmentModelMixin(ModelForecastingMixin):
         :
             Model after fit
         """
-        df = ts.to_pandas(flatten=True)
+        df, _ = ts._to_flatten_coded()
         df = df.dropna()  # TODO: https://github.com/tinkoff-ai/etna/issues/557
         df = df.drop(columns="segment")
         self._base_model.fit(df=df, regressors=ts.regressors)
@@ -554,8 +558,9 @@ class MultiSegmentModelMixin(ModelForecastingMixin):
         :
             Dataset with predictions
         """
-        horizon = len(ts.df)
-        x = ts.to_pandas(flatten=True).drop(["segment"], axis=1)
+        horizon = len(ts.index)
+        x, _ = ts._to_flatten_coded()
+        x = x.drop(["segment"], axis=1)
         # TODO: make it work with prediction intervals and context
         y = prediction_method(self=self._base_model, df=x, **kwargs).reshape(-1, horizon).T
         ts.loc[:, pd.IndexSlice[:, "target"]] = y
@@ -576,12 +581,12 @@ class MultiSegmentModelMixin(ModelForecastingMixin):
         :
             DataFrame with predicted components
         """
-        features_df = ts.to_pandas(flatten=True)
-        segment_column = features_df["segment"].values
+        features_df, segments = ts._to_flatten_coded()
+        segment_codes = features_df["segment"].values
         features_df = features_df.drop(["segment"], axis=1)
         # TODO: make it work with prediction intervals and context
         target_components_df = prediction_method(self=self._base_model, df=features_df, **kwargs)
-        target_components_df["segment"] = segment_column
+        target_components_df["segment"] = segments.take(segment_codes)
         target_components_df["timestamp"] = features_df["timestamp"]
         target_components_df = TSDataset.to_dataset(target_components_df)
         return target_components_df
@@ -119,6 +119,8 @@ class AutoRegressivePipeline(ModelPipelinePredictMixin, SaveModelPipelineMixin,
                 freq=ts.freq,
                 df_exog=ts.df_exog,
                 known_future=ts.known_future,
+                dtype=ts.dtype,
+                trusted=True,
             )
             with warnings.catch_warnings():
                 warnings.filterwarnings(
@@ -151,7 +153,14 @@ class AutoRegressivePipeline(ModelPipelinePredictMixin, SaveModelPipelineMixin,
             prediction_df = prediction_df.combine_first(current_ts_future.to_pandas()[prediction_df.columns])
 
         # construct dataset and add all features
-        prediction_ts = TSDataset(df=prediction_df, freq=ts.freq, df_exog=ts.df_exog, known_future=ts.known_future)
+        prediction_ts = TSDataset(
+            df=prediction_df,
+            freq=ts.freq,
+            df_exog=ts.df_exog,
+            known_future=ts.known_future,
+            dtype=ts.dtype,
+            trusted=True,
+        )
         prediction_ts.transform(self.transforms)
         prediction_ts.inverse_transform(self.transforms)
 
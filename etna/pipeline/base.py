@@ -94,7 +94,7 @@ class FoldMask(BaseMixin):
         horizon:
             Forecasting horizon
         """
-        dataset_timestamps = list(ts.index)
+        dataset_timestamps = ts.index
         dataset_description = ts.describe()
 
         min_first_timestamp = ts.index.min()
@@ -105,14 +105,13 @@ class FoldMask(BaseMixin):
         if self.last_train_timestamp > last_timestamp:
             raise ValueError(f"Last train timestamp should be not later than {last_timestamp}!")
 
-        dataset_first_target_timestamp = dataset_timestamps[dataset_timestamps.index(self.last_train_timestamp) + 1]
+        last_train_timestamp_idx = ts.get_timestamp_position(self.last_train_timestamp)
+        dataset_first_target_timestamp = dataset_timestamps[last_train_timestamp_idx + 1]
         mask_first_target_timestamp = self.target_timestamps[0]
         if mask_first_target_timestamp < dataset_first_target_timestamp:
             raise ValueError(f"First target timestamp should be not sooner than {dataset_first_target_timestamp}!")
 
-        dataset_last_target_timestamp = dataset_timestamps[
-            dataset_timestamps.index(self.last_train_timestamp) + horizon
-        ]
+        dataset_last_target_timestamp = dataset_timestamps[last_train_timestamp_idx + horizon]
         mask_last_target_timestamp = self.target_timestamps[-1]
         if dataset_last_target_timestamp < mask_last_target_timestamp:
             raise ValueError(f"Last target timestamp should be not later than {dataset_last_target_timestamp}!")
@@ -528,7 +527,7 @@ class BasePipeline(AbstractPipeline, BaseMixin):
     def _validate_backtest_dataset(ts: TSDataset, n_folds: int, horizon: int, stride: int):
         """Check all segments have enough timestamps to validate forecaster with given number of splits."""
         min_required_length = horizon + (n_folds - 1) * stride
-        segments = set(ts.df.columns.get_level_values("segment"))
+        segments = set(ts.segments)
         for segment in segments:
             segment_target = ts[:, segment, "target"]
             if len(segment_target) < min_required_length:
@@ -551,7 +550,7 @@ class BasePipeline(AbstractPipeline, BaseMixin):
             assert_never(mode)
 
         masks = []
-        dataset_timestamps = list(ts.index)
+        dataset_timestamps = ts.index
         min_timestamp_idx, max_timestamp_idx = 0, len(dataset_timestamps)
         for offset in range(n_folds, 0, -1):
             min_train_idx = min_timestamp_idx + (n_folds - offset) * stride * constant_history_length
@@ -588,10 +587,10 @@ class BasePipeline(AbstractPipeline, BaseMixin):
         ts: TSDataset, masks: List[FoldMask], horizon: int
     ) -> Generator[Tuple[TSDataset, TSDataset], None, None]:
         """Generate folds."""
-        timestamps = list(ts.index)
+        timestamps = ts.index
         for mask in masks:
-            min_train_idx = timestamps.index(mask.first_train_timestamp)
-            max_train_idx = timestamps.index(mask.last_train_timestamp)
+            min_train_idx = ts.get_timestamp_position(mask.first_train_timestamp)
+            max_train_idx = ts.get_timestamp_position(mask.last_train_timestamp)
             min_test_idx = max_train_idx + 1
             max_test_idx = max_train_idx + horizon
 
@@ -1,5 +1,6 @@
 import pathlib
 from copy import deepcopy
+from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -52,7 +53,13 @@ class HierarchicalPipeline(Pipeline):
         self.reconciliator = reconciliator
         self._fit_ts: Optional[TSDataset] = None
 
-    def fit(self, ts: TSDataset) -> "HierarchicalPipeline":
+    def fit(
+        self,
+        ts: TSDataset,
+        segment_chunk_size: Optional[int] = None,
+        n_jobs: int = 1,
+        joblib_params: Optional[Dict[str, Any]] = None,
+    ) -> "HierarchicalPipeline":
         """Fit the HierarchicalPipeline.
 
         Fit and apply given transforms to the data, then fit the model on the transformed data.
@@ -62,12 +69,24 @@ class HierarchicalPipeline(Pipeline):
         ----------
         ts:
             Dataset with hierarchical timeseries data
+        segment_chunk_size:
+            Isn't supported, the hierarchy can't be split into the chunks of segments
+        n_jobs:
+            Isn't used
+        joblib_params:
+            Isn't used
 
         Returns
         -------
         :
             Fitted HierarchicalPipeline instance
+
+        Raises
+        ------
+        ValueError:
+            if ``segment_chunk_size`` is given
         """
+        self._validate_no_segment_chunks(segment_chunk_size=segment_chunk_size)
         self._fit_ts = deepcopy(ts)
 
         self.reconciliator.fit(ts=ts)
@@ -75,6 +94,12 @@ class HierarchicalPipeline(Pipeline):
         super().fit(ts=ts)
         return self
 
+    @staticmethod
+    def _validate_no_segment_chunks(segment_chunk_size: Optional[int]):
+        """Check that processing by the chunks of segments isn't requested."""
+        if segment_chunk_size is not None:
+            raise ValueError("HierarchicalPipeline doesn't support processing by segment chunks!")
+
     def raw_forecast(
         self,
         ts: TSDataset,
@@ -194,6 +219,9 @@ class HierarchicalPipeline(Pipeline):
         quantiles: Sequence[float] = (0.025, 0.975),
         n_folds: int = 3,
         return_components: bool = False,
+        segment_chunk_size: Optional[int] = None,
+        n_jobs: int = 1,
+        joblib_params: Optional[Dict[str, Any]] = None,
     ) -> TSDataset:
         """Make a forecast of the next points of a dataset at a target level.
 
@@ -213,12 +241,24 @@ class HierarchicalPipeline(Pipeline):
             Number of folds to use in the backtest for prediction interval estimation
         return_components:
             If True additionally returns forecast components
+        segment_chunk_size:
+            Isn't supported, the hierarchy can't be split into the chunks of segments
+        n_jobs:
+            Isn't used
+        joblib_params:
+            Isn't used
 
         Returns
         -------
         :
             Dataset with predictions at the target level of hierarchy.
+
+        Raises
+        ------
+        ValueError:
+            if ``segment_chunk_size`` is given
         """
+        self._validate_no_segment_chunks(segment_chunk_size=segment_chunk_size)
         if ts is None:
             if self._fit_ts is None:
                 raise ValueError(
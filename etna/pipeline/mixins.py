@@ -43,6 +43,7 @@ class ModelPipelinePredictMixin:
             freq=freq,
             known_future=known_future,
             hierarchical_structure=ts.hierarchical_structure,
+            dtype=ts.dtype,
         )
 
         cur_ts.transform(transforms=self.transforms)
@@ -1,7 +1,15 @@
+from copy import deepcopy
+from typing import Any
+from typing import Dict
+from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Tuple
 from typing import cast
 
+import pandas as pd
+from joblib import Parallel
+from joblib import delayed
 from typing_extensions import get_args
 
 from etna.datasets import TSDataset
@@ -10,6 +18,7 @@ from etna.models.base import ContextRequiredModelType
 from etna.models.base import ModelType
 from etna.models.base import PredictionIntervalContextIgnorantAbstractModel
 from etna.models.base import PredictionIntervalContextRequiredAbstractModel
+from etna.models.mixins import PerSegmentModelMixin
 from etna.pipeline.base import BasePipeline
 from etna.pipeline.mixins import ModelPipelinePredictMixin
 from etna.pipeline.mixins import SaveModelPipelineMixin
@@ -34,9 +43,16 @@ class Pipeline(ModelPipelinePredictMixin, SaveModelPipelineMixin, BasePipeline):
         """
         self.model = model
         self.transforms = transforms
+        self._chunk_pipelines: Optional[List[Tuple[List[str], "Pipeline"]]] = None
         super().__init__(horizon=horizon)
 
-    def fit(self, ts: TSDataset) -> "Pipeline":
+    def fit(
+        self,
+        ts: TSDataset,
+        segment_chunk_size: Optional[int] = None,
+        n_jobs: int = 1,
+        joblib_params: Optional[Dict[str, Any]] = None,
+    ) -> "Pipeline":
         """Fit the Pipeline.
 
         Fit and apply given transforms to the data, then fit the model on the transformed data.
@@ -45,12 +61,56 @@ class Pipeline(ModelPipelinePredictMixin, SaveModelPipelineMixin, BasePipeline):
         ----------
         ts:
             Dataset with timeseries data
+        segment_chunk_size:
+            If given, dataset is split into the chunks with this number of segments
+            and a separate copy of the pipeline is fitted on each chunk,
+            so the peak memory of fitting is bounded by the size of the chunk instead of the size of the dataset.
+            Fitted copies are used by :py:meth:`forecast` and :py:meth:`predict`,
+            ``ts`` gets the transformed chunks like in case of fitting without chunks.
+            It is allowed only for the per-segment models,
+            transforms are expected to process the segments independently.
+        n_jobs:
+            Number of chunks to fit in parallel, it is used only if ``segment_chunk_size`` is given
+        joblib_params:
+            Additional parameters for :py:class:`joblib.Parallel`
 
         Returns
         -------
         :
             Fitted Pipeline instance
+
+        Raises
+        ------
+        ValueError:
+            if ``segment_chunk_size`` is given for the model that isn't per-segment
         """
+        self._chunk_pipelines = None
+        if segment_chunk_size is not None:
+            self._validate_segment_chunk_size(segment_chunk_size=segment_chunk_size)
+            if joblib_params is None:
+                joblib_params = dict(backend="multiprocessing", mmap_mode="c")
+
+            segment_chunks = self._make_segment_chunks(segments=ts.segments, segment_chunk_size=segment_chunk_size)
+            with Parallel(n_jobs=n_jobs, **joblib_params) as parallel:
+                fitted_chunks = parallel(
+                    delayed(_fit_chunk_pipeline)(
+                        model=self.model,
+                        transforms=self.transforms,
+                        horizon=self.horizon,
+                        ts=ts.select_segments(segments),
+                    )
+                    for segments in segment_chunks
+                )
+            pipelines = [pipeline for pipeline, _, _ in fitted_chunks]
+            self._chunk_pipelines = list(zip(segment_chunks, pipelines))
+
+            # dataset gets the features of the transforms like in case of fitting without chunks
+            _, _, regressors = fitted_chunks[0]
+            ts.df = pd.concat([df for _, df, _ in fitted_chunks], axis=1)
+            ts._regressors = regressors
+            self.ts = ts
+            return self
+
         self.ts = ts
         self.ts.fit_transform(self.transforms)
         self.model.fit(self.ts)
@@ -73,6 +133,52 @@ class Pipeline(ModelPipelinePredictMixin, SaveModelPipelineMixin, BasePipeline):
             predictions = self.model.forecast(ts=future, return_components=return_components)
         return predictions
 
+    def _validate_segment_chunk_size(self, segment_chunk_size: int):
+        """Check that pipeline can process the dataset by the chunks of segments."""
+        if segment_chunk_size < 1:
+            raise ValueError("Segment chunk size should be positive!")
+        if not isinstance(self.model, PerSegmentModelMixin):
+            raise ValueError(
+                f"Processing by segment chunks is allowed only for per-segment models, "
+                f"{self.model.__class__.__name__} is given!"
+            )
+
+    @staticmethod
+    def _make_segment_chunks(segments: List[str], segment_chunk_size: int) -> List[List[str]]:
+        """Split segments into the chunks of the given size."""
+        return [segments[i : i + segment_chunk_size] for i in range(0, len(segments), segment_chunk_size)]
+
+    def _get_chunk_pipelines(
+        self, ts: TSDataset, segment_chunk_size: Optional[int]
+    ) -> Optional[List[Tuple[List[str], "Pipeline"]]]:
+        """Get chunks of segments with the pipelines to process them, None if dataset isn't processed by chunks."""
+        if self._chunk_pipelines is not None:
+            return self._chunk_pipelines
+        if segment_chunk_size is None:
+            return None
+        self._validate_segment_chunk_size(segment_chunk_size=segment_chunk_size)
+        segment_chunks = self._make_segment_chunks(segments=ts.segments, segment_chunk_size=segment_chunk_size)
+        return [(segments, self) for segments in segment_chunks]
+
+    @staticmethod
+    def _concat_chunk_predictions(predictions: List[TSDataset]) -> TSDataset:
+        """Concatenate predictions made on the chunks of segments into one dataset."""
+        first_prediction = predictions[0]
+        df = pd.concat([prediction.to_pandas() for prediction in predictions], axis=1)
+        result = TSDataset(
+            df=df,
+            freq=first_prediction.freq,
+            storage=first_prediction.storage,
+            dtype=first_prediction.dtype,
+            trusted=True,
+        )
+        result.known_future = deepcopy(first_prediction.known_future)
+        result._regressors = deepcopy(first_prediction.regressors)
+        result._target_components_names = deepcopy(first_prediction.target_components_names)
+        if all(prediction.df_exog is not None for prediction in predictions):
+            result.df_exog = pd.concat([prediction.df_exog for prediction in predictions], axis=1)
+        return result
+
     def forecast(
         self,
         ts: Optional[TSDataset] = None,
@@ -80,6 +186,9 @@ class Pipeline(ModelPipelinePredictMixin, SaveModelPipelineMixin, BasePipeline):
         quantiles: Sequence[float] = (0.025, 0.975),
         n_folds: int = 3,
         return_components: bool = False,
+        segment_chunk_size: Optional[int] = None,
+        n_jobs: int = 1,
+        joblib_params: Optional[Dict[str, Any]] = None,
     ) -> TSDataset:
         """Make a forecast of the next points of a dataset.
 
@@ -97,11 +206,25 @@ class Pipeline(ModelPipelinePredictMixin, SaveModelPipelineMixin, BasePipeline):
             Number of folds to use in the backtest for prediction interval estimation
         return_components:
             If True additionally returns forecast components
+        segment_chunk_size:
+            If given, dataset is forecasted by the chunks with this number of segments
+            and the forecasts of the chunks are concatenated.
+            It is allowed only for the per-segment models.
+            If the pipeline is fitted by the chunks, chunks from :py:meth:`fit` are always used.
+        n_jobs:
+            Number of chunks to forecast in parallel, it is used only in case of forecasting by the chunks
+        joblib_params:
+            Additional parameters for :py:class:`joblib.Parallel`
 
         Returns
         -------
         :
             Dataset with predictions
+
+        Raises
+        ------
+        ValueError:
+            if ``segment_chunk_size`` is given for the model that isn't per-segment
         """
         if ts is None:
             if self.ts is None:
@@ -113,6 +236,26 @@ class Pipeline(ModelPipelinePredictMixin, SaveModelPipelineMixin, BasePipeline):
         self._validate_quantiles(quantiles=quantiles)
         self._validate_backtest_n_folds(n_folds=n_folds)
 
+        chunk_pipelines = self._get_chunk_pipelines(ts=ts, segment_chunk_size=segment_chunk_size)
+        if chunk_pipelines is not None:
+            if joblib_params is None:
+                joblib_params = dict(backend="multiprocessing", mmap_mode="c")
+            with Parallel(n_jobs=n_jobs, **joblib_params) as parallel:
+                predictions_chunks = parallel(
+                    delayed(_forecast_chunk)(
+                        model=pipeline.model,
+                        transforms=pipeline.transforms,
+                        horizon=self.horizon,
+                        ts=ts.select_segments(segments),
+                        prediction_interval=prediction_interval,
+                        quantiles=quantiles,
+                        n_folds=n_folds,
+                        return_components=return_components,
+                    )
+                    for segments, pipeline in chunk_pipelines
+                )
+            return self._concat_chunk_predictions(predictions=predictions_chunks)
+
         if prediction_interval and isinstance(self.model, PredictionIntervalContextIgnorantAbstractModel):
             future = ts.make_future(future_steps=self.horizon, transforms=self.transforms)
             predictions = self.model.forecast(
@@ -142,3 +285,77 @@ class Pipeline(ModelPipelinePredictMixin, SaveModelPipelineMixin, BasePipeline):
             )
         predictions.inverse_transform(self.transforms)
         return predictions
+
+    def _predict(
+        self,
+        ts: TSDataset,
+        start_timestamp: pd.Timestamp,
+        end_timestamp: pd.Timestamp,
+        prediction_interval: bool,
+        quantiles: Sequence[float],
+        return_components: bool = False,
+    ) -> TSDataset:
+        """Make in-sample predictions, by the chunks of segments if the pipeline is fitted by the chunks."""
+        if self._chunk_pipelines is None:
+            return super()._predict(
+                ts=ts,
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+                prediction_interval=prediction_interval,
+                quantiles=quantiles,
+                return_components=return_components,
+            )
+
+        predictions_chunks = [
+            pipeline._predict(
+                ts=ts.select_segments(segments),
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+                prediction_interval=prediction_interval,
+                quantiles=quantiles,
+                return_components=return_components,
+            )
+            for segments, pipeline in self._chunk_pipelines
+        ]
+        return self._concat_chunk_predictions(predictions=predictions_chunks)
+
+
+def _fit_chunk_pipeline(
+    model: ModelType, transforms: Sequence[Transform], horizon: int, ts: TSDataset
+) -> Tuple[Pipeline, pd.DataFrame, List[str]]:
+    """Fit a copy of the pipeline on the chunk of segments.
+
+    Only the templates of the model and transforms with the chunk are passed to the worker,
+    so the memory of the worker is bounded by the size of the chunk.
+
+    Returns
+    -------
+    :
+        fitted pipeline without the dataset, transformed dataframe of the chunk and regressors of the chunk
+    """
+    pipeline = Pipeline(model=deepcopy(model), transforms=deepcopy(transforms), horizon=horizon)
+    pipeline.fit(ts=ts)
+    df, regressors = pipeline.ts.df, pipeline.ts.regressors
+    pipeline.ts = None
+    return pipeline, df, regressors
+
+
+def _forecast_chunk(
+    model: ModelType,
+    transforms: Sequence[Transform],
+    horizon: int,
+    ts: TSDataset,
+    prediction_interval: bool,
+    quantiles: Sequence[float],
+    n_folds: int,
+    return_components: bool,
+) -> TSDataset:
+    """Forecast the chunk of segments with the fitted model and transforms."""
+    pipeline = Pipeline(model=model, transforms=transforms, horizon=horizon)
+    return pipeline.forecast(
+        ts=ts,
+        prediction_interval=prediction_interval,
+        quantiles=quantiles,
+        n_folds=n_folds,
+        return_components=return_components,
+    )
@@ -1,13 +1,18 @@
 from abc import ABC
 from abc import abstractmethod
 from copy import deepcopy
+from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Set
 from typing import Union
 
 import pandas as pd
+from joblib import Parallel
+from joblib import delayed
 from typing_extensions import Literal
 
 from etna.core import AbstractSaveable
@@ -27,6 +32,16 @@ class Transform(SaveMixin, AbstractSaveable, BaseMixin):
     def __init__(self, required_features: Union[Literal["all"], List[str]]):
         self.required_features = required_features
 
+    @property
+    def required_history(self) -> Optional[int]:
+        """Number of the previous timestamps required to transform the value at each timestamp.
+
+        It is used by :py:meth:`~etna.datasets.TSDataset.make_future` to transform only the tail of the dataset.
+        Zero means that the transform works with each timestamp independently,
+        None means that the whole history can be required.
+        """
+        return None
+
     @abstractmethod
     def get_regressors_info(self) -> List[str]:
         """Return the list with regressors created by the transform.
@@ -49,22 +64,22 @@ class Transform(SaveMixin, AbstractSaveable, BaseMixin):
             ts.drop_features(features=columns_to_remove, drop_from_exog=False)
         if len(columns_to_add) != 0:
             new_regressors = self.get_regressors_info()
-            ts.add_columns_from_pandas(
-                df_update=df_transformed.loc[pd.IndexSlice[:], pd.IndexSlice[:, columns_to_add]],
-                update_exog=False,
-                regressors=new_regressors,
-            )
+            df_add = df_transformed
+            if len(columns_to_update) != 0:
+                df_add = df_transformed.loc[pd.IndexSlice[:], pd.IndexSlice[:, columns_to_add]]
+            ts.add_columns_from_pandas(df_update=df_add, update_exog=False, regressors=new_regressors)
         if len(columns_to_update) != 0:
-            ts.update_columns_from_pandas(
-                df_update=df_transformed.loc[pd.IndexSlice[:], pd.IndexSlice[:, columns_to_update]]
-            )
+            df_update = df_transformed
+            if len(columns_to_add) != 0:
+                df_update = df_transformed.loc[pd.IndexSlice[:], pd.IndexSlice[:, columns_to_update]]
+            ts.update_columns_from_pandas(df_update=df_update)
         return ts
 
     @abstractmethod
     def _fit(self, df: pd.DataFrame):
         """Fit the transform.
 
-        Should be implemented by user.
+        Should be implemented by user. Dataframe can share memory with the dataset, so it shouldn't be modified.
 
         Parameters
         ----------
@@ -86,7 +101,7 @@ class Transform(SaveMixin, AbstractSaveable, BaseMixin):
         :
             The fitted transform instance.
         """
-        df = ts.to_pandas(flatten=False, features=self.required_features)
+        df = ts.get_features_view(features=self.required_features)
         self._fit(df=df)
         return self
 
@@ -322,82 +337,220 @@ class OneSegmentTransform(ABC, BaseMixin):
         """
         pass
 
+    def _fit_segments(self, df: pd.DataFrame) -> Optional[Dict[str, "OneSegmentTransform"]]:
+        """Fit copies of the transform on all the segments at once.
+
+        May be reimplemented to avoid fitting the segments one by one.
+
+        Parameters
+        ----------
+        df:
+            Dataframe in etna wide format.
+
+        Returns
+        -------
+        :
+            Fitted transforms for each segment or None if the transform can't be fitted on all the segments at once.
+        """
+        return None
+
+    def _transform_segments(
+        self, segment_transforms: Dict[str, "OneSegmentTransform"], df: pd.DataFrame
+    ) -> Optional[pd.DataFrame]:
+        """Transform all the segments at once with the transforms fitted on them.
+
+        May be reimplemented to avoid transforming the segments one by one.
+
+        Parameters
+        ----------
+        segment_transforms:
+            Fitted transforms for each segment.
+        df:
+            Dataframe in etna wide format, it shouldn't be modified.
+
+        Returns
+        -------
+        :
+            Transformed dataframe in etna wide format with sorted columns
+            or None if the transform can't be applied to all the segments at once.
+        """
+        return None
+
+    def _inverse_transform_segments(
+        self, segment_transforms: Dict[str, "OneSegmentTransform"], df: pd.DataFrame
+    ) -> Optional[pd.DataFrame]:
+        """Inverse transform all the segments at once with the transforms fitted on them.
+
+        May be reimplemented to avoid inverse transforming the segments one by one.
+
+        Parameters
+        ----------
+        segment_transforms:
+            Fitted transforms for each segment.
+        df:
+            Dataframe in etna wide format, it shouldn't be modified.
+
+        Returns
+        -------
+        :
+            Inverse transformed dataframe in etna wide format with sorted columns
+            or None if the transform can't be applied to all the segments at once.
+        """
+        return None
+
 
 class PerSegmentWrapper(Transform):
     """Class to apply transform in per segment manner."""
 
-    def __init__(self, transform: OneSegmentTransform, required_features: Union[Literal["all"], List[str]]):
+    def __init__(
+        self,
+        transform: OneSegmentTransform,
+        required_features: Union[Literal["all"], List[str]],
+        n_jobs: int = 1,
+        joblib_params: Optional[Dict[str, Any]] = None,
+    ):
+        """Init PerSegmentWrapper.
+
+        Parameters
+        ----------
+        transform:
+            Transform to apply to each segment.
+        required_features:
+            Features required by the transform.
+        n_jobs:
+            Number of jobs to process the segments in parallel, each job receives only the data of its segment.
+        joblib_params:
+            Additional parameters for :py:class:`joblib.Parallel`,
+            by default segments are processed by ``multiprocessing`` backend.
+        """
         self._base_transform = transform
         self.segment_transforms: Optional[Dict[str, OneSegmentTransform]] = None
+        self.n_jobs = n_jobs
+        self.joblib_params = joblib_params
         super().__init__(required_features=required_features)
 
+    @staticmethod
+    def _fit_segment_transform(transform: OneSegmentTransform, df: pd.DataFrame) -> OneSegmentTransform:
+        """Fit copy of the transform on the segment."""
+        segment_transform = deepcopy(transform)
+        segment_transform.fit(df)
+        return segment_transform
+
+    @staticmethod
+    def _transform_segment(transform: OneSegmentTransform, df: pd.DataFrame) -> pd.DataFrame:
+        """Transform the segment."""
+        return transform.transform(df)
+
+    @staticmethod
+    def _inverse_transform_segment(transform: OneSegmentTransform, df: pd.DataFrame) -> pd.DataFrame:
+        """Inverse transform the segment."""
+        return transform.inverse_transform(df)
+
+    def _apply_per_segment(
+        self,
+        func: Callable[[OneSegmentTransform, pd.DataFrame], Any],
+        transforms: List[OneSegmentTransform],
+        dfs: Iterable[pd.DataFrame],
+    ) -> List[Any]:
+        """Apply function to the transforms and dataframes of the segments, in parallel if ``n_jobs`` isn't 1."""
+        if self.n_jobs == 1:
+            return [func(transform, df) for transform, df in zip(transforms, dfs)]
+
+        joblib_params = self.joblib_params
+        if joblib_params is None:
+            joblib_params = dict(backend="multiprocessing", mmap_mode="c")
+        return Parallel(n_jobs=self.n_jobs, **joblib_params)(
+            delayed(func)(transform, df) for transform, df in zip(transforms, dfs)
+        )
+
     def _fit(self, df: pd.DataFrame):
         """Fit transform on each segment."""
-        self.segment_transforms = {}
-        segments = df.columns.get_level_values("segment").unique()
-        for segment in segments:
-            self.segment_transforms[segment] = deepcopy(self._base_transform)
-            self.segment_transforms[segment].fit(df[segment])
+        segment_transforms = self._base_transform._fit_segments(df=df)
+        if segment_transforms is not None:
+            self.segment_transforms = segment_transforms
+            return
 
-    def _transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Apply transform to each segment separately."""
+        segments = df.columns.get_level_values("segment").unique()
+        fitted_transforms = self._apply_per_segment(
+            func=self._fit_segment_transform,
+            transforms=[self._base_transform] * len(segments),
+            dfs=(df[segment] for segment in segments),
+        )
+        self.segment_transforms = dict(zip(segments, fitted_transforms))
+
+    def _check_segments(self, df: pd.DataFrame) -> Set[str]:
+        """Check that transform is fitted on all the segments of the dataframe and return these segments."""
         if self.segment_transforms is None:
             raise ValueError("Transform is not fitted!")
 
-        results = []
         segments = set(df.columns.get_level_values("segment"))
-        for segment in segments:
-            if segment not in self.segment_transforms:
-                raise NotImplementedError("Per-segment transforms can't work on new segments!")
-
-            segment_transform = self.segment_transforms[segment]
-            seg_df = segment_transform.transform(df[segment])
-
-            _idx = seg_df.columns.to_frame()
-            _idx.insert(0, "segment", segment)
-            seg_df.columns = pd.MultiIndex.from_frame(_idx)
-            results.append(seg_df)
-
-        df = pd.concat(results, axis=1)
+        if not segments.issubset(self.segment_transforms.keys()):
+            raise NotImplementedError("Per-segment transforms can't work on new segments!")
+        return segments
+
+    def _run_per_segment(
+        self, func: Callable[[OneSegmentTransform, pd.DataFrame], pd.DataFrame], segments: Set[str], df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Apply fitted transforms of the segments and gather the results into one dataframe."""
+        sorted_segments = sorted(segments)
+        results = self._apply_per_segment(
+            func=func,
+            transforms=[self.segment_transforms[segment] for segment in sorted_segments],  # type: ignore
+            dfs=(df[segment] for segment in sorted_segments),
+        )
+        df = pd.concat(results, axis=1, keys=sorted_segments)
         df = df.sort_index(axis=1)
         df.columns.names = ["segment", "feature"]
         return df
 
+    def _transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply transform to each segment separately."""
+        segments = self._check_segments(df=df)
+        df_transformed = self._base_transform._transform_segments(
+            segment_transforms=self.segment_transforms, df=df  # type: ignore
+        )
+        if df_transformed is not None:
+            return df_transformed
+
+        return self._run_per_segment(func=self._transform_segment, segments=segments, df=df)
+
 
 class IrreversiblePerSegmentWrapper(PerSegmentWrapper, IrreversibleTransform):
     """Class to apply irreversible transform in per segment manner."""
 
-    def __init__(self, transform: OneSegmentTransform, required_features: Union[Literal["all"], List[str]]):
-        super().__init__(transform=transform, required_features=required_features)
+    def __init__(
+        self,
+        transform: OneSegmentTransform,
+        required_features: Union[Literal["all"], List[str]],
+        n_jobs: int = 1,
+        joblib_params: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(
+            transform=transform, required_features=required_features, n_jobs=n_jobs, joblib_params=joblib_params
+        )
 
 
 class ReversiblePerSegmentWrapper(PerSegmentWrapper, ReversibleTransform):
     """Class to apply reversible transform in per segment manner."""
 
-    def __init__(self, transform: OneSegmentTransform, required_features: Union[Literal["all"], List[str]]):
-        super().__init__(transform=transform, required_features=required_features)
+    def __init__(
+        self,
+        transform: OneSegmentTransform,
+        required_features: Union[Literal["all"], List[str]],
+        n_jobs: int = 1,
+        joblib_params: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(
+            transform=transform, required_features=required_features, n_jobs=n_jobs, joblib_params=joblib_params
+        )
 
     def _inverse_transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply inverse_transform to each segment."""
-        if self.segment_transforms is None:
-            raise ValueError("Transform is not fitted!")
-
-        results = []
-        segments = set(df.columns.get_level_values("segment"))
-        for segment in segments:
-            if segment not in self.segment_transforms:
-                raise NotImplementedError("Per-segment transforms can't work on new segments!")
-
-            segment_transform = self.segment_transforms[segment]
-            seg_df = segment_transform.inverse_transform(df[segment])
-
-            _idx = seg_df.columns.to_frame()
-            _idx.insert(0, "segment", segment)
-            seg_df.columns = pd.MultiIndex.from_frame(_idx)
-
-            results.append(seg_df)
-
-        df = pd.concat(results, axis=1)
-        df = df.sort_index(axis=1)
-        df.columns.names = ["segment", "feature"]
-        return df
+        segments = self._check_segments(df=df)
+        df_transformed = self._base_transform._inverse_transform_segments(
+            segment_transforms=self.segment_transforms, df=df  # type: ignore
+        )
+        if df_transformed is not None:
+            return df_transformed
+
+        return self._run_per_segment(func=self._inverse_transform_segment, segments=segments, df=df)
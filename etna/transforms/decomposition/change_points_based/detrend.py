@@ -1,3 +1,5 @@
+from typing import Any
+from typing import Dict
 from typing import Optional
 
 import numpy as np
@@ -51,6 +53,8 @@ class ChangePointsTrendTransform(ReversibleChangePointsTransform):
         in_column: str,
         change_points_model: Optional[BaseChangePointsModelAdapter] = None,
         per_interval_model: Optional[PerIntervalModel] = None,
+        n_jobs: int = 1,
+        joblib_params: Optional[Dict[str, Any]] = None,
     ):
         """Init ChangePointsTrendTransform.
 
@@ -62,6 +66,10 @@ class ChangePointsTrendTransform(ReversibleChangePointsTransform):
             model to get trend change points
         per_interval_model:
             model to process intervals of segment
+        n_jobs:
+            number of jobs to fit and transform the segments in parallel
+        joblib_params:
+            additional parameters for :py:class:`joblib.Parallel`, by default ``multiprocessing`` backend is used
         """
         self.in_column = in_column
         self.change_points_model = (
@@ -84,4 +92,6 @@ class ChangePointsTrendTransform(ReversibleChangePointsTransform):
                 per_interval_model=self.per_interval_model,
             ),
             required_features=[in_column],
+            n_jobs=n_jobs,
+            joblib_params=joblib_params,
         )
@@ -1,3 +1,5 @@
+from typing import Any
+from typing import Dict
 from typing import Optional
 
 from ruptures import Binseg
@@ -49,6 +51,8 @@ class ChangePointsLevelTransform(ReversibleChangePointsTransform):
         in_column: str,
         change_points_model: Optional[BaseChangePointsModelAdapter] = None,
         per_interval_model: Optional[StatisticsPerIntervalModel] = None,
+        n_jobs: int = 1,
+        joblib_params: Optional[Dict[str, Any]] = None,
     ):
         """Init ChangePointsTrendTransform.
 
@@ -60,6 +64,10 @@ class ChangePointsLevelTransform(ReversibleChangePointsTransform):
             model to get trend change points
         per_interval_model:
             model to process intervals of segment
+        n_jobs:
+            number of jobs to fit and transform the segments in parallel
+        joblib_params:
+            additional parameters for :py:class:`joblib.Parallel`, by default ``multiprocessing`` backend is used
         """
         self.in_column = in_column
         self.change_points_model = (
@@ -78,4 +86,6 @@ class ChangePointsLevelTransform(ReversibleChangePointsTransform):
                 per_interval_model=self.per_interval_model,
             ),
             required_features=[in_column],
+            n_jobs=n_jobs,
+            joblib_params=joblib_params,
         )
@@ -1,8 +1,12 @@
+from copy import copy
+from typing import Dict
 from typing import List
+from typing import Optional
 
 import numpy as np
 import pandas as pd
 from sklearn.base import RegressorMixin
+from sklearn.base import clone
 from sklearn.linear_model import LinearRegression
 from sklearn.linear_model import TheilSenRegressor
 from sklearn.pipeline import Pipeline
@@ -10,7 +14,9 @@ from sklearn.preprocessing import PolynomialFeatures
 
 from etna.transforms.base import OneSegmentTransform
 from etna.transforms.base import ReversiblePerSegmentWrapper
+from etna.transforms.utils import get_feature_values
 from etna.transforms.utils import match_target_quantiles
+from etna.transforms.utils import replace_feature_values
 
 
 class _OneSegmentLinearTrendBaseTransform(OneSegmentTransform):
@@ -135,6 +141,142 @@ class _OneSegmentLinearTrendBaseTransform(OneSegmentTransform):
                 result.loc[:, quantile_column_nm] += trend
         return result
 
+    def _fit_segments(self, df: pd.DataFrame) -> Optional[Dict[str, "_OneSegmentLinearTrendBaseTransform"]]:
+        """Fit copies of the transform on all the segments at once.
+
+        Least squares problems of all the segments are solved together, so it is supported only
+        for :py:class:`sklearn.linear_model.LinearRegression` without positivity constraints.
+
+        Parameters
+        ----------
+        df:
+            dataframe in etna wide format
+
+        Returns
+        -------
+        :
+            fitted transforms for each segment or None if regressor isn't supported
+        """
+        regressor = self._pipeline.named_steps["regressor"]
+        if not isinstance(regressor, LinearRegression) or getattr(regressor, "positive", False):
+            return None
+        segments, y = get_feature_values(df=df, feature=self.in_column)
+        is_valid = ~np.isnan(y)
+        if not np.all(np.any(is_valid, axis=0)):
+            # regressor can't be fitted on the empty segment, the error is raised during fitting segment by segment
+            return None
+
+        x = self._get_x(df)  # (len(df), 1)
+        x_median = np.nanmedian(np.where(is_valid, x, np.NaN), axis=0)
+        x = x - x_median  # (len(df), n_segments)
+        # features are scaled to make the normal equations well-conditioned
+        scale = np.max(np.abs(np.where(is_valid, x, 0)), axis=0)
+        scale[scale == 0] = 1
+        powers = np.arange(1, self.poly_degree + 1)
+        features = np.where(is_valid[..., np.newaxis], (x / scale)[..., np.newaxis] ** powers, 0)
+        y = np.where(is_valid, y, 0)
+
+        counts = is_valid.sum(axis=0)
+        if regressor.fit_intercept:
+            features_mean = features.sum(axis=0) / counts[:, np.newaxis]  # (n_segments, poly_degree)
+            y_mean = y.sum(axis=0) / counts
+            features = np.where(is_valid[..., np.newaxis], features - features_mean, 0)
+            y = np.where(is_valid, y - y_mean, 0)
+        else:
+            features_mean = np.zeros((len(segments), self.poly_degree))
+            y_mean = np.zeros(len(segments))
+
+        # pseudo-inverse gives the minimum norm solution as lstsq for the degenerate segments
+        gram = np.einsum("tmi,tmj->mij", features, features)
+        moments = np.einsum("tmi,tm->mi", features, y)
+        coef = np.einsum("mij,mj->mi", np.linalg.pinv(gram), moments)
+        intercept = y_mean - np.einsum("mi,mi->m", features_mean, coef)
+        coef = coef / scale[:, np.newaxis] ** powers
+
+        polynomial = clone(self._pipeline.named_steps["polynomial"]).fit(np.zeros((1, 1)))
+        segment_transforms = {}
+        for i, segment in enumerate(segments):
+            segment_regressor = copy(regressor)
+            segment_regressor.coef_ = coef[i]
+            segment_regressor.intercept_ = intercept[i] if regressor.fit_intercept else 0.0
+            segment_regressor.n_features_in_ = self.poly_degree
+            segment_transform = copy(self)
+            segment_transform._pipeline = Pipeline([("polynomial", polynomial), ("regressor", segment_regressor)])
+            segment_transform._x_median = x_median[i]
+            segment_transforms[segment] = segment_transform
+        return segment_transforms
+
+    def _get_segments_trend(
+        self, segment_transforms: Dict[str, "OneSegmentTransform"], segments: pd.Index, index: pd.Index
+    ) -> Optional[np.ndarray]:
+        """Get trend of shape ``(len(index), len(segments))`` or None if some regressors aren't linear regressions."""
+        regressors = [
+            segment_transforms[segment]._pipeline.named_steps["regressor"] for segment in segments  # type: ignore
+        ]
+        if not all(isinstance(regressor, LinearRegression) for regressor in regressors):
+            return None
+        coef = np.stack([np.ravel(regressor.coef_) for regressor in regressors])  # (n_segments, poly_degree)
+        intercept = np.array([np.ravel(regressor.intercept_)[0] for regressor in regressors])
+        x_median = np.array([segment_transforms[segment]._x_median for segment in segments])  # type: ignore
+
+        x = self._get_x(pd.DataFrame(index=index)) - x_median  # (len(index), n_segments)
+        powers = np.arange(1, coef.shape[1] + 1)
+        trend = np.einsum("tmi,mi->tm", x[..., np.newaxis] ** powers, coef) + intercept
+        return trend
+
+    def _transform_segments(
+        self, segment_transforms: Dict[str, "OneSegmentTransform"], df: pd.DataFrame
+    ) -> Optional[pd.DataFrame]:
+        """Subtract linear trend from all the segments at once.
+
+        Parameters
+        ----------
+        segment_transforms:
+            fitted transforms for each segment
+        df:
+            dataframe in etna wide format
+
+        Returns
+        -------
+        :
+            residue after trend subtraction or None if some regressors aren't linear regressions
+        """
+        segments, y = get_feature_values(df=df, feature=self.in_column)
+        trend = self._get_segments_trend(segment_transforms=segment_transforms, segments=segments, index=df.index)
+        if trend is None:
+            return None
+        return replace_feature_values(df=df, feature=self.in_column, values=y - trend)
+
+    def _inverse_transform_segments(
+        self, segment_transforms: Dict[str, "OneSegmentTransform"], df: pd.DataFrame
+    ) -> Optional[pd.DataFrame]:
+        """Add linear trend to all the segments at once.
+
+        Parameters
+        ----------
+        segment_transforms:
+            fitted transforms for each segment
+        df:
+            dataframe in etna wide format
+
+        Returns
+        -------
+        :
+            data with reconstructed trend or None if some regressors aren't linear regressions
+        """
+        features = [self.in_column]
+        if self.in_column == "target":
+            features += list(match_target_quantiles(set(df.columns.get_level_values("feature"))))
+
+        result = df
+        for feature in features:
+            segments, y = get_feature_values(df=result, feature=feature)
+            trend = self._get_segments_trend(segment_transforms=segment_transforms, segments=segments, index=df.index)
+            if trend is None:
+                return None
+            result = replace_feature_values(df=result, feature=feature, values=y + trend)
+        return result
+
 
 class LinearTrendTransform(ReversiblePerSegmentWrapper):
     """
@@ -177,6 +177,8 @@ class STLTransform(ReversiblePerSegmentWrapper):
         robust: bool = False,
         model_kwargs: Optional[Dict[str, Any]] = None,
         stl_kwargs: Optional[Dict[str, Any]] = None,
+        n_jobs: int = 1,
+        joblib_params: Optional[Dict[str, Any]] = None,
     ):
         """
         Init STLTransform.
@@ -202,6 +204,10 @@ class STLTransform(ReversiblePerSegmentWrapper):
             parameters for the model like in :py:class:`statsmodels.tsa.seasonal.STLForecast`
         stl_kwargs:
             additional parameters for :py:class:`statsmodels.tsa.seasonal.STLForecast`
+        n_jobs:
+            number of jobs to fit and transform the segments in parallel
+        joblib_params:
+            additional parameters for :py:class:`joblib.Parallel`, by default ``multiprocessing`` backend is used
         """
         self.in_column = in_column
         self.period = period
@@ -219,6 +225,8 @@ class STLTransform(ReversiblePerSegmentWrapper):
                 stl_kwargs=self.stl_kwargs,
             ),
             required_features=[self.in_column],
+            n_jobs=n_jobs,
+            joblib_params=joblib_params,
         )
 
     def get_regressors_info(self) -> List[str]:
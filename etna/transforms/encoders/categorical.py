@@ -74,6 +74,11 @@ class LabelEncoderTransform(IrreversibleTransform):
         self.le = _LabelEncoder()
         self.in_column_regressor: Optional[bool] = None
 
+    @property
+    def required_history(self) -> int:
+        """Transform doesn't use the previous timestamps."""
+        return 0
+
     def get_regressors_info(self) -> List[str]:
         """Return the list with regressors created by the transform."""
         if self.in_column_regressor is None:
@@ -155,6 +160,11 @@ class OneHotEncoderTransform(IrreversibleTransform):
         self.ohe = preprocessing.OneHotEncoder(handle_unknown="ignore", sparse=False, dtype=int)
         self.in_column_regressor: Optional[bool] = None
 
+    @property
+    def required_history(self) -> int:
+        """Transform doesn't use the previous timestamps."""
+        return 0
+
     def get_regressors_info(self) -> List[str]:
         """Return the list with regressors created by the transform."""
         if self.in_column_regressor is None:
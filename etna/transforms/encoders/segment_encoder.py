@@ -81,6 +81,11 @@ class SegmentEncoderTransform(IrreversibleTransform, FutureMixin):
         df = df.sort_index(axis=1)
         return df
 
+    @property
+    def required_history(self) -> int:
+        """Transform doesn't use the previous timestamps."""
+        return 0
+
     def get_regressors_info(self) -> List[str]:
         """Return the list with regressors created by the transform."""
         return ["segment_code"]
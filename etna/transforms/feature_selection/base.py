@@ -20,6 +20,11 @@ class BaseFeatureSelectionTransform(ReversibleTransform, ABC):
         self.return_features = return_features
         self._df_removed: Optional[pd.DataFrame] = None
 
+    @property
+    def required_history(self) -> int:
+        """Transform doesn't use the previous timestamps."""
+        return 0
+
     def get_regressors_info(self) -> List[str]:
         """Return the list with regressors created by the transform."""
         return []
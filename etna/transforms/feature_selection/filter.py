@@ -43,6 +43,11 @@ class FilterFeaturesTransform(ReversibleTransform):
         else:
             raise ValueError("There should be exactly one option set: include or exclude")
 
+    @property
+    def required_history(self) -> int:
+        """Transform doesn't use the previous timestamps."""
+        return 0
+
     def get_regressors_info(self) -> List[str]:
         """Return the list with regressors created by the transform."""
         return []
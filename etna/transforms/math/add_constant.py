@@ -133,6 +133,11 @@ class AddConstTransform(ReversibleTransform):
 
         return result
 
+    @property
+    def required_history(self) -> int:
+        """Transform doesn't use the previous timestamps."""
+        return 0
+
     def get_regressors_info(self) -> List[str]:
         """Return the list with regressors created by the transform."""
         if self.in_column_regressor is None:
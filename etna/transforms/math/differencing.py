@@ -366,6 +366,11 @@ class DifferencingTransform(ReversibleTransform):
         else:
             return self.out_column
 
+    @property
+    def required_history(self) -> int:
+        """Differences require ``period * order`` previous timestamps."""
+        return self.period * self.order
+
     def get_regressors_info(self) -> List[str]:
         """Return the list with regressors created by the transform."""
         if self.in_column_regressor is None:
@@ -398,7 +403,7 @@ class DifferencingTransform(ReversibleTransform):
             if NaNs are present inside the segment
         """
         # this is made because transforms of high order may need some columns created by transforms of lower order
-        result_df = df
+        result_df = df.copy()
         for transform in self._differencing_transforms:
             result_df = transform._fit_transform(result_df)
         self._fit_segments = df.columns.get_level_values("segment").unique().tolist()
@@ -2,12 +2,24 @@ from typing import List
 from typing import Optional
 from typing import Union
 
+import numpy as np
 import pandas as pd
 
 from etna.transforms.base import FutureMixin
 from etna.transforms.base import IrreversibleTransform
 
 
+def _get_lags(x: np.ndarray, lags: List[int]) -> np.ndarray:
+    """Get lags of the float array with shape ``(time, segments)`` as an array with shape ``(time, segments, lags)``."""
+    num_timestamps = x.shape[0]
+    result = np.full((num_timestamps, x.shape[1], len(lags)), fill_value=np.NaN, dtype=x.dtype)
+    for i, lag in enumerate(lags):
+        # values of the lags that are longer than the data are unknown
+        if lag < num_timestamps:
+            result[lag:, :, i] = x[: num_timestamps - lag]
+    return result
+
+
 class LagTransform(IrreversibleTransform, FutureMixin):
     """Generates series of lags from given dataframe."""
 
@@ -80,19 +92,36 @@ class LagTransform(IrreversibleTransform, FutureMixin):
         result: pd.Dataframe
             transformed dataframe
         """
-        result = df
-        segments = sorted(set(df.columns.get_level_values("segment")))
-        all_transformed_features = []
         features = df.loc[:, pd.IndexSlice[:, self.in_column]]
-        for lag in self.lags:
-            column_name = self._get_column_name(lag)
-            transformed_features = features.shift(lag)
-            transformed_features.columns = pd.MultiIndex.from_product([segments, [column_name]])
-            all_transformed_features.append(transformed_features)
-        result = pd.concat([result] + all_transformed_features, axis=1)
+        segments = features.columns.get_level_values("segment")
+        column_names = [self._get_column_name(lag) for lag in self.lags]
+        if all(isinstance(dtype, np.dtype) and dtype.kind == "f" for dtype in features.dtypes):
+            # all the lags of the float columns are computed in one array
+            lags = _get_lags(x=features.to_numpy(), lags=self.lags)
+            transformed_features = pd.DataFrame(
+                lags.reshape(len(df), len(segments) * len(self.lags)),
+                index=df.index,
+                columns=pd.MultiIndex.from_product([segments, column_names], names=["segment", "feature"]),
+            )
+        else:
+            # shift keeps the dtypes of the columns, e.g. categorical or nullable ones
+            all_transformed_features = []
+            for lag, column_name in zip(self.lags, column_names):
+                transformed_features = features.shift(lag)
+                transformed_features.columns = pd.MultiIndex.from_product(
+                    [segments, [column_name]], names=["segment", "feature"]
+                )
+                all_transformed_features.append(transformed_features)
+            transformed_features = pd.concat(all_transformed_features, axis=1)
+        result = pd.concat([df, transformed_features], axis=1)
         result = result.sort_index(axis=1)
         return result
 
+    @property
+    def required_history(self) -> int:
+        """Lags require ``max(lags)`` previous timestamps."""
+        return max(self.lags)
+
     def get_regressors_info(self) -> List[str]:
         """Return the list with regressors created by the transform."""
         return [self._get_column_name(lag) for lag in self.lags]
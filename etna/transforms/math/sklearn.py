@@ -291,6 +291,11 @@ class SklearnTransform(ReversibleTransform):
             raise ValueError(f"'{self.mode}' is not a valid TransformMode.")
         return transformed
 
+    @property
+    def required_history(self) -> int:
+        """Transform doesn't use the previous timestamps."""
+        return 0
+
     def get_regressors_info(self) -> List[str]:
         """Return the list with regressors created by the transform."""
         if self.out_column_regressors is None:
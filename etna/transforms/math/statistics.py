@@ -4,6 +4,7 @@ from typing import List
 from typing import Optional
 
 import bottleneck as bn
+import numba
 import numpy as np
 import pandas as pd
 
@@ -11,6 +12,260 @@ from etna.datasets import TSDataset
 from etna.transforms.base import IrreversibleTransform
 
 
+@numba.njit
+def _rolling_count(x: np.ndarray, window: int, seasonality: int) -> np.ndarray:
+    """Count non-NaN values in each window of ``x`` of shape ``(len(df), n_segments)``.
+
+    Window for the timestamp ``t`` contains values ``t, t - seasonality, ..., t - (window - 1) * seasonality``.
+    """
+    n, m = x.shape
+    counts = np.zeros((n, m), dtype=np.int64)
+    for j in range(m):
+        for r in range(min(seasonality, n)):
+            count = 0
+            for t in range(r, n, seasonality):
+                if not np.isnan(x[t, j]):
+                    count += 1
+                t_old = t - window * seasonality
+                if t_old >= 0 and not np.isnan(x[t_old, j]):
+                    count -= 1
+                counts[t, j] = count
+    return counts
+
+
+@numba.njit
+def _compensated_add(total: float, compensation: float, value: float):
+    """Add value to the sum using Neumaier compensated summation."""
+    new_total = total + value
+    if abs(total) >= abs(value):
+        compensation += (total - new_total) + value
+    else:
+        compensation += (value - new_total) + total
+    return new_total, compensation
+
+
+@numba.njit
+def _rolling_sum(x: np.ndarray, window: int, seasonality: int, power: int, shift: np.ndarray) -> np.ndarray:
+    """Compute sums of ``(x - shift) ** power`` over the windows of ``x`` ignoring NaNs.
+
+    Sum over the window without non-NaN values is zero.
+    """
+    n, m = x.shape
+    result = np.zeros((n, m))
+    for j in range(m):
+        for r in range(min(seasonality, n)):
+            count = 0
+            total = 0.0
+            compensation = 0.0
+            for t in range(r, n, seasonality):
+                value = x[t, j]
+                if not np.isnan(value):
+                    count += 1
+                    total, compensation = _compensated_add(total, compensation, (value - shift[j]) ** power)
+                t_old = t - window * seasonality
+                if t_old >= 0 and not np.isnan(x[t_old, j]):
+                    count -= 1
+                    total, compensation = _compensated_add(total, compensation, -((x[t_old, j] - shift[j]) ** power))
+                if count == 0:
+                    # reset accumulated rounding errors
+                    total = 0.0
+                    compensation = 0.0
+                result[t, j] = total + compensation
+    return result
+
+
+@numba.njit
+def _rolling_extremum(x: np.ndarray, window: int, seasonality: int, is_max: bool) -> np.ndarray:
+    """Compute max or min over the windows of ``x`` ignoring NaNs using monotonic deque.
+
+    Extremum over the window without non-NaN values is NaN.
+    """
+    n, m = x.shape
+    result = np.full((n, m), np.nan)
+    # deque of indices with monotonic values, it is stored in array as window can't contain more than n values
+    deque = np.empty(n, dtype=np.int64)
+    for j in range(m):
+        for r in range(min(seasonality, n)):
+            head = 0
+            tail = 0
+            for t in range(r, n, seasonality):
+                t_old = t - window * seasonality
+                while head < tail and deque[head] <= t_old:
+                    head += 1
+                value = x[t, j]
+                if not np.isnan(value):
+                    if is_max:
+                        while head < tail and x[deque[tail - 1], j] <= value:
+                            tail -= 1
+                    else:
+                        while head < tail and x[deque[tail - 1], j] >= value:
+                            tail -= 1
+                    deque[tail] = t
+                    tail += 1
+                if head < tail:
+                    result[t, j] = x[deque[head], j]
+    return result
+
+
+@numba.njit
+def _fenwick_add(tree: np.ndarray, rank: int, value):
+    """Add value to the element with given rank of the Fenwick tree."""
+    i = rank + 1
+    while i < len(tree):
+        tree[i] += value
+        i += i & -i
+
+
+@numba.njit
+def _fenwick_prefix(tree: np.ndarray, rank: int):
+    """Get sum of the elements of the Fenwick tree with rank less than given one."""
+    # element with zero index isn't used by the tree and always equals zero
+    total = tree[0]
+    i = rank
+    while i > 0:
+        total += tree[i]
+        i -= i & -i
+    return total
+
+
+@numba.njit
+def _fenwick_find(tree: np.ndarray, k: int) -> int:
+    """Find rank of the k-th (starting from zero) element in Fenwick tree of counts."""
+    rank = 0
+    step = 1
+    while step * 2 < len(tree):
+        step *= 2
+    while step > 0:
+        if rank + step < len(tree) and tree[rank + step] <= k:
+            rank += step
+            k -= tree[rank]
+        step //= 2
+    return rank
+
+
+@numba.njit
+def _get_ranks(x: np.ndarray):
+    """Get values of ``x`` in sorted order and ranks of elements of ``x`` in it, NaNs are put in the end."""
+    order = np.argsort(x)
+    ranks = np.empty(len(x), dtype=np.int64)
+    for i in range(len(x)):
+        ranks[order[i]] = i
+    return x[order], ranks
+
+
+@numba.njit
+def _rolling_quantile_1d(x: np.ndarray, window: int, quantile: float) -> np.ndarray:
+    """Compute quantile over the windows of one-dimensional ``x`` ignoring NaNs.
+
+    Window contains values in the Fenwick tree of counts indexed by the ranks of values,
+    so each update and each search of the order statistic takes O(log(len(x))) time.
+    """
+    n = len(x)
+    result = np.full(n, np.nan)
+    sorted_values, ranks = _get_ranks(x)
+    counts_tree = np.zeros(n + 1, dtype=np.int64)
+    count = 0
+    for t in range(n):
+        if not np.isnan(x[t]):
+            _fenwick_add(counts_tree, ranks[t], 1)
+            count += 1
+        t_old = t - window
+        if t_old >= 0 and not np.isnan(x[t_old]):
+            _fenwick_add(counts_tree, ranks[t_old], -1)
+            count -= 1
+        if count == 0:
+            continue
+
+        # linear interpolation between order statistics as in np.nanquantile
+        virtual_index = quantile * (count - 1)
+        lower_index = int(np.floor(virtual_index))
+        fraction = virtual_index - lower_index
+        lower = sorted_values[_fenwick_find(counts_tree, lower_index)]
+        if fraction == 0:
+            result[t] = lower
+            continue
+        upper = sorted_values[_fenwick_find(counts_tree, lower_index + 1)]
+        if fraction < 0.5:
+            result[t] = lower + (upper - lower) * fraction
+        else:
+            result[t] = upper - (upper - lower) * (1 - fraction)
+    return result
+
+
+@numba.njit
+def _rolling_mad_1d(x: np.ndarray, window: int) -> np.ndarray:
+    """Compute mean absolute deviation over the windows of one-dimensional ``x`` ignoring NaNs.
+
+    Window contains values in the Fenwick trees of counts and sums indexed by the ranks of values,
+    so the sum of deviations is computed from the count and the sum of values below the window's mean.
+    """
+    n = len(x)
+    result = np.full(n, np.nan)
+    sorted_values, ranks = _get_ranks(x)
+    num_valid = n - np.sum(np.isnan(x))
+    if num_valid > 0:
+        # values are shifted to reduce the cancellation error, deviations don't depend on shift
+        sorted_values = sorted_values - sorted_values[0]
+    counts_tree = np.zeros(n + 1, dtype=np.int64)
+    sums_tree = np.zeros(n + 1)
+    count = 0
+    for t in range(n):
+        if not np.isnan(x[t]):
+            _fenwick_add(counts_tree, ranks[t], 1)
+            _fenwick_add(sums_tree, ranks[t], sorted_values[ranks[t]])
+            count += 1
+        t_old = t - window
+        if t_old >= 0 and not np.isnan(x[t_old]):
+            _fenwick_add(counts_tree, ranks[t_old], -1)
+            _fenwick_add(sums_tree, ranks[t_old], -sorted_values[ranks[t_old]])
+            count -= 1
+        if count == 0:
+            continue
+
+        total = _fenwick_prefix(sums_tree, num_valid)
+        mean = total / count
+        rank = np.searchsorted(sorted_values[:num_valid], mean)
+        count_below = _fenwick_prefix(counts_tree, rank)
+        sum_below = _fenwick_prefix(sums_tree, rank)
+        sum_above = total - sum_below
+        deviations_sum = (sum_above - mean * (count - count_below)) + (mean * count_below - sum_below)
+        result[t] = max(deviations_sum, 0.0) / count
+    return result
+
+
+@numba.njit(parallel=True)
+def _rolling_quantile(x: np.ndarray, window: int, seasonality: int, quantile: float) -> np.ndarray:
+    """Compute quantile over the windows of ``x`` ignoring NaNs in parallel over the segments."""
+    n, m = x.shape
+    result = np.full((n, m), np.nan)
+    for j in numba.prange(m):
+        for r in range(min(seasonality, n)):
+            result[r::seasonality, j] = _rolling_quantile_1d(
+                np.ascontiguousarray(x[r::seasonality, j]), window, quantile
+            )
+    return result
+
+
+@numba.njit(parallel=True)
+def _rolling_mad(x: np.ndarray, window: int, seasonality: int) -> np.ndarray:
+    """Compute mean absolute deviation over the windows of ``x`` ignoring NaNs in parallel over the segments."""
+    n, m = x.shape
+    result = np.full((n, m), np.nan)
+    for j in numba.prange(m):
+        for r in range(min(seasonality, n)):
+            result[r::seasonality, j] = _rolling_mad_1d(np.ascontiguousarray(x[r::seasonality, j]), window)
+    return result
+
+
+def _get_first_valid_values(x: np.ndarray) -> np.ndarray:
+    """Get first non-NaN value of each column of ``x``, zero for columns without non-NaN values."""
+    if len(x) == 0:
+        return np.zeros(x.shape[1])
+    isnan = np.isnan(x)
+    first_valid = x[np.argmin(isnan, axis=0), np.arange(x.shape[1])]
+    return np.where(np.all(isnan, axis=0), 0.0, first_valid)
+
+
 class WindowStatisticsTransform(IrreversibleTransform, ABC):
     """WindowStatisticsTransform handles computation of statistical features on windows."""
 
@@ -67,6 +322,38 @@ class WindowStatisticsTransform(IrreversibleTransform, ABC):
         """Aggregate targets from given series."""
         pass
 
+    def _aggregate_rolling(self, x: np.ndarray, window: int, counts: np.ndarray) -> Optional[np.ndarray]:
+        """Aggregate windows of ``x`` with streaming kernel in O(len(df)) time.
+
+        Parameters
+        ----------
+        x:
+            array of shape ``(len(df), n_segments)`` with values to aggregate
+        window:
+            number of values in each window
+        counts:
+            array of shape ``(len(df), n_segments)`` with number of non-NaN values in each window
+
+        Returns
+        -------
+        :
+            array of shape ``(len(df), n_segments)`` with aggregations or None if there is no streaming kernel,
+            in this case :py:meth:`_aggregate` is applied to the materialized windows
+        """
+        return None
+
+    def _aggregate_sliding_window(self, x: np.ndarray) -> np.ndarray:
+        """Aggregate windows of ``x`` with :py:meth:`_aggregate` applied to the materialized windows."""
+        history = self.seasonality * self.window if self.window != -1 else len(x)
+        x = x[::-1]
+
+        # Addend NaNs to obtain a window of length "history" for each point
+        x = np.append(x, np.empty((history - 1, x.shape[1])) * np.nan, axis=0)
+        x = np.lib.stride_tricks.sliding_window_view(x, window_shape=(history, 1))[:, :, :: self.seasonality]
+        x = np.squeeze(x, axis=-1)  # (len(df), n_segments, window)
+        y = self._aggregate(series=x)  # (len(df), n_segments)
+        return y[::-1]
+
     def _transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Compute feature's value.
 
@@ -80,25 +367,21 @@ class WindowStatisticsTransform(IrreversibleTransform, ABC):
         result: pd.DataFrame
             dataframe with results
         """
-        history = self.seasonality * self.window if self.window != -1 else len(df)
         segments = sorted(df.columns.get_level_values("segment").unique())
 
         df_slice = df.loc[:, pd.IndexSlice[:, self.in_column]].sort_index(axis=1)
-        x = df_slice.values[::-1]
-
-        # Addend NaNs to obtain a window of length "history" for each point
-        x = np.append(x, np.empty((history - 1, x.shape[1])) * np.nan, axis=0)
-        isnan = np.isnan(x)
-
-        isnan = np.lib.stride_tricks.sliding_window_view(isnan, window_shape=(history, 1))[:, :, :: self.seasonality]
-        isnan = np.squeeze(isnan, axis=-1)  # (len(df), n_segments, window)
-        non_nan_per_window_counts = bn.nansum(~isnan, axis=2)  # (len(df), n_segments)
+        x = df_slice.to_numpy(dtype=float)  # (len(df), n_segments)
 
-        x = np.lib.stride_tricks.sliding_window_view(x, window_shape=(history, 1))[:, :, :: self.seasonality]
-        x = np.squeeze(x, axis=-1)  # (len(df), n_segments, window)
-        y = self._aggregate(series=x)  # (len(df), n_segments)
+        window = self.window if self.window != -1 else len(df)
+        non_nan_per_window_counts = _rolling_count(x, window, self.seasonality)  # (len(df), n_segments)
+        y = self._aggregate_rolling(x=x, window=window, counts=non_nan_per_window_counts)
+        if y is None:
+            y = self._aggregate_sliding_window(x=x)
         y[non_nan_per_window_counts < self.min_periods] = np.nan
-        y = np.nan_to_num(y, copy=False, nan=self.fillna)[::-1]
+        y = np.nan_to_num(y, copy=False, nan=self.fillna)
+        # aggregations are computed in float64 for precision, but the result keeps the float dtype of the input
+        if all(isinstance(dtype, np.dtype) and dtype.kind == "f" for dtype in df_slice.dtypes):
+            y = y.astype(np.result_type(*df_slice.dtypes), copy=False)
 
         result = df.join(
             pd.DataFrame(y, columns=pd.MultiIndex.from_product([segments, [self.out_column_name]]), index=df.index)
@@ -106,6 +389,11 @@ class WindowStatisticsTransform(IrreversibleTransform, ABC):
         result = result.sort_index(axis=1)
         return result
 
+    @property
+    def required_history(self) -> Optional[int]:
+        """Window requires ``seasonality * (window - 1)`` previous timestamps or all the history if ``window=-1``."""
+        return self.seasonality * (self.window - 1) if self.window != -1 else None
+
     def get_regressors_info(self) -> List[str]:
         """Return the list with regressors created by the transform."""
         if self.in_column_regressor is None:
@@ -193,6 +481,15 @@ class MeanTransform(WindowStatisticsTransform):
             mean[:, segment] = bn.nanmean(series[:, segment] * self._alpha_range, axis=1)
         return mean
 
+    def _aggregate_rolling(self, x: np.ndarray, window: int, counts: np.ndarray) -> Optional[np.ndarray]:
+        """Compute average over the windows using rolling sums, weighted average isn't supported."""
+        if self.alpha != 1:
+            return None
+        sums = _rolling_sum(x, window, self.seasonality, 1, np.zeros(x.shape[1]))
+        mean = np.full(x.shape, np.nan)
+        np.divide(sums, counts, out=mean, where=counts > 0)
+        return mean
+
 
 class StdTransform(WindowStatisticsTransform):
     """StdTransform computes std value for given window.
@@ -253,6 +550,18 @@ class StdTransform(WindowStatisticsTransform):
         series = bn.nanstd(series, axis=2, ddof=self.ddof)
         return series
 
+    def _aggregate_rolling(self, x: np.ndarray, window: int, counts: np.ndarray) -> Optional[np.ndarray]:
+        """Compute std over the windows using rolling sums of values and their squares."""
+        # values are shifted by the first value of the segment to reduce the cancellation error
+        shift = _get_first_valid_values(x)
+        sums = _rolling_sum(x, window, self.seasonality, 1, shift)
+        squares_sums = _rolling_sum(x, window, self.seasonality, 2, shift)
+        std = np.full(x.shape, np.nan)
+        is_valid = counts > self.ddof
+        variance = (squares_sums[is_valid] - sums[is_valid] ** 2 / counts[is_valid]) / (counts[is_valid] - self.ddof)
+        std[is_valid] = np.sqrt(np.maximum(variance, 0))
+        return std
+
 
 class QuantileTransform(WindowStatisticsTransform):
     """QuantileTransform computes quantile value for given window."""
@@ -309,6 +618,10 @@ class QuantileTransform(WindowStatisticsTransform):
         series = np.apply_along_axis(np.nanquantile, axis=2, arr=series, q=self.quantile)
         return series
 
+    def _aggregate_rolling(self, x: np.ndarray, window: int, counts: np.ndarray) -> Optional[np.ndarray]:
+        """Compute quantile over the windows using sliding order statistics."""
+        return _rolling_quantile(x, window, self.seasonality, self.quantile)
+
 
 class MinTransform(WindowStatisticsTransform):
     """MinTransform computes min value for given window."""
@@ -360,6 +673,10 @@ class MinTransform(WindowStatisticsTransform):
         series = bn.nanmin(series, axis=2)
         return series
 
+    def _aggregate_rolling(self, x: np.ndarray, window: int, counts: np.ndarray) -> Optional[np.ndarray]:
+        """Compute min over the windows using monotonic deque."""
+        return _rolling_extremum(x, window, self.seasonality, False)
+
 
 class MaxTransform(WindowStatisticsTransform):
     """MaxTransform computes max value for given window."""
@@ -411,6 +728,10 @@ class MaxTransform(WindowStatisticsTransform):
         series = bn.nanmax(series, axis=2)
         return series
 
+    def _aggregate_rolling(self, x: np.ndarray, window: int, counts: np.ndarray) -> Optional[np.ndarray]:
+        """Compute max over the windows using monotonic deque."""
+        return _rolling_extremum(x, window, self.seasonality, True)
+
 
 class MedianTransform(WindowStatisticsTransform):
     """MedianTransform computes median value for given window."""
@@ -462,6 +783,10 @@ class MedianTransform(WindowStatisticsTransform):
         series = bn.nanmedian(series, axis=2)
         return series
 
+    def _aggregate_rolling(self, x: np.ndarray, window: int, counts: np.ndarray) -> Optional[np.ndarray]:
+        """Compute median over the windows using sliding order statistics."""
+        return _rolling_quantile(x, window, self.seasonality, 0.5)
+
 
 class MADTransform(WindowStatisticsTransform):
     """MADTransform computes Mean Absolute Deviation over the window."""
@@ -519,6 +844,10 @@ class MADTransform(WindowStatisticsTransform):
             mad[:, segment] = bn.nanmean(ad, axis=1)
         return mad
 
+    def _aggregate_rolling(self, x: np.ndarray, window: int, counts: np.ndarray) -> Optional[np.ndarray]:
+        """Compute MAD over the windows using sliding order statistics."""
+        return _rolling_mad(x, window, self.seasonality)
+
 
 class MinMaxDifferenceTransform(WindowStatisticsTransform):
     """MinMaxDifferenceTransform computes difference between max and min values for given window."""
@@ -572,6 +901,12 @@ class MinMaxDifferenceTransform(WindowStatisticsTransform):
         result = max_values - min_values
         return result
 
+    def _aggregate_rolling(self, x: np.ndarray, window: int, counts: np.ndarray) -> Optional[np.ndarray]:
+        """Compute difference between max and min over the windows using monotonic deques."""
+        max_values = _rolling_extremum(x, window, self.seasonality, True)
+        min_values = _rolling_extremum(x, window, self.seasonality, False)
+        return max_values - min_values
+
 
 class SumTransform(WindowStatisticsTransform):
     """SumTransform computes sum of values over given window."""
@@ -624,6 +959,10 @@ class SumTransform(WindowStatisticsTransform):
         series = bn.nansum(series, axis=2)
         return series
 
+    def _aggregate_rolling(self, x: np.ndarray, window: int, counts: np.ndarray) -> Optional[np.ndarray]:
+        """Compute sum over the windows using rolling sums."""
+        return _rolling_sum(x, window, self.seasonality, 1, np.zeros(x.shape[1]))
+
 
 __all__ = [
     "MedianTransform",
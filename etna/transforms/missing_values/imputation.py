@@ -1,4 +1,6 @@
+from copy import copy
 from enum import Enum
+from typing import Dict
 from typing import List
 from typing import Optional
 
@@ -7,6 +9,8 @@ import pandas as pd
 
 from etna.transforms.base import OneSegmentTransform
 from etna.transforms.base import ReversiblePerSegmentWrapper
+from etna.transforms.utils import get_feature_values
+from etna.transforms.utils import replace_feature_values
 
 
 class ImputerMode(str, Enum):
@@ -156,6 +160,117 @@ class _OneSegmentTimeSeriesImputerTransform(OneSegmentTransform):
         result_df.loc[index, self.in_column] = np.nan
         return result_df
 
+    def _fit_segments(self, df: pd.DataFrame) -> Dict[str, "_OneSegmentTimeSeriesImputerTransform"]:
+        """Fit copies of the transform on all the segments at once.
+
+        Parameters
+        ----------
+        df:
+            dataframe in etna wide format
+
+        Returns
+        -------
+        :
+            fitted transforms for each segment
+        """
+        segments, x = get_feature_values(df=df, feature=self.in_column)
+        isnan = np.isnan(x)
+        if np.any(np.all(isnan, axis=0)):
+            raise ValueError("Series hasn't non NaN values which means it is empty and can't be filled.")
+
+        # NaNs before the first non NaN value aren't filled
+        nan_mask = isnan & (np.cumsum(~isnan, axis=0) > 0)
+        fill_values = np.nanmean(x, axis=0) if self.strategy == ImputerMode.mean else None
+
+        segment_transforms = {}
+        for i, segment in enumerate(segments):
+            segment_transform = copy(self)
+            segment_transform.nan_timestamps = df.index[nan_mask[:, i]]
+            if self.strategy == ImputerMode.constant:
+                segment_transform.fill_value = self.constant_value
+            elif fill_values is not None:
+                segment_transform.fill_value = fill_values[i]
+            segment_transforms[segment] = segment_transform
+        return segment_transforms
+
+    @staticmethod
+    def _get_nan_timestamps_mask(
+        segment_transforms: Dict[str, "_OneSegmentTimeSeriesImputerTransform"], segments: pd.Index, index: pd.Index
+    ) -> np.ndarray:
+        """Get mask of shape ``(len(index), len(segments))`` with NaN timestamps found during fit."""
+        nan_timestamps = [segment_transforms[segment].nan_timestamps for segment in segments]
+        segment_positions = np.repeat(np.arange(len(segments)), [len(timestamps) for timestamps in nan_timestamps])
+        all_nan_timestamps = np.concatenate([np.asarray(timestamps) for timestamps in nan_timestamps])
+        timestamp_positions = index.get_indexer(all_nan_timestamps)
+        is_present = timestamp_positions >= 0
+
+        mask = np.zeros((len(index), len(segments)), dtype=bool)
+        mask[timestamp_positions[is_present], segment_positions[is_present]] = True
+        return mask
+
+    def _transform_segments(
+        self, segment_transforms: Dict[str, "OneSegmentTransform"], df: pd.DataFrame
+    ) -> Optional[pd.DataFrame]:
+        """Transform all the segments at once.
+
+        Strategies "running_mean" and "seasonal" aren't supported, they are applied segment by segment.
+
+        Parameters
+        ----------
+        segment_transforms:
+            fitted transforms for each segment
+        df:
+            dataframe in etna wide format
+
+        Returns
+        -------
+        :
+            dataframe with in_column series with filled gaps or None if strategy isn't supported
+        """
+        if self.strategy not in {ImputerMode.mean, ImputerMode.constant, ImputerMode.forward_fill}:
+            return None
+
+        segments, x = get_feature_values(df=df, feature=self.in_column)
+        isnan = np.isnan(x)
+        if self.strategy == ImputerMode.forward_fill:
+            filled = pd.DataFrame(x).fillna(method="ffill").to_numpy()
+        else:
+            fill_values = np.array([segment_transforms[segment].fill_value for segment in segments], dtype=float)
+            filled = np.where(isnan, fill_values, x)
+        if self.default_value:
+            filled = np.where(np.isnan(filled), self.default_value, filled)
+
+        # restore nans not in nan_timestamps
+        nan_mask = self._get_nan_timestamps_mask(
+            segment_transforms=segment_transforms, segments=segments, index=df.index  # type: ignore
+        )
+        filled[isnan & ~nan_mask] = np.nan
+        return replace_feature_values(df=df, feature=self.in_column, values=filled)
+
+    def _inverse_transform_segments(
+        self, segment_transforms: Dict[str, "OneSegmentTransform"], df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Inverse transform all the segments at once.
+
+        Parameters
+        ----------
+        segment_transforms:
+            fitted transforms for each segment
+        df:
+            dataframe in etna wide format
+
+        Returns
+        -------
+        :
+            dataframe with in_column series with initial values
+        """
+        segments, x = get_feature_values(df=df, feature=self.in_column)
+        nan_mask = self._get_nan_timestamps_mask(
+            segment_transforms=segment_transforms, segments=segments, index=df.index  # type: ignore
+        )
+        x[nan_mask] = np.nan
+        return replace_feature_values(df=df, feature=self.in_column, values=x)
+
     def _fill(self, df: pd.Series) -> pd.Series:
         """
         Create new Series taking all previous dates and adding missing dates.
@@ -30,6 +30,11 @@ class OutliersTransform(ReversibleTransform, ABC):
         self.original_values: Optional[Dict[str, List[pd.Timestamp]]] = None
         self._fit_segments: Optional[List[str]] = None
 
+    @property
+    def required_history(self) -> int:
+        """Transform doesn't use the previous timestamps."""
+        return 0
+
     def get_regressors_info(self) -> List[str]:
         """Return the list with regressors created by the transform.
 
@@ -1,5 +1,5 @@
 from copy import deepcopy
-from math import ceil
+from typing import Callable
 from typing import List
 from typing import Optional
 from typing import Sequence
@@ -9,6 +9,8 @@ import pandas as pd
 
 from etna.transforms.base import FutureMixin
 from etna.transforms.base import IrreversibleTransform
+from etna.transforms.timestamp.utils import get_calendar_feature
+from etna.transforms.timestamp.utils import get_unique_days
 
 
 class DateFlagsTransform(IrreversibleTransform, FutureMixin):
@@ -144,6 +146,11 @@ class DateFlagsTransform(IrreversibleTransform, FutureMixin):
         else:
             return f"{self.out_column}_{feature_name}"
 
+    @property
+    def required_history(self) -> int:
+        """Transform doesn't use the previous timestamps."""
+        return 0
+
     def get_regressors_info(self) -> List[str]:
         """Return the list with regressors created by the transform."""
         features = [
@@ -182,168 +189,165 @@ class DateFlagsTransform(IrreversibleTransform, FutureMixin):
             dataframe with extracted features
         """
         features = pd.DataFrame(index=df.index)
-        timestamp_series = pd.Series(df.index)
 
         if self.day_number_in_week:
-            features[self._get_column_name("day_number_in_week")] = self._get_day_number_in_week(
-                timestamp_series=timestamp_series
+            features[self._get_column_name("day_number_in_week")] = self._get_flag(
+                index=df.index, get_flag=self._get_day_number_in_week
             )
 
         if self.day_number_in_month:
-            features[self._get_column_name("day_number_in_month")] = self._get_day_number_in_month(
-                timestamp_series=timestamp_series
+            features[self._get_column_name("day_number_in_month")] = self._get_flag(
+                index=df.index, get_flag=self._get_day_number_in_month
             )
 
         if self.day_number_in_year:
-            features[self._get_column_name("day_number_in_year")] = self._get_day_number_in_year(
-                timestamp_series=timestamp_series
+            features[self._get_column_name("day_number_in_year")] = self._get_flag(
+                index=df.index, get_flag=self._get_day_number_in_year
             )
 
         if self.week_number_in_month:
-            features[self._get_column_name("week_number_in_month")] = self._get_week_number_in_month(
-                timestamp_series=timestamp_series
+            features[self._get_column_name("week_number_in_month")] = self._get_flag(
+                index=df.index, get_flag=self._get_week_number_in_month
             )
 
         if self.week_number_in_year:
-            features[self._get_column_name("week_number_in_year")] = self._get_week_number_in_year(
-                timestamp_series=timestamp_series
+            features[self._get_column_name("week_number_in_year")] = self._get_flag(
+                index=df.index, get_flag=self._get_week_number_in_year
             )
 
         if self.month_number_in_year:
-            features[self._get_column_name("month_number_in_year")] = self._get_month_number_in_year(
-                timestamp_series=timestamp_series
+            features[self._get_column_name("month_number_in_year")] = self._get_flag(
+                index=df.index, get_flag=self._get_month_number_in_year
             )
 
         if self.season_number:
-            features[self._get_column_name("season_number")] = self._get_season_number(
-                timestamp_series=timestamp_series
+            features[self._get_column_name("season_number")] = self._get_flag(
+                index=df.index, get_flag=self._get_season_number
             )
 
         if self.year_number:
-            features[self._get_column_name("year_number")] = self._get_year(timestamp_series=timestamp_series)
+            features[self._get_column_name("year_number")] = self._get_flag(index=df.index, get_flag=self._get_year)
 
         if self.is_weekend:
-            features[self._get_column_name("is_weekend")] = self._get_weekends(timestamp_series=timestamp_series)
+            features[self._get_column_name("is_weekend")] = self._get_flag(index=df.index, get_flag=self._get_weekends)
 
         if self.special_days_in_week:
-            features[self._get_column_name("special_days_in_week")] = self._get_special_day_in_week(
-                special_days=self.special_days_in_week, timestamp_series=timestamp_series
+            features[self._get_column_name("special_days_in_week")] = self._get_flag(
+                index=df.index, get_flag=self._get_special_day_in_week, special_days=tuple(self.special_days_in_week)
             )
 
         if self.special_days_in_month:
-            features[self._get_column_name("special_days_in_month")] = self._get_special_day_in_month(
-                special_days=self.special_days_in_month, timestamp_series=timestamp_series
+            features[self._get_column_name("special_days_in_month")] = self._get_flag(
+                index=df.index, get_flag=self._get_special_day_in_month, special_days=tuple(self.special_days_in_month)
             )
 
-        for feature in features.columns:
-            features[feature] = features[feature].astype("category")
-
-        dataframes = []
-        for seg in df.columns.get_level_values("segment").unique():
-            tmp = df[seg].join(features)
-            _idx = tmp.columns.to_frame()
-            _idx.insert(0, "segment", seg)
-            tmp.columns = pd.MultiIndex.from_frame(_idx)
-            dataframes.append(tmp)
+        segments = df.columns.get_level_values("segment").unique()
+        segments_features = pd.concat([features] * len(segments), axis=1, keys=segments)
 
-        result = pd.concat(dataframes, axis=1).sort_index(axis=1)
+        result = pd.concat([df, segments_features], axis=1).sort_index(axis=1)
         result.columns.names = ["segment", "feature"]
         return result
 
     @staticmethod
-    def _get_special_day_in_week(special_days: Sequence[int], timestamp_series: pd.Series) -> np.ndarray:
+    def _get_flag(index: pd.DatetimeIndex, get_flag: Callable[..., np.ndarray], **params) -> pd.Categorical:
+        """Get the flag for the index from the calendar cache.
+
+        Flag is computed once for each unique day of the index and mapped to the timestamps of the index.
+        """
+
+        def compute(index: pd.DatetimeIndex) -> np.ndarray:
+            days, day_indices = get_unique_days(index=index)
+            return get_flag(days=days, **params)[day_indices]
+
+        spec = ("date_flags", get_flag.__name__, tuple(params.items()))
+        return pd.Categorical(get_calendar_feature(index=index, spec=spec, compute=compute))
+
+    @staticmethod
+    def _get_special_day_in_week(special_days: Sequence[int], days: np.ndarray) -> np.ndarray:
         """Return array with special days marked 1.
 
         Accepts a list of special days IN WEEK as input and returns array where these days are marked with 1
         """
-        return timestamp_series.apply(lambda x: x.weekday() in special_days).values
+        return np.isin(DateFlagsTransform._get_day_number_in_week(days=days), list(special_days))
 
     @staticmethod
-    def _get_special_day_in_month(special_days: Sequence[int], timestamp_series: pd.Series) -> np.ndarray:
+    def _get_special_day_in_month(special_days: Sequence[int], days: np.ndarray) -> np.ndarray:
         """Return array with special days marked 1.
 
         Accepts a list of special days IN MONTH as input and returns array where these days are marked with 1
         """
-        return timestamp_series.apply(lambda x: x.day in special_days).values
+        return np.isin(DateFlagsTransform._get_day_number_in_month(days=days), list(special_days))
 
     @staticmethod
-    def _get_day_number_in_week(timestamp_series: pd.Series) -> np.ndarray:
+    def _get_day_number_in_week(days: np.ndarray) -> np.ndarray:
         """Generate an array with the number of the day in the week."""
-        return timestamp_series.apply(lambda x: x.weekday()).values
+        # 1970-01-01 is a Thursday
+        return (days.astype(np.int64) + 3) % 7
 
     @staticmethod
-    def _get_day_number_in_month(timestamp_series: pd.Series) -> np.ndarray:
+    def _get_day_number_in_month(days: np.ndarray) -> np.ndarray:
         """Generate an array with the number of the day in the month."""
-        return timestamp_series.apply(lambda x: x.day).values
+        return (days - days.astype("datetime64[M]")).astype(np.int64) + 1
 
     @staticmethod
-    def _get_season_number(timestamp_series: pd.Series) -> np.ndarray:
+    def _get_season_number(days: np.ndarray) -> np.ndarray:
         """Generate an array with the season number."""
-        return timestamp_series.apply(lambda x: x.month % 12 // 3 + 1).values
+        return DateFlagsTransform._get_month_number_in_year(days=days) % 12 // 3 + 1
 
     @staticmethod
-    def _get_day_number_in_year(timestamp_series: pd.Series) -> np.ndarray:
+    def _get_day_number_in_year(days: np.ndarray) -> np.ndarray:
         """Generate an array with number of day in a year with leap year numeration (values from 1 to 366)."""
-
-        def leap_year_number(dt: pd.Timestamp) -> int:
-            """Return day number with leap year numeration."""
-            day_of_year = dt.dayofyear
-            if not dt.is_leap_year and dt.month >= 3:
-                return day_of_year + 1
-            else:
-                return day_of_year
-
-        return timestamp_series.apply(leap_year_number).values
+        day_of_year = (days - days.astype("datetime64[Y]")).astype(np.int64) + 1
+        year = DateFlagsTransform._get_year(days=days)
+        is_leap_year = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+        is_after_february = DateFlagsTransform._get_month_number_in_year(days=days) >= 3
+        return day_of_year + (~is_leap_year & is_after_february)
 
     @staticmethod
-    def _get_week_number_in_month(timestamp_series: pd.Series) -> np.ndarray:
-        """Generate an array with the week number in the month."""
-
-        def week_of_month(dt: pd.Timestamp) -> int:
-            """Return week of month number.
-
-            How it works:
-            Each month starts with the week number 1, no matter which weekday the 1st day is, for example
+    def _get_week_number_in_month(days: np.ndarray) -> np.ndarray:
+        """Generate an array with the week number in the month.
 
-            * 2021-01-01 is a Friday, we mark it as 1st week
-            * 2021-01-02 is a Saturday, 1st week
-            * 2021-01-03 is a Sunday, 1st week
-            * 2021-01-04 is a Monday, 2nd week
-            * ...
-            * 2021-01-10 is a Sunday, 2nd week
-            * 2021-01-11 is a Monday, 3rd week
-            * ...
+        How it works:
+        Each month starts with the week number 1, no matter which weekday the 1st day is, for example
 
-            """
-            first_day = dt.replace(day=1)
+        * 2021-01-01 is a Friday, we mark it as 1st week
+        * 2021-01-02 is a Saturday, 1st week
+        * 2021-01-03 is a Sunday, 1st week
+        * 2021-01-04 is a Monday, 2nd week
+        * ...
+        * 2021-01-10 is a Sunday, 2nd week
+        * 2021-01-11 is a Monday, 3rd week
+        * ...
 
-            dom = dt.day
-            adjusted_dom = dom + first_day.weekday()
-
-            return int(ceil(adjusted_dom / 7.0))
-
-        return timestamp_series.apply(week_of_month).values
+        """
+        first_days = days.astype("datetime64[M]").astype("datetime64[D]")
+        day_number_in_month = DateFlagsTransform._get_day_number_in_month(days=days)
+        first_day_number_in_week = DateFlagsTransform._get_day_number_in_week(days=first_days)
+        return (day_number_in_month + first_day_number_in_week + 6) // 7
 
     @staticmethod
-    def _get_week_number_in_year(timestamp_series: pd.Series) -> np.ndarray:
-        """Generate an array with the week number in the year."""
-        return timestamp_series.apply(lambda x: x.weekofyear).values
+    def _get_week_number_in_year(days: np.ndarray) -> np.ndarray:
+        """Generate an array with the ISO week number in the year."""
+        # ISO week belongs to the year of its Thursday
+        thursdays = days + (3 - DateFlagsTransform._get_day_number_in_week(days=days))
+        first_days = thursdays.astype("datetime64[Y]").astype("datetime64[D]")
+        return (thursdays - first_days).astype(np.int64) // 7 + 1
 
     @staticmethod
-    def _get_month_number_in_year(timestamp_series: pd.Series) -> np.ndarray:
-        """Generate an array with the week number in the year."""
-        return timestamp_series.apply(lambda x: x.month).values
+    def _get_month_number_in_year(days: np.ndarray) -> np.ndarray:
+        """Generate an array with the month number in the year."""
+        return days.astype("datetime64[M]").astype(np.int64) % 12 + 1
 
     @staticmethod
-    def _get_year(timestamp_series: pd.Series) -> np.ndarray:
-        """Generate an array with the week number in the year."""
-        return timestamp_series.apply(lambda x: x.year).values
+    def _get_year(days: np.ndarray) -> np.ndarray:
+        """Generate an array with the year number."""
+        return days.astype("datetime64[Y]").astype(np.int64) + 1970
 
     @staticmethod
-    def _get_weekends(timestamp_series: pd.Series) -> np.ndarray:
+    def _get_weekends(days: np.ndarray) -> np.ndarray:
         """Generate an array with the weekends flags."""
-        weekend_days = (5, 6)
-        return timestamp_series.apply(lambda x: x.weekday() in weekend_days).values
+        weekend_days = [5, 6]
+        return np.isin(DateFlagsTransform._get_day_number_in_week(days=days), weekend_days)
 
 
 __all__ = ["DateFlagsTransform"]
@@ -1,4 +1,5 @@
 import math
+from functools import partial
 from typing import List
 from typing import Optional
 from typing import Sequence
@@ -8,6 +9,7 @@ import pandas as pd
 
 from etna.transforms.base import FutureMixin
 from etna.transforms.base import IrreversibleTransform
+from etna.transforms.timestamp.utils import get_calendar_feature
 
 
 class FourierTransform(IrreversibleTransform, FutureMixin):
@@ -115,15 +117,10 @@ class FourierTransform(IrreversibleTransform, FutureMixin):
 
     @staticmethod
     def _construct_answer(df: pd.DataFrame, features: pd.DataFrame) -> pd.DataFrame:
-        dataframes = []
-        for seg in df.columns.get_level_values("segment").unique():
-            tmp = df[seg].join(features)
-            _idx = tmp.columns.to_frame()
-            _idx.insert(0, "segment", seg)
-            tmp.columns = pd.MultiIndex.from_frame(_idx)
-            dataframes.append(tmp)
-
-        result = pd.concat(dataframes, axis=1).sort_index(axis=1)
+        segments = df.columns.get_level_values("segment").unique()
+        segments_features = pd.concat([features] * len(segments), axis=1, keys=segments)
+
+        result = pd.concat([df, segments_features], axis=1).sort_index(axis=1)
         result.columns.names = ["segment", "feature"]
         return result
 
@@ -141,12 +138,16 @@ class FourierTransform(IrreversibleTransform, FutureMixin):
             transformed dataframe
         """
         features = pd.DataFrame(index=df.index)
-        elapsed = np.arange(features.shape[0]) / self.period
-
         for mod in self.mods:
-            order = (mod + 1) // 2
-            is_cos = mod % 2 == 0
-
-            features[self._get_column_name(mod)] = np.sin(2 * np.pi * order * elapsed + np.pi / 2 * is_cos)
+            features[self._get_column_name(mod)] = get_calendar_feature(
+                index=df.index, spec=("fourier", self.period, mod), compute=partial(self._get_harmonic, mod=mod)
+            )
 
         return self._construct_answer(df, features)
+
+    def _get_harmonic(self, index: pd.DatetimeIndex, mod: int) -> np.ndarray:
+        """Compute harmonic with the given mod for the timestamps of the index."""
+        elapsed = np.arange(len(index)) / self.period
+        order = (mod + 1) // 2
+        is_cos = mod % 2 == 0
+        return np.sin(2 * np.pi * order * elapsed + np.pi / 2 * is_cos)
@@ -8,6 +8,7 @@ import pandas as pd
 
 from etna.transforms.base import FutureMixin
 from etna.transforms.base import IrreversibleTransform
+from etna.transforms.timestamp.utils import get_calendar_feature
 
 
 class HolidayTransform(IrreversibleTransform, FutureMixin):
@@ -66,7 +67,9 @@ class HolidayTransform(IrreversibleTransform, FutureMixin):
         cols = df.columns.get_level_values("segment").unique()
 
         out_column = self._get_column_name()
-        encoded_matrix = np.array([int(x in self.holidays) for x in df.index])
+        encoded_matrix = get_calendar_feature(
+            index=df.index, spec=("holiday", self.iso_code), compute=self._get_holiday_flags
+        )
         encoded_matrix = encoded_matrix.reshape(-1, 1).repeat(len(cols), axis=1)
         encoded_df = pd.DataFrame(
             encoded_matrix,
@@ -79,6 +82,32 @@ class HolidayTransform(IrreversibleTransform, FutureMixin):
         df = df.sort_index(axis=1)
         return df
 
+    def _get_holiday_days(self, index: pd.DatetimeIndex) -> np.ndarray:
+        """Get array with flags of the holidays for the days of the daily index."""
+        country_holidays = holidays.CountryHoliday(self.iso_code, years=range(index[0].year, index[-1].year + 1))
+        holiday_days = np.array(list(country_holidays.keys()), dtype="datetime64[D]")
+        return np.isin(index.values.astype("datetime64[D]"), holiday_days)
+
+    def _get_holiday_flags(self, index: pd.DatetimeIndex) -> np.ndarray:
+        """Get array with flags of the holidays for the timestamps of the index.
+
+        Flags are looked up in the table of the holidays for the whole years covered by the index,
+        the table is cached across the instances with the same ``iso_code``.
+        """
+        days = index.values.astype("datetime64[D]")
+        first_day = days.min().astype("datetime64[Y]").astype("datetime64[D]")
+        last_day = (days.max().astype("datetime64[Y]") + 1).astype("datetime64[D]") - 1
+        table_index = pd.date_range(first_day, last_day, freq="D")
+        table = get_calendar_feature(
+            index=table_index, spec=("holiday_days", self.iso_code), compute=self._get_holiday_days
+        )
+        return table[(days - first_day).astype(np.int64)].astype(int)
+
+    @property
+    def required_history(self) -> int:
+        """Transform doesn't use the previous timestamps."""
+        return 0
+
     def get_regressors_info(self) -> List[str]:
         """Return the list with regressors created by the transform.
         Returns
@@ -1,15 +1,20 @@
 import datetime
+from copy import copy
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
 
 from etna.transforms.base import FutureMixin
 from etna.transforms.base import IrreversiblePerSegmentWrapper
 from etna.transforms.base import OneSegmentTransform
+from etna.transforms.timestamp.utils import get_calendar_feature
+from etna.transforms.utils import get_feature_values
 
 
 def calc_day_number_in_week(datetime_day: datetime.datetime) -> int:
@@ -172,6 +177,109 @@ class _OneSegmentSpecialDaysTransform(OneSegmentTransform):
         """Inverse transform Dataframe."""
         return df
 
+    @staticmethod
+    def _get_weekdays(index: pd.DatetimeIndex) -> np.ndarray:
+        """Get numbers of the days in the week for the index from the calendar cache."""
+        return get_calendar_feature(
+            index=index, spec=("day_number_in_week",), compute=lambda index: index.weekday.to_numpy()
+        )
+
+    @staticmethod
+    def _get_month_days(index: pd.DatetimeIndex) -> np.ndarray:
+        """Get numbers of the days in the month for the index from the calendar cache."""
+        return get_calendar_feature(
+            index=index, spec=("day_number_in_month",), compute=lambda index: index.day.to_numpy()
+        )
+
+    @staticmethod
+    def _find_anomaly_days(values: np.ndarray, day_numbers: np.ndarray) -> List[List[int]]:
+        """Find days with mean value greater than 0.95 quantile of the days' means for each column of values."""
+        day_means = pd.DataFrame(values).groupby(day_numbers).mean()
+        thresholds = day_means.quantile(q=0.95).to_numpy()
+        is_anomaly = day_means.to_numpy() > thresholds
+        return [day_means.index[is_anomaly[:, i]].tolist() for i in range(values.shape[1])]
+
+    @staticmethod
+    def _mark_anomaly_days(anomaly_days: Sequence[Sequence[int]], day_numbers: np.ndarray, num_days: int) -> np.ndarray:
+        """Mark anomaly days of each segment, return array of shape ``(len(day_numbers), len(anomaly_days))``."""
+        is_anomaly_day = np.zeros((len(anomaly_days), num_days), dtype=bool)
+        for i, days in enumerate(anomaly_days):
+            is_anomaly_day[i, list(days)] = True
+        return is_anomaly_day[:, day_numbers].T
+
+    def _fit_segments(self, df: pd.DataFrame) -> Dict[str, "_OneSegmentSpecialDaysTransform"]:
+        """Fit copies of the transform on all the segments at once.
+
+        Parameters
+        ----------
+        df:
+            dataframe in etna wide format
+
+        Returns
+        -------
+        :
+            fitted transforms for each segment
+        """
+        segments, values = get_feature_values(df=df, feature="target")
+        if self.find_special_weekday:
+            weekdays = self._get_weekdays(index=df.index)
+            anomaly_week_days = self._find_anomaly_days(values=values, day_numbers=weekdays)
+        if self.find_special_month_day:
+            month_days = self._get_month_days(index=df.index)
+            anomaly_month_days = self._find_anomaly_days(values=values, day_numbers=month_days)
+
+        segment_transforms = {}
+        for i, segment in enumerate(segments):
+            segment_transform = copy(self)
+            if self.find_special_weekday:
+                segment_transform.anomaly_week_days = anomaly_week_days[i]  # type: ignore
+            if self.find_special_month_day:
+                segment_transform.anomaly_month_days = anomaly_month_days[i]  # type: ignore
+            segment_transforms[segment] = segment_transform
+        return segment_transforms
+
+    def _transform_segments(
+        self, segment_transforms: Dict[str, "OneSegmentTransform"], df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Generate columns of special day flags for all the segments at once.
+
+        Parameters
+        ----------
+        segment_transforms:
+            fitted transforms for each segment
+        df:
+            dataframe in etna wide format
+
+        Returns
+        -------
+        :
+            dataframe with 'anomaly_weekday', 'anomaly_monthday' or both of them columns
+        """
+        segments = df.columns.get_level_values("segment").unique()
+        flags = {}
+        for find_special_days, column, attribute, get_day_numbers, num_days in (
+            (self.find_special_weekday, "anomaly_weekdays", "anomaly_week_days", self._get_weekdays, 7),
+            (self.find_special_month_day, "anomaly_monthdays", "anomaly_month_days", self._get_month_days, 32),
+        ):
+            if not find_special_days:
+                continue
+            anomaly_days = [getattr(segment_transforms[segment], attribute) for segment in segments]
+            if any(days is None for days in anomaly_days):
+                raise ValueError("Transform is not fitted! Fit the Transform before calling transform method.")
+            flags[column] = self._mark_anomaly_days(
+                anomaly_days=anomaly_days, day_numbers=get_day_numbers(index=df.index), num_days=num_days
+            )
+
+        columns = pd.MultiIndex.from_arrays(
+            [np.tile(segments, len(flags)), np.repeat(list(flags.keys()), len(segments))], names=df.columns.names
+        )
+        to_add = pd.DataFrame(np.concatenate(list(flags.values()), axis=1).astype(int), index=df.index, columns=columns)
+        # categories are defined for each column separately
+        to_add = to_add.astype("category")
+        result = pd.concat([df, to_add], axis=1)
+        result = result.sort_index(axis=1)
+        return result
+
 
 class SpecialDaysTransform(IrreversiblePerSegmentWrapper, FutureMixin):
     """SpecialDaysTransform generates series that indicates is weekday/monthday is special in given dataframe.
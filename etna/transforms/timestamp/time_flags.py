@@ -1,4 +1,6 @@
 from copy import deepcopy
+from functools import partial
+from typing import Callable
 from typing import List
 from typing import Optional
 
@@ -7,6 +9,7 @@ import pandas as pd
 
 from etna.transforms.base import FutureMixin
 from etna.transforms.base import IrreversibleTransform
+from etna.transforms.timestamp.utils import get_calendar_feature
 
 
 class TimeFlagsTransform(IrreversibleTransform, FutureMixin):
@@ -99,6 +102,11 @@ class TimeFlagsTransform(IrreversibleTransform, FutureMixin):
         else:
             return f"{self.out_column}_{feature_name}"
 
+    @property
+    def required_history(self) -> int:
+        """Transform doesn't use the previous timestamps."""
+        return 0
+
     def get_regressors_info(self) -> List[str]:
         """Return the list with regressors created by the transform."""
         features = [
@@ -133,74 +141,72 @@ class TimeFlagsTransform(IrreversibleTransform, FutureMixin):
             Dataframe with extracted features
         """
         features = pd.DataFrame(index=df.index)
-        timestamp_series = pd.Series(df.index)
 
         if self.minute_in_hour_number:
-            minute_in_hour_number = self._get_minute_number(timestamp_series=timestamp_series)
+            minute_in_hour_number = self._get_flag(index=df.index, get_flag=self._get_minute_number)
             features[self._get_column_name("minute_in_hour_number")] = minute_in_hour_number
 
         if self.fifteen_minutes_in_hour_number:
-            fifteen_minutes_in_hour_number = self._get_period_in_hour(
-                timestamp_series=timestamp_series, period_in_minutes=15
+            fifteen_minutes_in_hour_number = self._get_flag(
+                index=df.index, get_flag=self._get_period_in_hour, period_in_minutes=15
             )
             features[self._get_column_name("fifteen_minutes_in_hour_number")] = fifteen_minutes_in_hour_number
 
         if self.hour_number:
-            hour_number = self._get_hour_number(timestamp_series=timestamp_series)
+            hour_number = self._get_flag(index=df.index, get_flag=self._get_hour_number)
             features[self._get_column_name("hour_number")] = hour_number
 
         if self.half_hour_number:
-            half_hour_number = self._get_period_in_hour(timestamp_series=timestamp_series, period_in_minutes=30)
+            half_hour_number = self._get_flag(index=df.index, get_flag=self._get_period_in_hour, period_in_minutes=30)
             features[self._get_column_name("half_hour_number")] = half_hour_number
 
         if self.half_day_number:
-            half_day_number = self._get_period_in_day(timestamp_series=timestamp_series, period_in_hours=12)
+            half_day_number = self._get_flag(index=df.index, get_flag=self._get_period_in_day, period_in_hours=12)
             features[self._get_column_name("half_day_number")] = half_day_number
 
         if self.one_third_day_number:
-            one_third_day_number = self._get_period_in_day(timestamp_series=timestamp_series, period_in_hours=8)
+            one_third_day_number = self._get_flag(index=df.index, get_flag=self._get_period_in_day, period_in_hours=8)
             features[self._get_column_name("one_third_day_number")] = one_third_day_number
 
-        for feature in features.columns:
-            features[feature] = features[feature].astype("category")
-
-        dataframes = []
-        for seg in df.columns.get_level_values("segment").unique():
-            tmp = df[seg].join(features)
-            _idx = tmp.columns.to_frame()
-            _idx.insert(0, "segment", seg)
-            tmp.columns = pd.MultiIndex.from_frame(_idx)
-            dataframes.append(tmp)
+        segments = df.columns.get_level_values("segment").unique()
+        segments_features = pd.concat([features] * len(segments), axis=1, keys=segments)
 
-        result = pd.concat(dataframes, axis=1).sort_index(axis=1)
+        result = pd.concat([df, segments_features], axis=1).sort_index(axis=1)
         result.columns.names = ["segment", "feature"]
         return result
 
     @staticmethod
-    def _get_minute_number(timestamp_series: pd.Series) -> np.ndarray:
+    def _get_flag(index: pd.DatetimeIndex, get_flag: Callable[..., np.ndarray], **params) -> pd.Categorical:
+        """Get the flag for the index from the calendar cache."""
+        spec = ("time_flags", get_flag.__name__, tuple(params.items()))
+        compute = partial(get_flag, **params)
+        return pd.Categorical(get_calendar_feature(index=index, spec=spec, compute=compute))
+
+    @staticmethod
+    def _get_minute_number(index: pd.DatetimeIndex) -> np.ndarray:
         """Generate array with the minute number in the hour."""
-        return timestamp_series.apply(lambda x: x.minute).values
+        return index.minute.to_numpy(dtype=np.int64)
 
     @staticmethod
-    def _get_period_in_hour(timestamp_series: pd.Series, period_in_minutes: int = 15) -> np.ndarray:
+    def _get_period_in_hour(index: pd.DatetimeIndex, period_in_minutes: int = 15) -> np.ndarray:
         """Generate an array with the period number in the hour.
 
         Accepts a period length in minutes as input and returns array where timestamps marked by period number.
         """
-        return timestamp_series.apply(lambda x: x.minute // period_in_minutes).values
+        return index.minute.to_numpy(dtype=np.int64) // period_in_minutes
 
     @staticmethod
-    def _get_hour_number(timestamp_series: pd.Series) -> np.ndarray:
+    def _get_hour_number(index: pd.DatetimeIndex) -> np.ndarray:
         """Generate an array with the hour number in the day."""
-        return timestamp_series.apply(lambda x: x.hour).values
+        return index.hour.to_numpy(dtype=np.int64)
 
     @staticmethod
-    def _get_period_in_day(timestamp_series: pd.Series, period_in_hours: int = 12) -> np.ndarray:
+    def _get_period_in_day(index: pd.DatetimeIndex, period_in_hours: int = 12) -> np.ndarray:
         """Generate an array with the period number in the day.
 
         Accepts a period length in hours as input and returns array where timestamps marked by period number.
         """
-        return timestamp_series.apply(lambda x: x.hour // period_in_hours).values
+        return index.hour.to_numpy(dtype=np.int64) // period_in_hours
 
 
 __all__ = ["TimeFlagsTransform"]
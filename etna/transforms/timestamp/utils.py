@@ -0,0 +1,149 @@
+import threading
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+# maximum total size in bytes of the calendar features kept in the cache
+_CALENDAR_CACHE_MAX_BYTES = 256 * 2**20
+
+
+class _CalendarFeaturesCache:
+    """Process-wide LRU cache of the calendar features computed for the timestamp indices.
+
+    Features are identified by the start, the length and the frequency of the index and by the feature specification.
+    The least recently used features are evicted when the total size of the cached arrays exceeds the limit.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._features: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._num_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_index_key(index: pd.DatetimeIndex) -> Optional[Tuple[pd.Timestamp, int, Any]]:
+        """Get key of the regular index, None if the index isn't regular."""
+        if len(index) == 0:
+            return None
+        freq = index.freq
+        if freq is None and len(index) >= 3:
+            freq = pd.infer_freq(index)
+        if freq is None:
+            return None
+        return index[0], len(index), to_offset(freq)
+
+    @staticmethod
+    def _get_num_bytes(value: Any) -> int:
+        """Get total size of the arrays of the feature."""
+        if isinstance(value, tuple):
+            return sum(x.nbytes for x in value)
+        return value.nbytes
+
+    @staticmethod
+    def _make_read_only(value: Any):
+        """Forbid modification of the arrays of the feature, so the cached values can be shared safely."""
+        for array in value if isinstance(value, tuple) else (value,):
+            array.setflags(write=False)
+
+    def get(self, index: pd.DatetimeIndex, spec: Hashable, compute: Callable[[pd.DatetimeIndex], Any]) -> Any:
+        """Get the calendar feature for the index and compute it if it isn't cached.
+
+        Parameters
+        ----------
+        index:
+            timestamp index
+        spec:
+            hashable specification of the feature, e.g. ``("hour_number",)``
+        compute:
+            function to compute the feature from the index, it should return an array or a tuple of arrays
+
+        Returns
+        -------
+        :
+            read-only array or tuple of arrays with the feature
+        """
+        index_key = self._get_index_key(index)
+        if index_key is None:
+            return compute(index)
+
+        key = (index_key, spec)
+        with self._lock:
+            if key in self._features:
+                self._features.move_to_end(key)
+                return self._features[key][0]
+
+        value = compute(index)
+        self._make_read_only(value)
+        num_bytes = self._get_num_bytes(value)
+        if num_bytes > self.max_bytes:
+            return value
+
+        with self._lock:
+            if key not in self._features:
+                self._features[key] = (value, num_bytes)
+                self._num_bytes += num_bytes
+            while self._num_bytes > self.max_bytes:
+                _, (_, evicted_num_bytes) = self._features.popitem(last=False)
+                self._num_bytes -= evicted_num_bytes
+        return value
+
+    def clear(self):
+        """Remove all the features from the cache."""
+        with self._lock:
+            self._features.clear()
+            self._num_bytes = 0
+
+
+_calendar_features_cache = _CalendarFeaturesCache(max_bytes=_CALENDAR_CACHE_MAX_BYTES)
+
+
+def get_calendar_feature(index: pd.DatetimeIndex, spec: Hashable, compute: Callable[[pd.DatetimeIndex], Any]) -> Any:
+    """Get the calendar feature for the index from the process-wide cache shared by the timestamp transforms.
+
+    Parameters
+    ----------
+    index:
+        timestamp index
+    spec:
+        hashable specification of the feature, it should define the result of ``compute`` for the index
+    compute:
+        function to compute the feature from the index, it should return an array or a tuple of arrays
+
+    Returns
+    -------
+    :
+        read-only array or tuple of arrays with the feature
+    """
+    return _calendar_features_cache.get(index=index, spec=spec, compute=compute)
+
+
+def clear_calendar_cache():
+    """Remove all the calendar features from the process-wide cache."""
+    _calendar_features_cache.clear()
+
+
+def get_unique_days(index: pd.DatetimeIndex) -> Tuple[np.ndarray, np.ndarray]:
+    """Get unique days of the index and positions of the index timestamps in them.
+
+    Parameters
+    ----------
+    index:
+        timestamp index
+
+    Returns
+    -------
+    :
+        array of unique days with ``datetime64[D]`` type and array with positions of the timestamps in it
+    """
+    return get_calendar_feature(
+        index=index,
+        spec=("unique_days",),
+        compute=lambda index: np.unique(index.values.astype("datetime64[D]"), return_inverse=True),
+    )
@@ -1,6 +1,10 @@
 import reprlib
 from typing import List
 from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
 
 from etna.datasets.utils import inverse_transform_target_components  # noqa: F401
 from etna.datasets.utils import match_target_quantiles  # noqa: F401
@@ -16,3 +20,46 @@ def check_new_segments(transform_segments: List[str], fit_segments: Optional[Lis
         raise NotImplementedError(
             f"This transform can't process segments that weren't present on train data: {reprlib.repr(new_segments)}"
         )
+
+
+def get_feature_values(df: pd.DataFrame, feature: str) -> Tuple[pd.Index, np.ndarray]:
+    """Get segments and float values of the feature in the order of its columns in the dataframe in etna wide format.
+
+    Parameters
+    ----------
+    df:
+        dataframe in etna wide format
+    feature:
+        name of the feature
+
+    Returns
+    -------
+    :
+        segments and array of shape ``(len(df), n_segments)`` with values of the feature
+    """
+    df_feature = df.loc[:, df.columns.get_level_values("feature") == feature]
+    return df_feature.columns.get_level_values("segment"), df_feature.to_numpy(dtype=float)
+
+
+def replace_feature_values(df: pd.DataFrame, feature: str, values: np.ndarray) -> pd.DataFrame:
+    """Get copy of the dataframe in etna wide format with replaced values of the feature.
+
+    Parameters
+    ----------
+    df:
+        dataframe in etna wide format
+    feature:
+        name of the feature to replace
+    values:
+        array of shape ``(len(df), n_segments)`` with new values in the order of the feature's columns in ``df``
+
+    Returns
+    -------
+    :
+        dataframe in etna wide format with sorted columns
+    """
+    is_feature = df.columns.get_level_values("feature") == feature
+    df_feature = pd.DataFrame(values, index=df.index, columns=df.columns[is_feature])
+    result = pd.concat([df.loc[:, ~is_feature], df_feature], axis=1)
+    result = result.sort_index(axis=1)
+    return result
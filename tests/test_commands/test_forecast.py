@@ -100,3 +100,13 @@ def test_forecast_use_exog_correct(
     pd.testing.assert_series_equal(
         df_output["target"], pd.Series(data=[3.0, 3.0, 3.0], name="target"), check_less_precise=1
     )
+
+
+def test_run_parquet(base_pipeline_yaml_path, base_timeseries_path, tmp_path):
+    pytest.importorskip("pyarrow")
+    timeseries_path = tmp_path / "timeseries.parquet"
+    pd.read_csv(base_timeseries_path, parse_dates=["timestamp"]).to_parquet(timeseries_path, index=False)
+    output_path = tmp_path / "forecast.parquet"
+    run(["etna", "forecast", str(base_pipeline_yaml_path), str(timeseries_path), "D", str(output_path)])
+    df_output = pd.read_parquet(output_path)
+    assert len(df_output) == 2 * 4
@@ -1,4 +1,6 @@
+import warnings
 from contextlib import suppress
+from copy import deepcopy
 from typing import List
 from typing import Tuple
 
@@ -7,11 +9,29 @@ import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
 
+from sklearn.tree import DecisionTreeRegressor
+
 from etna.datasets import generate_ar_df
 from etna.datasets.tsdataset import TSDataset
 from etna.transforms import AddConstTransform
+from etna.transforms import DateFlagsTransform
 from etna.transforms import DifferencingTransform
+from etna.transforms import FilterFeaturesTransform
+from etna.transforms import FourierTransform
+from etna.transforms import HolidayTransform
+from etna.transforms import LabelEncoderTransform
+from etna.transforms import LagTransform
+from etna.transforms import LogTransform
+from etna.transforms import MeanSegmentEncoderTransform
+from etna.transforms import MeanTransform
+from etna.transforms import MedianOutliersTransform
+from etna.transforms import OneHotEncoderTransform
+from etna.transforms import SegmentEncoderTransform
+from etna.transforms import StandardScalerTransform
+from etna.transforms import StdTransform
+from etna.transforms import TimeFlagsTransform
 from etna.transforms import TimeSeriesImputerTransform
+from etna.transforms import TreeFeatureSelectionTransform
 
 
 @pytest.fixture()
@@ -508,6 +528,63 @@ def test_train_test_split_pass_target_components_to_output(ts_with_target_compon
     assert sorted(test.target_components_names) == sorted(ts_with_target_components.target_components_names)
 
 
+@pytest.mark.parametrize("storage", ["pandas", "array"])
+def test_select_segments(df_and_regressors, storage):
+    df, df_exog, known_future = df_and_regressors
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future, storage=storage)
+    selected_ts = ts.select_segments(["2"])
+    assert selected_ts.segments == ["2"]
+    assert selected_ts.regressors == ts.regressors
+    assert selected_ts.df_exog.columns.get_level_values("segment").unique().tolist() == ["2"]
+    pd.testing.assert_frame_equal(selected_ts.to_pandas(), ts.to_pandas().loc[:, pd.IndexSlice[["2"], :]])
+    pd.testing.assert_frame_equal(selected_ts.raw_df, ts.raw_df.loc[:, pd.IndexSlice[["2"], :]])
+
+
+def test_select_segments_doesnt_change_original(df_and_regressors):
+    df, df_exog, known_future = df_and_regressors
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future)
+    df_before = ts.to_pandas().copy(deep=True)
+    selected_ts = ts.select_segments(["1"])
+    selected_ts.df.loc[:, pd.IndexSlice["1", "target"]] = -1
+    pd.testing.assert_frame_equal(ts.to_pandas(), df_before)
+
+
+def test_select_segments_fail_unknown_segment(df_and_regressors):
+    df, df_exog, known_future = df_and_regressors
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future)
+    with pytest.raises(ValueError, match="aren't present in the dataset"):
+        _ = ts.select_segments(["1", "3"])
+
+
+def _assert_shares_memory(ts: TSDataset, other_ts: TSDataset):
+    """Check that the stored data of the datasets shares memory.
+
+    Dataframes are checked column by column, because ``values`` of the dataframe with mixed dtypes is always a copy.
+    """
+    if ts._array_storage is not None:
+        assert np.shares_memory(ts._array_storage.values, other_ts._array_storage.values)
+        return
+    for column in ts._df.columns:
+        assert np.shares_memory(ts._df[column].to_numpy(), other_ts._df[column].to_numpy())
+
+
+@pytest.mark.parametrize("storage", ["pandas", "array"])
+def test_train_test_split_copy_on_write(df_and_regressors, storage):
+    df, df_exog, known_future = df_and_regressors
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future, storage=storage)
+    expected_df = ts.to_pandas()
+    train, test = ts.train_test_split(test_size=5)
+    _assert_shares_memory(train, ts)
+    expected_test_df = test.to_pandas()
+
+    train.df.loc[:, pd.IndexSlice[:, "target"]] = -1
+    pd.testing.assert_frame_equal(ts.to_pandas(), expected_df)
+    pd.testing.assert_frame_equal(test.to_pandas(), expected_test_df)
+    expected_train_df = expected_df.iloc[:-5].copy()
+    expected_train_df.loc[:, pd.IndexSlice[:, "target"]] = -1
+    pd.testing.assert_frame_equal(train.to_pandas(), expected_train_df)
+
+
 def test_dataset_datetime_conversion():
     classic_df = generate_ar_df(periods=30, start_time="2021-06-01", n_segments=2)
     classic_df["timestamp"] = classic_df["timestamp"].astype(str)
@@ -646,6 +723,113 @@ def test_make_future_warn_not_enough_regressors(df_and_regressors):
         ts.make_future(ts.df_exog.shape[0] + 100)
 
 
+@pytest.mark.parametrize(
+    "transforms,expected_required_history",
+    (
+        ([], 0),
+        ([AddConstTransform(in_column="target", value=1)], 0),
+        ([LagTransform(in_column="target", lags=[1, 5])], 5),
+        (
+            [
+                LagTransform(in_column="target", lags=[3], out_column="lag"),
+                MeanTransform(in_column="lag_3", window=4, seasonality=2),
+                DifferencingTransform(in_column="target", period=2, order=2, inplace=False),
+            ],
+            13,
+        ),
+        ([LagTransform(in_column="target", lags=[1]), MeanTransform(in_column="target", window=-1)], None),
+        ([FourierTransform(period=7, order=2)], None),
+    ),
+)
+def test_get_transforms_required_history(transforms, expected_required_history):
+    assert TSDataset._get_transforms_required_history(transforms=transforms) == expected_required_history
+
+
+@pytest.mark.parametrize("tail_steps", [0, 7])
+@pytest.mark.parametrize(
+    "transforms",
+    (
+        [
+            LagTransform(in_column="target", lags=[3, 5], out_column="lag"),
+            MeanTransform(in_column="lag_3", window=4, seasonality=2, out_column="mean"),
+            AddConstTransform(in_column="mean", value=10, inplace=False, out_column="mean_shifted"),
+        ],
+        [
+            DifferencingTransform(in_column="target", period=2, order=2, inplace=False, out_column="diff"),
+            LagTransform(in_column="diff", lags=[2], out_column="lag"),
+            StdTransform(in_column="lag_2", window=3, out_column="std"),
+        ],
+    ),
+)
+def test_make_future_with_required_history(transforms, tail_steps, monkeypatch):
+    df = generate_ar_df(periods=100, start_time="2020-01-01", n_segments=3, random_seed=0)
+    ts = TSDataset(TSDataset.to_dataset(df), freq="D")
+    ts.fit_transform(transforms)
+    future = ts.make_future(future_steps=5, transforms=transforms, tail_steps=tail_steps)
+
+    monkeypatch.setattr(TSDataset, "_get_transforms_required_history", staticmethod(lambda transforms: None))
+    expected_future = ts.make_future(future_steps=5, transforms=transforms, tail_steps=tail_steps)
+    assert_frame_equal(future.to_pandas(), expected_future.to_pandas())
+
+
+@pytest.mark.parametrize("tail_steps", [0, 7])
+@pytest.mark.parametrize(
+    "transform, freq",
+    (
+        (DateFlagsTransform(day_number_in_month=True, is_weekend=True, out_column="date_flags"), "D"),
+        (TimeFlagsTransform(out_column="time_flags"), "H"),
+        (HolidayTransform(out_column="holiday"), "D"),
+        (AddConstTransform(in_column="target", value=10), "D"),
+        (LogTransform(in_column="target"), "D"),
+        (MeanTransform(in_column="target", window=4, seasonality=2), "D"),
+        (StandardScalerTransform(in_column="target"), "D"),
+        (DifferencingTransform(in_column="target", period=2, order=2), "D"),
+        (LagTransform(in_column="target", lags=[1, 3], out_column="lag"), "D"),
+        (TreeFeatureSelectionTransform(model=DecisionTreeRegressor(random_state=0), top_k=1), "D"),
+        (FilterFeaturesTransform(exclude=["regressor_num"]), "D"),
+        (MedianOutliersTransform(in_column="target"), "D"),
+        (LabelEncoderTransform(in_column="regressor_cat", out_column="label"), "D"),
+        (OneHotEncoderTransform(in_column="regressor_cat", out_column="one_hot"), "D"),
+        (SegmentEncoderTransform(), "D"),
+        (MeanSegmentEncoderTransform(), "D"),
+    ),
+)
+def test_make_future_with_required_history_each_transform(transform, freq, tail_steps, monkeypatch):
+    """Check that applying the transform only to the required history gives the same result as the whole history."""
+    df = generate_ar_df(periods=100, start_time="2020-01-01", n_segments=3, freq=freq, random_seed=0)
+    df["target"] = df["target"].abs() + 1
+    df_exog = generate_ar_df(periods=110, start_time="2020-01-01", n_segments=3, freq=freq, random_seed=1)
+    df_exog = df_exog.rename(columns={"target": "regressor_num"})
+    df_exog["regressor_cat"] = pd.Categorical(df_exog["timestamp"].dt.day % 4)
+    ts = TSDataset(TSDataset.to_dataset(df), freq=freq, df_exog=TSDataset.to_dataset(df_exog), known_future="all")
+    ts.fit_transform([transform])
+    ts.inverse_transform([transform])
+    future = ts.make_future(future_steps=5, transforms=[transform], tail_steps=tail_steps)
+
+    monkeypatch.setattr(TSDataset, "_get_transforms_required_history", staticmethod(lambda transforms: None))
+    expected_future = ts.make_future(future_steps=5, transforms=[transform], tail_steps=tail_steps)
+    assert_frame_equal(future.to_pandas(), expected_future.to_pandas())
+
+
+@pytest.mark.parametrize(
+    "transform, freq, categorical_feature",
+    (
+        (HolidayTransform(out_column="holiday"), "D", "holiday"),
+        (TimeFlagsTransform(out_column="time_flags"), "H", "time_flags_hour_number"),
+    ),
+)
+def test_make_future_with_required_history_keeps_categories(transform, freq, categorical_feature):
+    """Check that the features computed on the tail keep the categories of the features of the dataset."""
+    df = generate_ar_df(periods=100, start_time="2020-01-01", n_segments=2, freq=freq, random_seed=0)
+    ts = TSDataset(TSDataset.to_dataset(df), freq=freq)
+    ts.fit_transform([transform])
+    expected_categories = ts[:, :, categorical_feature].dtypes.iloc[0].categories
+
+    future = ts.make_future(future_steps=1, transforms=[transform])
+    for dtype in future[:, :, categorical_feature].dtypes:
+        pd.testing.assert_index_equal(dtype.categories, expected_categories)
+
+
 @pytest.mark.parametrize("exog_starts_later,exog_ends_earlier", ((True, False), (False, True), (True, True)))
 def test_check_regressors_error(exog_starts_later: bool, exog_ends_earlier: bool):
     """Check that error is raised if regressors don't have enough values for the train data."""
@@ -816,6 +1000,20 @@ def test_to_flatten_raise_error_incorrect_literal(df_and_regressors):
         _ = ts.to_flatten(ts.df, features="incorrect")
 
 
+@pytest.mark.parametrize("features", ["all", ["regressor_1"]])
+def test_to_flatten_coded(df_and_regressors, features):
+    df, df_exog, known_future = df_and_regressors
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future)
+    expected_df_flat = ts.to_pandas(flatten=True, features=features)
+
+    df_flat, segments = ts._to_flatten_coded(features=features)
+
+    assert df_flat["segment"].dtype == np.int32
+    assert segments.tolist() == ts.segments
+    df_flat["segment"] = segments.take(df_flat["segment"].values)
+    pd.testing.assert_frame_equal(df_flat, expected_df_flat)
+
+
 @pytest.mark.parametrize(
     "features, expected_columns",
     (
@@ -848,6 +1046,78 @@ def test_fit_transform_raise_warning_on_diff_endings(ts_diff_endings):
         ts_diff_endings.fit_transform([])
 
 
+@pytest.fixture
+def transforms_with_intermediate_features():
+    return [
+        LagTransform(in_column="target", lags=[1, 2], out_column="lag"),
+        AddConstTransform(in_column="lag_1", value=10, inplace=False, out_column="lag_1_shifted"),
+        AddConstTransform(in_column="lag_2", value=10, inplace=True),
+        FilterFeaturesTransform(exclude=["lag_1"]),
+    ]
+
+
+@pytest.mark.parametrize("storage", ["pandas", "array"])
+def test_fit_transform_same_as_sequential(example_df, transforms_with_intermediate_features, storage):
+    ts = TSDataset(df=TSDataset.to_dataset(example_df), freq="H", storage=storage)
+    expected_ts = deepcopy(ts)
+    for transform in deepcopy(transforms_with_intermediate_features):
+        transform.fit_transform(expected_ts)
+
+    ts.fit_transform(transforms_with_intermediate_features)
+
+    assert len(ts._pending_features) == 0
+    assert sorted(set(ts.columns.get_level_values("feature"))) == ["lag_1_shifted", "lag_2", "target"]
+    assert_frame_equal(ts.to_pandas(), expected_ts.to_pandas())
+
+
+def test_transform_same_as_sequential(example_df, transforms_with_intermediate_features):
+    ts = TSDataset(df=TSDataset.to_dataset(example_df), freq="H")
+    deepcopy(ts).fit_transform(transforms_with_intermediate_features)
+    expected_ts = deepcopy(ts)
+    for transform in transforms_with_intermediate_features:
+        transform.transform(expected_ts)
+
+    ts.transform(transforms_with_intermediate_features)
+
+    assert len(ts._pending_features) == 0
+    assert_frame_equal(ts.to_pandas(), expected_ts.to_pandas())
+
+
+def test_add_columns_from_pandas_deferred_merge(df_and_regressors):
+    df, df_exog, known_future = df_and_regressors
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future)
+    df_update = ts.to_pandas(features=["target"]).rename(columns={"target": "new_feature"}, level="feature")
+
+    ts._defer_features_merge = True
+    ts.add_columns_from_pandas(df_update=df_update)
+
+    stored_features = ts._get_stored_df_view(merge_pending=False).columns.get_level_values("feature")
+    assert "new_feature" not in stored_features
+    assert "new_feature" in ts.columns.get_level_values("feature")
+    assert_frame_equal(ts.to_pandas(features=["new_feature"]), df_update.loc[: ts.index.max()])
+
+    ts._defer_features_merge = False
+    ts._merge_pending_features()
+    assert "new_feature" in ts._get_stored_df_view().columns.get_level_values("feature")
+    assert len(ts._pending_features) == 0
+
+
+def test_drop_features_deferred_merge(df_and_regressors):
+    df, df_exog, known_future = df_and_regressors
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future)
+    df_update = ts.to_pandas(features=["target"]).rename(columns={"target": "new_feature"}, level="feature")
+
+    ts._defer_features_merge = True
+    ts.add_columns_from_pandas(df_update=df_update)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", category=pd.errors.PerformanceWarning)
+        ts.drop_features(features=["new_feature"])
+    ts._defer_features_merge = False
+    ts._merge_pending_features()
+
+    assert "new_feature" not in ts.columns.get_level_values("feature")
+
+
 def test_gather_common_data(df_and_regressors):
     """Check that TSDataset._gather_common_data correctly finds common data for info/describe methods."""
     df, df_exog, known_future = df_and_regressors
@@ -883,6 +1153,32 @@ def test_gather_segments_data(df_and_regressors):
     assert segment_df.loc["2", "num_missing"] == 0
 
 
+def test_gather_segments_data_keeps_segments_order(df_and_regressors):
+    df, df_exog, known_future = df_and_regressors
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future)
+    segments_dict = ts._gather_segments_data(["2", "1"])
+    assert segments_dict["start_timestamp"] == [pd.Timestamp("2021-01-06"), pd.Timestamp("2021-01-01")]
+    assert segments_dict["length"] == [27, 32]
+
+
+def test_gather_segments_data_segment_without_values(df_and_regressors):
+    df, df_exog, known_future = df_and_regressors
+    df.loc[:, pd.IndexSlice["2", "target"]] = np.NaN
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future)
+    segments_dict = ts._gather_segments_data(ts.segments)
+    assert segments_dict["start_timestamp"] == [pd.Timestamp("2021-01-01"), None]
+    assert segments_dict["end_timestamp"] == [pd.Timestamp("2021-02-01"), None]
+    assert segments_dict["length"] == [32, 32]
+    assert segments_dict["num_missing"] == [0, 32]
+
+
+def test_gather_segments_data_fail_unknown_segment(df_and_regressors):
+    df, df_exog, known_future = df_and_regressors
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future)
+    with pytest.raises(KeyError, match="aren't present in the dataset"):
+        _ = ts._gather_segments_data(["1", "3"])
+
+
 def test_describe(df_and_regressors):
     """Check that TSDataset.describe works correctly."""
     df, df_exog, known_future = df_and_regressors
@@ -924,6 +1220,68 @@ def test_to_dataset_not_modify_dataframe():
     pd.testing.assert_frame_equal(df_original, df_copy)
 
 
+@pytest.fixture
+def df_long_mixed_dtypes() -> pd.DataFrame:
+    df = generate_ar_df(periods=20, start_time="2021-01-01", n_segments=3, random_seed=1)
+    df["exog_int"] = np.arange(len(df))
+    df["exog_cat"] = pd.Categorical(np.arange(len(df)) % 3)
+    df["exog_Int64"] = pd.array(np.arange(len(df)), dtype="Int64")
+    return df
+
+
+@pytest.mark.parametrize("with_gaps", (False, True))
+@pytest.mark.parametrize(
+    "features", (["target"], ["target", "exog_int"], ["target", "exog_int", "exog_cat", "exog_Int64"])
+)
+def test_to_dataset_matches_pivot(df_long_mixed_dtypes, features, with_gaps):
+    df = df_long_mixed_dtypes[["timestamp", "segment"] + features]
+    if with_gaps:
+        df = df.iloc[5:].sample(frac=1, random_state=0)
+    expected_df = df.pivot(index="timestamp", columns="segment").reorder_levels([1, 0], axis=1)
+    expected_df.columns.names = ["segment", "feature"]
+    expected_df = expected_df.sort_index(axis=1, level=(0, 1))
+    pd.testing.assert_frame_equal(TSDataset.to_dataset(df), expected_df)
+
+
+def test_to_dataset_fail_duplicates(df_long_mixed_dtypes):
+    df = pd.concat([df_long_mixed_dtypes, df_long_mixed_dtypes.iloc[:1]])
+    with pytest.raises(ValueError, match="Index contains duplicate entries"):
+        _ = TSDataset.to_dataset(df)
+
+
+@pytest.mark.parametrize(
+    "features", (["target"], ["target", "exog_int"], ["target", "exog_int", "exog_cat", "exog_Int64"])
+)
+def test_to_flatten_round_trip(df_long_mixed_dtypes, features):
+    df = df_long_mixed_dtypes[["timestamp", "segment"] + features]
+    expected_df = df[["timestamp", "segment", "target"] + sorted(features[1:])].reset_index(drop=True)
+    obtained_df = TSDataset.to_flatten(TSDataset.to_dataset(df))
+    pd.testing.assert_frame_equal(obtained_df, expected_df)
+
+
+@pytest.mark.parametrize("storage", ("pandas", "array"))
+@pytest.mark.parametrize("position", (0, 10, -1))
+def test_get_timestamp_position(tsdf_with_exog, storage, position):
+    ts = TSDataset(df=tsdf_with_exog.raw_df, freq="1D", storage=storage)
+    timestamp = ts.index[position]
+    assert ts.get_timestamp_position(timestamp) == ts.index.get_loc(timestamp)
+    assert ts.get_timestamp_position(str(timestamp)) == ts.index.get_loc(timestamp)
+
+
+@pytest.mark.parametrize("timestamp", ("2020-01-01", "2021-03-01 12:00", "2030-01-01"))
+def test_get_timestamp_position_fail_not_present(tsdf_with_exog, timestamp):
+    with pytest.raises(KeyError, match="is not present in the dataset"):
+        _ = tsdf_with_exog.get_timestamp_position(timestamp)
+
+
+def test_get_timestamp_position_after_append(df_and_regressors):
+    df, _, _ = df_and_regressors
+    ts = TSDataset(df=df.iloc[:-5], freq="D")
+    _ = ts.get_timestamp_position(df.index[0])
+    ts.append(df_new=df.iloc[-5:])
+    assert ts.get_timestamp_position(df.index[-1]) == len(df) - 1
+
+
 @pytest.mark.parametrize("start_idx,end_idx", [(1, None), (None, 1), (1, 2), (1, -1)])
 def test_tsdataset_idx_slice(tsdf_with_exog, start_idx, end_idx):
     ts_slice = tsdf_with_exog.tsdataset_idx_slice(start_idx=start_idx, end_idx=end_idx)
@@ -938,6 +1296,52 @@ def test_tsdataset_idx_slice_pass_target_components_to_output(ts_with_target_com
     assert sorted(ts_slice.target_components_names) == sorted(ts_with_target_components.target_components_names)
 
 
+@pytest.mark.parametrize("storage", ["pandas", "array"])
+def test_tsdataset_idx_slice_shares_data(df_and_regressors, storage):
+    df, df_exog, known_future = df_and_regressors
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future, storage=storage)
+    ts_slice = ts.tsdataset_idx_slice(start_idx=1, end_idx=10)
+    _assert_shares_memory(ts_slice, ts)
+    assert ts_slice.df_exog is ts.df_exog
+
+
+def test_tsdataset_idx_slice_parent_copies_only_shared_data(df_and_regressors):
+    df, _, _ = df_and_regressors
+    ts = TSDataset(df=df, freq="D")
+    ts_slice = ts.tsdataset_idx_slice(start_idx=1, end_idx=10)
+    expected_slice_df = ts_slice.to_pandas()
+
+    ts.df.loc[:, pd.IndexSlice[:, "target"]] = -1
+    pd.testing.assert_frame_equal(ts_slice.to_pandas(), expected_slice_df)
+
+    stored_df = ts.df
+    ts_slice = ts.tsdataset_idx_slice(start_idx=1, end_idx=10)
+    ts_slice.df.loc[:, pd.IndexSlice[:, "target"]] = 0
+    assert ts.df is stored_df
+    del ts_slice
+    _ = ts.tsdataset_idx_slice(start_idx=1, end_idx=10)
+    assert ts.df is stored_df
+
+
+@pytest.mark.parametrize("storage", ["pandas", "array"])
+def test_tsdataset_idx_slice_copy_on_write(df_and_regressors, storage):
+    df, df_exog, known_future = df_and_regressors
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future, storage=storage)
+    expected_df = ts.to_pandas()
+    ts_slice = ts.tsdataset_idx_slice(start_idx=1, end_idx=10)
+    expected_slice_df = ts_slice.to_pandas()
+
+    ts_slice.df.loc[:, pd.IndexSlice[:, "target"]] = -1
+    ts_slice.drop_features(features=["regressor_1"], drop_from_exog=True)
+    pd.testing.assert_frame_equal(ts.to_pandas(), expected_df)
+    assert "regressor_1" in ts.df_exog.columns.get_level_values("feature")
+
+    ts.df.loc[:, pd.IndexSlice[:, "regressor_2"]] = -1
+    expected_slice_df.loc[:, pd.IndexSlice[:, "target"]] = -1
+    expected_slice_df = expected_slice_df.drop(columns=["regressor_1"], level="feature")
+    pd.testing.assert_frame_equal(ts_slice.to_pandas(), expected_slice_df)
+
+
 def test_to_torch_dataset_without_drop(tsdf_with_exog):
     def make_samples(df):
         return [{"target": df.target.values, "segment": df["segment"].values[0]}]
@@ -970,11 +1374,12 @@ def test_to_torch_dataset_with_drop(tsdf_with_exog):
     )
 
 
-def test_add_columns_from_pandas_update_df(df_and_regressors, df_update_add_column, df_updated_add_column):
+@pytest.mark.parametrize("storage", ("pandas", "array"))
+def test_add_columns_from_pandas_update_df(df_and_regressors, df_update_add_column, df_updated_add_column, storage):
     df, _, _ = df_and_regressors
-    ts = TSDataset(df=df, freq="D")
+    ts = TSDataset(df=df, freq="D", storage=storage)
     ts.add_columns_from_pandas(df_update=df_update_add_column, update_exog=False)
-    pd.testing.assert_frame_equal(ts.df, df_updated_add_column)
+    pd.testing.assert_frame_equal(ts.to_pandas(), df_updated_add_column)
 
 
 def test_add_columns_from_pandas_update_df_exog(df_and_regressors, df_update_add_column, df_exog_updated_add_column):
@@ -1000,11 +1405,131 @@ def test_add_columns_from_pandas_update_regressors(
     assert sorted(ts.regressors) == sorted(expected_regressors)
 
 
-def test_update_columns_from_pandas(df_and_regressors, df_update_update_column, df_updated_update_column):
+@pytest.mark.parametrize("storage", ("pandas", "array"))
+@pytest.mark.parametrize("features", ("all", ["regressor_1"], ["target", "regressor_2"]))
+def test_get_features_view(df_and_regressors, features, storage):
+    df, df_exog, known_future = df_and_regressors
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future, storage=storage)
+    pd.testing.assert_frame_equal(ts.get_features_view(features=features), ts.to_pandas(features=features))
+
+
+def test_get_features_view_array_storage_read_only(df_and_regressors):
+    df, df_exog, known_future = df_and_regressors
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future, storage="array")
+    df_view = ts.get_features_view(features=["target"])
+    assert np.shares_memory(df_view.values, ts._array_storage.values)
+    with pytest.raises(ValueError, match="read-only"):
+        df_view.values[0, 0] = 0
+
+
+def test_get_features_view_fail_wrong_literal(df_and_regressors):
+    df, _, _ = df_and_regressors
+    ts = TSDataset(df=df, freq="D")
+    with pytest.raises(ValueError, match="The only possible literal is 'all'"):
+        _ = ts.get_features_view(features="target")
+
+
+@pytest.mark.parametrize("storage", ("pandas", "array"))
+def test_save_load_mmap(df_and_regressors, tmp_path, storage):
+    df, df_exog, known_future = df_and_regressors
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future, storage=storage)
+    ts.save_mmap(tmp_path)
+    loaded_ts = TSDataset.load_mmap(tmp_path)
+    assert isinstance(loaded_ts._array_storage.values, np.memmap)
+    pd.testing.assert_frame_equal(loaded_ts.to_pandas(), ts.to_pandas())
+    pd.testing.assert_frame_equal(loaded_ts.raw_df, ts.raw_df)
+    pd.testing.assert_frame_equal(loaded_ts.df_exog, ts.df_exog)
+    assert loaded_ts.freq == ts.freq
+    assert loaded_ts.known_future == ts.known_future
+    assert sorted(loaded_ts.regressors) == sorted(ts.regressors)
+
+
+def test_save_load_mmap_hierarchical(product_level_constant_hierarchical_ts, tmp_path):
+    ts = product_level_constant_hierarchical_ts
+    ts.save_mmap(tmp_path)
+    loaded_ts = TSDataset.load_mmap(tmp_path)
+    assert loaded_ts.hierarchical_structure.level_structure == ts.hierarchical_structure.level_structure
+    assert loaded_ts.hierarchical_structure.level_names == ts.hierarchical_structure.level_names
+    assert loaded_ts.current_df_level == ts.current_df_level
+    pd.testing.assert_frame_equal(loaded_ts.to_pandas(), ts.to_pandas())
+
+
+def test_load_mmap_modify_df(df_and_regressors, tmp_path):
     df, _, _ = df_and_regressors
     ts = TSDataset(df=df, freq="D")
+    ts.save_mmap(tmp_path)
+    loaded_ts = TSDataset.load_mmap(tmp_path, mmap_mode="r")
+    loaded_ts.df.loc[:, pd.IndexSlice[:, "target"]] = 0
+    pd.testing.assert_frame_equal(TSDataset.load_mmap(tmp_path).to_pandas(), ts.to_pandas())
+
+
+@pytest.mark.parametrize("storage", ("pandas", "array"))
+def test_append(df_and_regressors, storage):
+    df, df_exog, known_future = df_and_regressors
+    ts = TSDataset(df=df.iloc[:-5], df_exog=df_exog, freq="D", known_future=known_future, storage=storage)
+    ts.append(df_new=df.iloc[-5:])
+    expected_ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future)
+    pd.testing.assert_frame_equal(ts.to_pandas(), expected_ts.to_pandas(), check_freq=False)
+    pd.testing.assert_frame_equal(ts.raw_df, expected_ts.raw_df, check_freq=False)
+
+
+@pytest.mark.parametrize("storage", ("pandas", "array"))
+def test_append_with_exog(df_and_regressors, storage):
+    df, df_exog, known_future = df_and_regressors
+    df_exog_old = df_exog.loc[: df.index[-5]].copy()
+    df_exog_old.iloc[-1] = -1
+    ts = TSDataset(df=df.iloc[:-5], df_exog=df_exog_old, freq="D", known_future=known_future, storage=storage)
+    ts.append(df_new=df.iloc[-5:], df_exog_new=df_exog.loc[df.index[-5] :])
+    expected_ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future)
+    pd.testing.assert_frame_equal(ts.to_pandas(), expected_ts.to_pandas(), check_freq=False)
+    pd.testing.assert_frame_equal(ts.df_exog, expected_ts.df_exog)
+
+
+def test_append_with_gaps(df_and_regressors):
+    df, _, _ = df_and_regressors
+    ts = TSDataset(df=df.iloc[:-5], freq="D")
+    ts.append(df_new=df.iloc[[-3, -1]])
+    assert len(ts.index) == len(df)
+    assert ts.to_pandas().iloc[-5:-3].isna().all().all()
+
+
+def test_append_fail_wrong_columns(df_and_regressors):
+    df, _, _ = df_and_regressors
+    ts = TSDataset(df=df.iloc[:-5], freq="D")
+    df_new = df.iloc[-5:].rename(columns={"target": "new_target"}, level="feature")
+    with pytest.raises(ValueError, match="Columns of df_new should match the columns of the dataset"):
+        ts.append(df_new=df_new)
+
+
+def test_append_fail_not_after_last_timestamp(df_and_regressors):
+    df, _, _ = df_and_regressors
+    ts = TSDataset(df=df.iloc[:-5], freq="D")
+    with pytest.raises(ValueError, match="New observations should start after the last timestamp"):
+        ts.append(df_new=df.iloc[-6:])
+
+
+def test_append_fail_wrong_freq(df_and_regressors):
+    df, _, _ = df_and_regressors
+    ts = TSDataset(df=df.iloc[:-5], freq="D")
+    df_new = df.iloc[-5:].copy()
+    df_new.index = df_new.index + pd.Timedelta(hours=1)
+    with pytest.raises(ValueError, match="Timestamps of df_new don't match the frequency"):
+        ts.append(df_new=df_new)
+
+
+def test_append_fail_no_exog(df_and_regressors):
+    df, df_exog, _ = df_and_regressors
+    ts = TSDataset(df=df.iloc[:-5], freq="D")
+    with pytest.raises(ValueError, match="Dataset doesn't have exogenous data"):
+        ts.append(df_new=df.iloc[-5:], df_exog_new=df_exog)
+
+
+@pytest.mark.parametrize("storage", ("pandas", "array"))
+def test_update_columns_from_pandas(df_and_regressors, df_update_update_column, df_updated_update_column, storage):
+    df, _, _ = df_and_regressors
+    ts = TSDataset(df=df, freq="D", storage=storage)
     ts.update_columns_from_pandas(df_update=df_update_update_column)
-    pd.testing.assert_frame_equal(ts.df, df_updated_update_column)
+    pd.testing.assert_frame_equal(ts.to_pandas(), df_updated_update_column)
 
 
 @pytest.mark.filterwarnings("ignore: Features {'out_of_dataset_column'} are not present in")
@@ -1031,9 +1556,12 @@ def test_update_columns_from_pandas(df_and_regressors, df_update_update_column,
         ),
     ),
 )
-def test_drop_features(df_and_regressors, features, drop_from_exog, df_expected_columns, df_exog_expected_columns):
+@pytest.mark.parametrize("storage", ("pandas", "array"))
+def test_drop_features(
+    df_and_regressors, features, drop_from_exog, df_expected_columns, df_exog_expected_columns, storage
+):
     df, df_exog, known_future = df_and_regressors
-    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future)
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future, storage=storage)
     ts.drop_features(features=features, drop_from_exog=drop_from_exog)
     df_columns, df_exog_columns = ts.to_flatten(ts.df).columns, ts.to_flatten(ts.df_exog).columns
     assert sorted(df_columns) == sorted(df_expected_columns)
@@ -1157,3 +1685,197 @@ def test_get_target_quantiles_names(fixture_name, expected_quantiles, request):
     ts = request.getfixturevalue(fixture_name)
     target_quantiles_names = ts.target_quantiles_names
     assert sorted(target_quantiles_names) == sorted(expected_quantiles)
+
+
+@pytest.mark.parametrize("storage", ["pandas", "array"])
+def test_dtype_cast(df_and_regressors, storage):
+    df, df_exog, known_future = df_and_regressors
+    df_exog = df_exog.astype(float)
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future, storage=storage, dtype="float32")
+    assert ts.dtype == np.float32
+    assert (ts.raw_df.dtypes == np.float32).all()
+    assert (ts.df_exog.dtypes == np.float32).all()
+    assert (ts.to_pandas().dtypes == np.float32).all()
+    expected_df = TSDataset(df=df, df_exog=df_exog, freq="D").to_pandas().astype(np.float32)
+    pd.testing.assert_frame_equal(ts.to_pandas(), expected_df)
+
+
+@pytest.mark.parametrize("storage", ["pandas", "array"])
+def test_dtype_keep_not_floating_features(df_and_regressors, storage):
+    df, df_exog, known_future = df_and_regressors
+    df_exog = df_exog.astype({column: "category" for column in df_exog.columns if column[1] == "regressor_1"})
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future, storage=storage, dtype="float32")
+    dtypes = ts.to_pandas().dtypes
+    assert (dtypes.loc[pd.IndexSlice[:, "target"]] == np.float32).all()
+    assert (dtypes.loc[pd.IndexSlice[:, "regressor_1"]] == "category").all()
+
+
+@pytest.mark.parametrize("storage", ["pandas", "array"])
+def test_dtype_cast_added_features(df_and_regressors, storage):
+    df, _, _ = df_and_regressors
+    ts = TSDataset(df=df, freq="D", storage=storage, dtype="float32")
+    df_update = ts.to_pandas(features=["target"]).astype(np.float64)
+    df_update = df_update.rename(columns={"target": "new_feature"}, level="feature")
+    ts.add_columns_from_pandas(df_update=df_update)
+    ts.update_columns_from_pandas(df_update=df_update * 2)
+    assert (ts.to_pandas().dtypes == np.float32).all()
+
+
+def test_dtype_make_future(df_and_regressors):
+    df, df_exog, known_future = df_and_regressors
+    ts = TSDataset(df=df, df_exog=df_exog.astype(float), freq="D", known_future=known_future, dtype="float32")
+    future_ts = ts.make_future(future_steps=3)
+    assert future_ts.dtype == np.float32
+    assert (future_ts.to_pandas().dtypes == np.float32).all()
+
+
+def test_dtype_save_load_mmap(df_and_regressors, tmp_path):
+    df, _, _ = df_and_regressors
+    ts = TSDataset(df=df, freq="D", storage="array", dtype="float32")
+    ts.save_mmap(tmp_path)
+    loaded_ts = TSDataset.load_mmap(tmp_path)
+    assert loaded_ts.dtype == np.float32
+    assert loaded_ts._array_storage.values.dtype == np.float32
+    pd.testing.assert_frame_equal(loaded_ts.to_pandas(), ts.to_pandas())
+
+
+def test_dtype_fail_not_floating(df_and_regressors):
+    df, _, _ = df_and_regressors
+    with pytest.raises(ValueError, match="Only floating dtypes are supported"):
+        _ = TSDataset(df=df, freq="D", dtype="int32")
+
+
+@pytest.fixture
+def eager_and_lazy_ts(df_and_regressors, request) -> Tuple[TSDataset, TSDataset]:
+    df, df_exog, known_future = df_and_regressors
+    storage = getattr(request, "param", "pandas")
+    eager_ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future, storage=storage)
+    lazy_ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future, storage=storage, lazy_exog=True)
+    return eager_ts, lazy_ts
+
+
+@pytest.mark.parametrize("eager_and_lazy_ts", ["pandas", "array"], indirect=True)
+def test_lazy_exog_not_merged(eager_and_lazy_ts):
+    _, lazy_ts = eager_and_lazy_ts
+    assert set(lazy_ts._get_stored_df_view().columns.get_level_values("feature")) == {"target"}
+    assert sorted(lazy_ts._lazy_exog_features) == ["regressor_1", "regressor_2"]
+
+
+@pytest.mark.parametrize("eager_and_lazy_ts", ["pandas", "array"], indirect=True)
+@pytest.mark.parametrize("features", ["all", ["regressor_1"], ["regressor_2", "target"]])
+def test_lazy_exog_to_pandas(eager_and_lazy_ts, features):
+    eager_ts, lazy_ts = eager_and_lazy_ts
+    assert lazy_ts.columns.equals(eager_ts.columns)
+    pd.testing.assert_frame_equal(lazy_ts.to_pandas(features=features), eager_ts.to_pandas(features=features))
+    pd.testing.assert_frame_equal(
+        lazy_ts.get_features_view(features=features), eager_ts.get_features_view(features=features)
+    )
+    pd.testing.assert_frame_equal(
+        lazy_ts.to_pandas(flatten=True, features=features), eager_ts.to_pandas(flatten=True, features=features)
+    )
+
+
+def test_lazy_exog_df_access_joins_exog(eager_and_lazy_ts):
+    eager_ts, lazy_ts = eager_and_lazy_ts
+    pd.testing.assert_frame_equal(lazy_ts.df, eager_ts.df)
+    assert lazy_ts._lazy_exog_features == []
+
+
+@pytest.mark.parametrize("eager_and_lazy_ts", ["pandas", "array"], indirect=True)
+def test_lazy_exog_transform(eager_and_lazy_ts):
+    eager_ts, lazy_ts = eager_and_lazy_ts
+    transform = AddConstTransform(in_column="regressor_1", value=10, inplace=True)
+    eager_ts.fit_transform([transform])
+    lazy_ts.fit_transform([transform])
+    assert lazy_ts._lazy_exog_features == ["regressor_2"]
+    pd.testing.assert_frame_equal(lazy_ts.to_pandas(), eager_ts.to_pandas())
+
+
+@pytest.mark.parametrize("eager_and_lazy_ts", ["pandas", "array"], indirect=True)
+def test_lazy_exog_drop_features(eager_and_lazy_ts):
+    eager_ts, lazy_ts = eager_and_lazy_ts
+    eager_ts.drop_features(features=["regressor_1"])
+    lazy_ts.drop_features(features=["regressor_1"])
+    pd.testing.assert_frame_equal(lazy_ts.to_pandas(), eager_ts.to_pandas())
+    pd.testing.assert_frame_equal(lazy_ts.df_exog, eager_ts.df_exog)
+
+
+@pytest.mark.parametrize("eager_and_lazy_ts", ["pandas", "array"], indirect=True)
+def test_lazy_exog_make_future(eager_and_lazy_ts):
+    eager_ts, lazy_ts = eager_and_lazy_ts
+    transform = AddConstTransform(in_column="regressor_1", value=10, out_column="regressor_1_shifted")
+    eager_ts.fit_transform([transform])
+    lazy_ts.fit_transform([transform])
+    eager_future_ts = eager_ts.make_future(future_steps=3, transforms=[transform], tail_steps=2)
+    lazy_future_ts = lazy_ts.make_future(future_steps=3, transforms=[transform], tail_steps=2)
+    pd.testing.assert_frame_equal(lazy_future_ts.to_pandas(), eager_future_ts.to_pandas())
+    assert lazy_future_ts.df_exog is lazy_ts.df_exog
+
+
+def test_lazy_exog_append(df_and_regressors):
+    df, df_exog, known_future = df_and_regressors
+    eager_ts = TSDataset(df=df.iloc[:-5], df_exog=df_exog, freq="D", known_future=known_future)
+    lazy_ts = TSDataset(df=df.iloc[:-5], df_exog=df_exog, freq="D", known_future=known_future, lazy_exog=True)
+    eager_ts.append(df_new=df.iloc[-5:])
+    lazy_ts.append(df_new=df.iloc[-5:])
+    pd.testing.assert_frame_equal(lazy_ts.to_pandas(), eager_ts.to_pandas())
+
+
+def test_lazy_exog_train_test_split(eager_and_lazy_ts):
+    eager_ts, lazy_ts = eager_and_lazy_ts
+    for eager_part, lazy_part in zip(eager_ts.train_test_split(test_size=5), lazy_ts.train_test_split(test_size=5)):
+        pd.testing.assert_frame_equal(lazy_part.to_pandas(), eager_part.to_pandas())
+
+
+def test_init_df_modification_doesnt_change_raw_df(df_and_regressors):
+    df, _, _ = df_and_regressors
+    ts = TSDataset(df=df, freq="D")
+    expected_raw_df = ts.raw_df.copy(deep=True)
+    ts.df.loc[:, pd.IndexSlice[:, "target"]] = 0
+    pd.testing.assert_frame_equal(ts.raw_df, expected_raw_df)
+
+
+def test_init_trusted_doesnt_copy(df_and_regressors):
+    df, df_exog, known_future = df_and_regressors
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future, trusted=True)
+    assert np.shares_memory(ts.raw_df.values, df.values)
+    assert ts.df_exog is df_exog
+    assert ts.index.freq == "D"
+    expected_ts = TSDataset(df=df, df_exog=df_exog, freq="D", known_future=known_future)
+    pd.testing.assert_frame_equal(ts.to_pandas(), expected_ts.to_pandas())
+
+
+def test_init_trusted_irregular_index(df_and_regressors):
+    df, _, _ = df_and_regressors
+    df = df.drop(index=df.index[3])
+    ts = TSDataset(df=df, freq="D", trusted=True)
+    expected_ts = TSDataset(df=df, freq="D")
+    pd.testing.assert_frame_equal(ts.to_pandas(), expected_ts.to_pandas())
+    assert len(ts.index) == len(df) + 1
+
+
+def test_init_trusted_unsorted_index(df_and_regressors):
+    df, _, _ = df_and_regressors
+    df = df.iloc[[0, 2, 1] + list(range(3, len(df)))]
+    ts = TSDataset(df=df, freq="D", trusted=True)
+    expected_ts = TSDataset(df=df, freq="D")
+    pd.testing.assert_frame_equal(ts.to_pandas(), expected_ts.to_pandas())
+
+
+@pytest.mark.parametrize(
+    "index",
+    (
+        pd.DatetimeIndex(["2020-01-01", "2020-01-03", "2020-01-02", "2020-01-04"]),
+        pd.DatetimeIndex(["2020-01-01", "2020-01-02", "2020-01-02", "2020-01-04"]),
+    ),
+)
+def test_is_regular_index_unsorted_or_duplicated(index):
+    assert not TSDataset._is_regular_index(index, freq="D")
+
+
+def test_init_index_with_freq_no_warnings(df_and_regressors):
+    df, _, _ = df_and_regressors
+    df = df.asfreq("D")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        _ = TSDataset(df=df, freq="D")
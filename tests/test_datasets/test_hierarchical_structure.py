@@ -43,6 +43,12 @@ def test_summing_matrix(struct: str, source: str, target: str, answer: np.ndarra
     )
 
 
+def test_summing_matrix_is_cached(simple_hierarchical_structure):
+    summing_matrix = simple_hierarchical_structure.get_summing_matrix(target_level="l2", source_level="l3")
+    assert simple_hierarchical_structure.get_summing_matrix(target_level="l2", source_level="l3") is summing_matrix
+    assert simple_hierarchical_structure.get_summing_matrix(target_level="l1", source_level="l3") is not summing_matrix
+
+
 @pytest.mark.parametrize(
     "target,source,error",
     (
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from etna.datasets import TSDataset
+from etna.datasets import generate_ar_df
+from etna.datasets import read_parquet
+from etna.datasets import write_parquet
+
+
+@pytest.fixture
+def df_long() -> pd.DataFrame:
+    df = generate_ar_df(periods=20, start_time="2021-01-01", n_segments=3, random_seed=1)
+    df["exog_int"] = np.arange(len(df))
+    df["exog_cat"] = pd.Categorical(np.arange(len(df)) % 3)
+    return df
+
+
+@pytest.mark.parametrize("partition_by_segment", (False, True))
+def test_write_read_parquet(df_long, tmp_path, partition_by_segment):
+    pytest.importorskip("pyarrow")
+    df = TSDataset.to_dataset(df_long[["timestamp", "segment", "target", "exog_int"]])
+    path = tmp_path / "data.parquet"
+    write_parquet(df, path, partition_by_segment=partition_by_segment)
+    assert_frame_equal(read_parquet(path), df, check_freq=False)
+
+
+def test_read_parquet_filters(df_long, tmp_path):
+    pytest.importorskip("pyarrow")
+    df = TSDataset.to_dataset(df_long[["timestamp", "segment", "target", "exog_int"]])
+    path = tmp_path / "data.parquet"
+    write_parquet(df, path, partition_by_segment=True)
+    df_read = read_parquet(
+        path,
+        features=["target"],
+        segments=["segment_0", "segment_2"],
+        start_timestamp="2021-01-05",
+        end_timestamp="2021-01-10",
+    )
+    expected_df = df.loc["2021-01-05":"2021-01-10", pd.IndexSlice[["segment_0", "segment_2"], ["target"]]]
+    assert_frame_equal(df_read, expected_df, check_freq=False)
+
+
+def test_parquet_fail_engine_not_installed(df_long, tmp_path, monkeypatch):
+    monkeypatch.setattr("etna.datasets.io._module_available", lambda module_path: False)
+    df = TSDataset.to_dataset(df_long[["timestamp", "segment", "target"]])
+    path = tmp_path / "data.parquet"
+    with pytest.raises(ImportError, match="pip install etna\\[parquet\\]"):
+        write_parquet(df, path)
+    with pytest.raises(ImportError, match="pip install etna\\[parquet\\]"):
+        _ = read_parquet(path)
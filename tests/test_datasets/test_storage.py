@@ -0,0 +1,236 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from etna.datasets import TSDataset
+from etna.datasets import generate_ar_df
+from etna.datasets.storage import ArrayStorage
+from etna.datasets.storage import DataStorage
+from etna.transforms import DateFlagsTransform
+from etna.transforms import LagTransform
+from etna.transforms import LinearTrendTransform
+from etna.transforms import SegmentEncoderTransform
+
+
+@pytest.fixture
+def df_wide() -> pd.DataFrame:
+    df = generate_ar_df(periods=30, start_time="2021-01-01", n_segments=3, random_seed=1)
+    df["exog_int"] = np.arange(len(df))
+    df["exog_cat"] = pd.Categorical(np.arange(len(df)) % 3)
+    return TSDataset.to_dataset(df)
+
+
+@pytest.fixture
+def df_segment_categories_wide(df_wide) -> pd.DataFrame:
+    df = df_wide.copy()
+    for i, segment in enumerate(df.columns.get_level_values("segment").unique()):
+        df[(segment, "exog_cat")] = pd.Categorical([i] * len(df), categories=[i, 10 + i])
+    return df
+
+
+@pytest.fixture
+def df_float_wide() -> pd.DataFrame:
+    df = generate_ar_df(periods=30, start_time="2021-01-01", n_segments=3, random_seed=1)
+    df["exog"] = np.arange(len(df), dtype=float)
+    return TSDataset.to_dataset(df)
+
+
+def test_data_storage_unknown_value():
+    with pytest.raises(NotImplementedError, match="is not a valid DataStorage"):
+        _ = DataStorage("unknown")
+
+
+def test_from_frame_shape(df_wide):
+    storage = ArrayStorage.from_frame(df_wide)
+    assert storage.shape == (30, 3, 3)
+    assert storage.values.flags.c_contiguous
+    assert storage.segments == ["segment_0", "segment_1", "segment_2"]
+    assert storage.features == ["exog_cat", "exog_int", "target"]
+
+
+def test_from_frame_fail_different_features(df_wide):
+    df = df_wide.drop(columns=[("segment_0", "exog_int")])
+    with pytest.raises(ValueError, match="All the segments should have the same set of features"):
+        _ = ArrayStorage.from_frame(df)
+
+
+def test_from_frame_fail_object_feature(df_wide):
+    df = df_wide.copy()
+    df.loc[:, pd.IndexSlice[:, "exog_int"]] = "a"
+    with pytest.raises(ValueError, match="can't be kept in array storage"):
+        _ = ArrayStorage.from_frame(df)
+
+
+def test_to_frame_round_trip(df_wide):
+    storage = ArrayStorage.from_frame(df_wide)
+    assert_frame_equal(storage.to_frame(), df_wide)
+
+
+def test_to_frame_round_trip_segment_categories(df_segment_categories_wide):
+    storage = ArrayStorage.from_frame(df_segment_categories_wide)
+    assert storage.dtypes["exog_cat"].categories.tolist() == [0, 10, 1, 11, 2, 12]
+    assert_frame_equal(storage.to_frame(), df_segment_categories_wide)
+    assert_frame_equal(
+        storage.to_frame(segments=["segment_2"], features=["exog_cat"]),
+        df_segment_categories_wide.loc[:, pd.IndexSlice[["segment_2"], ["exog_cat"]]],
+    )
+
+
+def test_to_frame_copy(df_float_wide):
+    storage = ArrayStorage.from_frame(df_float_wide)
+    assert not np.shares_memory(storage.to_frame().values, storage.values)
+    assert np.shares_memory(storage.to_frame(copy=False).values, storage.values)
+
+
+def test_to_frame_order(df_wide):
+    storage = ArrayStorage.from_frame(df_wide)
+    segments, features = ["segment_2", "segment_0"], ["target", "exog_int"]
+    expected_df = df_wide.loc[:, pd.IndexSlice[segments, features]]
+    assert_frame_equal(storage.to_frame(segments=segments, features=features), expected_df)
+
+
+def test_get_values_view(df_float_wide):
+    storage = ArrayStorage.from_frame(df_float_wide)
+    values = storage.get_values(features=["target"])
+    assert values.shape == (30, 3, 1)
+    assert np.shares_memory(values, storage.values)
+
+
+def test_add_features(df_float_wide, df_wide):
+    storage = ArrayStorage.from_frame(df_float_wide)
+    new_features = df_wide.loc[:, pd.IndexSlice[:, ["exog_cat", "exog_int"]]]
+    assert storage.add_features(new_features)
+    assert storage.features == ["exog", "exog_cat", "exog_int", "target"]
+    assert_frame_equal(storage.to_frame(features=["exog_cat", "exog_int"]), new_features)
+
+
+def test_add_features_fail_existing(df_float_wide):
+    storage = ArrayStorage.from_frame(df_float_wide)
+    assert not storage.add_features(df_float_wide.loc[:, pd.IndexSlice[:, ["exog"]]])
+
+
+def test_set_features(df_float_wide):
+    storage = ArrayStorage.from_frame(df_float_wide)
+    df_update = df_float_wide.loc[:, pd.IndexSlice[:, ["exog"]]] * 2
+    assert storage.set_features(df_update)
+    assert_frame_equal(storage.to_frame(features=["exog"]), df_update)
+
+
+def test_drop_features(df_wide):
+    storage = ArrayStorage.from_frame(df_wide)
+    storage.drop_features(["exog_int", "unknown"])
+    assert storage.features == ["exog_cat", "target"]
+    assert_frame_equal(storage.to_frame(), df_wide.drop(columns=["exog_int"], level="feature"))
+
+
+def test_tsdataset_array_storage_to_pandas(df_wide):
+    ts_pandas = TSDataset(df=df_wide, freq="D")
+    ts_array = TSDataset(df=df_wide, freq="D", storage="array")
+    assert_frame_equal(ts_array.to_pandas(), ts_pandas.to_pandas())
+    assert_frame_equal(ts_array.to_pandas(flatten=True), ts_pandas.to_pandas(flatten=True))
+    pd.testing.assert_series_equal(ts_array[:, "segment_1", "target"], ts_pandas[:, "segment_1", "target"])
+    assert ts_array.columns.equals(ts_pandas.columns)
+    assert ts_array.index.equals(ts_pandas.index)
+    assert ts_array._array_storage is not None
+
+
+def test_tsdataset_array_storage_df_access(df_wide):
+    ts = TSDataset(df=df_wide, freq="D", storage="array")
+    df = ts.df
+    assert ts._array_storage is None
+    assert_frame_equal(df, df_wide, check_freq=False)
+
+
+def test_tsdataset_array_storage_fit_transform(df_float_wide):
+    transforms = [LagTransform(in_column="target", lags=[1, 2]), DateFlagsTransform(), LinearTrendTransform("target")]
+    ts_pandas = TSDataset(df=df_float_wide, freq="D")
+    ts_array = TSDataset(df=df_float_wide, freq="D", storage="array")
+    ts_pandas.fit_transform(transforms)
+    ts_array.fit_transform(transforms)
+    assert ts_array._array_storage is not None
+    assert_frame_equal(ts_array.to_pandas(), ts_pandas.to_pandas())
+
+    future_array = ts_array.make_future(future_steps=5, transforms=transforms)
+    future_pandas = ts_pandas.make_future(future_steps=5, transforms=transforms)
+    assert future_array.storage == DataStorage.array
+    assert_frame_equal(future_array.to_pandas(), future_pandas.to_pandas())
+
+
+def test_tsdataset_array_storage_segment_categories(df_float_wide):
+    ts_pandas = TSDataset(df=df_float_wide, freq="D")
+    ts_array = TSDataset(df=df_float_wide, freq="D", storage="array")
+    ts_pandas.fit_transform([SegmentEncoderTransform()])
+    ts_array.fit_transform([SegmentEncoderTransform()])
+    assert ts_array._array_storage is not None
+    assert_frame_equal(ts_array.to_pandas(), ts_pandas.to_pandas())
+
+
+def test_tsdataset_array_storage_train_test_split(df_float_wide):
+    ts = TSDataset(df=df_float_wide, freq="D", storage="array")
+    train, test = ts.train_test_split(test_size=5)
+    assert train.storage == DataStorage.array
+    assert test.storage == DataStorage.array
+    assert_frame_equal(test.to_pandas(), df_float_wide.iloc[-5:], check_freq=False)
+
+
+@pytest.mark.parametrize("mmap_mode", ("r", None))
+def test_save_load_round_trip(df_wide, tmp_path, mmap_mode):
+    storage = ArrayStorage.from_frame(df_wide)
+    metadata = storage.save(path=tmp_path, name="df")
+    loaded_storage = ArrayStorage.load(path=tmp_path, name="df", metadata=metadata, mmap_mode=mmap_mode)
+    assert isinstance(loaded_storage.values, np.memmap) == (mmap_mode is not None)
+    assert_frame_equal(loaded_storage.to_frame(), storage.to_frame())
+
+
+def test_save_load_round_trip_segment_categories(df_segment_categories_wide, tmp_path):
+    storage = ArrayStorage.from_frame(df_segment_categories_wide)
+    metadata = storage.save(path=tmp_path, name="df")
+    loaded_storage = ArrayStorage.load(path=tmp_path, name="df", metadata=metadata)
+    assert_frame_equal(loaded_storage.to_frame(), df_segment_categories_wide)
+
+
+def test_load_read_only_add_features(df_float_wide, df_wide, tmp_path):
+    storage = ArrayStorage.from_frame(df_float_wide)
+    metadata = storage.save(path=tmp_path, name="df")
+    loaded_storage = ArrayStorage.load(path=tmp_path, name="df", metadata=metadata, mmap_mode="r")
+    df_add = df_wide.loc[:, pd.IndexSlice[:, ["exog_int"]]].rename(columns={"exog_int": "exog_new"}, level="feature")
+    assert loaded_storage.add_features(df_add)
+    assert loaded_storage.features == ["exog", "exog_new", "target"]
+    assert_frame_equal(ArrayStorage.load(path=tmp_path, name="df", metadata=metadata).to_frame(), df_float_wide)
+
+
+def test_append_timestamps(df_wide):
+    storage = ArrayStorage.from_frame(df_wide.iloc[:10])
+    for start in range(10, 30, 5):
+        assert storage.append_timestamps(df_wide.iloc[start : start + 5])
+    assert storage.shape == (30, 3, 3)
+    assert_frame_equal(storage.to_frame(), df_wide, check_freq=False)
+
+
+def test_append_timestamps_missing_features(df_float_wide):
+    storage = ArrayStorage.from_frame(df_float_wide.iloc[:10])
+    assert storage.append_timestamps(df_float_wide.iloc[10:].loc[:, pd.IndexSlice[:, ["target"]]])
+    df = storage.to_frame()
+    assert df.loc[:, pd.IndexSlice[:, "exog"]].iloc[10:].isna().all().all()
+    assert_frame_equal(df.loc[:, pd.IndexSlice[:, "target"]], df_float_wide.loc[:, pd.IndexSlice[:, ["target"]]])
+
+
+def test_append_timestamps_fail_overlapping(df_wide):
+    storage = ArrayStorage.from_frame(df_wide.iloc[:10])
+    assert not storage.append_timestamps(df_wide.iloc[5:15])
+    assert storage.shape == (10, 3, 3)
+
+
+def test_append_timestamps_fail_other_categories(df_wide):
+    storage = ArrayStorage.from_frame(df_wide.iloc[:10])
+    df_new = df_wide.iloc[10:].copy()
+    for segment in storage.segments:
+        df_new[(segment, "exog_cat")] = df_new[(segment, "exog_cat")].cat.add_categories(["new"])
+    assert not storage.append_timestamps(df_new)
+
+
+def test_append_timestamps_segment_categories(df_segment_categories_wide):
+    storage = ArrayStorage.from_frame(df_segment_categories_wide.iloc[:10])
+    assert storage.append_timestamps(df_segment_categories_wide.iloc[10:])
+    assert_frame_equal(storage.to_frame(), df_segment_categories_wide, check_freq=False)
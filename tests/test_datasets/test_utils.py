@@ -252,6 +252,24 @@ def test_get_level_dataframe_segm_errors(
         )
 
 
+def test_get_level_dataframe_fail_different_features(product_level_simple_hierarchical_ts):
+    ts = product_level_simple_hierarchical_ts
+    df = ts.to_pandas()
+    df[("a", "exog")] = 1
+
+    mapping_matrix = ts.hierarchical_structure.get_summing_matrix(
+        target_level="market", source_level=ts.current_df_level
+    )
+
+    with pytest.raises(ValueError, match="All the segments of provided dataframe should have the same features!"):
+        get_level_dataframe(
+            df=df,
+            mapping_matrix=mapping_matrix,
+            source_level_segments=ts.hierarchical_structure.get_level_segments(level_name=ts.current_df_level),
+            target_level_segments=ts.hierarchical_structure.get_level_segments(level_name="market"),
+        )
+
+
 @pytest.mark.parametrize(
     "features,answer",
     (
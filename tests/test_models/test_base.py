@@ -154,6 +154,7 @@ def test_deep_base_model_forecast_fail_not_enough_context(deep_base_model_mock,
 
 def test_deep_base_model_forecast_loop(simple_df, deep_base_model_mock, ts_mock):
     ts_after_tsdataset_idx_slice = MagicMock()
+    ts_after_tsdataset_idx_slice.dtype = None
     horizon = 7
 
     raw_predict = {("A", "target"): np.arange(10).reshape(-1, 1), ("B", "target"): -np.arange(10).reshape(-1, 1)}
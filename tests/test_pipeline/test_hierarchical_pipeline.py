@@ -78,6 +78,21 @@ def test_fit_no_hierarchy(simple_no_hierarchy_ts):
         pipeline.fit(simple_no_hierarchy_ts)
 
 
+def test_fit_fail_segment_chunk_size(market_level_simple_hierarchical_ts):
+    reconciliator = BottomUpReconciliator(target_level="total", source_level="market")
+    pipeline = HierarchicalPipeline(reconciliator=reconciliator, model=NaiveModel(), transforms=[], horizon=1)
+    with pytest.raises(ValueError, match="HierarchicalPipeline doesn't support processing by segment chunks!"):
+        pipeline.fit(market_level_simple_hierarchical_ts, segment_chunk_size=1)
+
+
+def test_forecast_fail_segment_chunk_size(market_level_simple_hierarchical_ts):
+    reconciliator = BottomUpReconciliator(target_level="total", source_level="market")
+    pipeline = HierarchicalPipeline(reconciliator=reconciliator, model=NaiveModel(), transforms=[], horizon=1)
+    pipeline.fit(market_level_simple_hierarchical_ts)
+    with pytest.raises(ValueError, match="HierarchicalPipeline doesn't support processing by segment chunks!"):
+        _ = pipeline.forecast(segment_chunk_size=1)
+
+
 @pytest.mark.parametrize(
     "reconciliator,answer",
     (
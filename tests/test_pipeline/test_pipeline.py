@@ -680,6 +680,28 @@ def test_backtest_with_n_jobs(refit, catboost_pipeline: Pipeline, big_example_ts
     assert (forecast_1 == forecast_2).all().all()
 
 
+@pytest.mark.parametrize("mmap_mode", ["r", "c"])
+def test_backtest_with_n_jobs_load_mmap(mmap_mode, big_example_tsdf: TSDataset, tmp_path):
+    """Check that Pipeline.backtest in multiprocessing mode gives the same results on the memory-mapped dataset."""
+    ts = deepcopy(big_example_tsdf)
+    ts.save_mmap(tmp_path)
+    ts_mmap = TSDataset.load_mmap(tmp_path, mmap_mode=mmap_mode)
+    pipeline = Pipeline(
+        model=LinearPerSegmentModel(),
+        transforms=[LagTransform(in_column="target", lags=[7, 8]), DateFlagsTransform(is_weekend=True)],
+        horizon=7,
+    )
+    joblib_params = dict(backend="multiprocessing", mmap_mode="c")
+    metrics_1, forecast_1, _ = deepcopy(pipeline).backtest(
+        ts=ts, n_jobs=2, n_folds=3, metrics=DEFAULT_METRICS, joblib_params=joblib_params
+    )
+    metrics_2, forecast_2, _ = deepcopy(pipeline).backtest(
+        ts=ts_mmap, n_jobs=2, n_folds=3, metrics=DEFAULT_METRICS, joblib_params=joblib_params
+    )
+    pd.testing.assert_frame_equal(metrics_2, metrics_1)
+    pd.testing.assert_frame_equal(forecast_2, forecast_1)
+
+
 def test_backtest_forecasts_sanity(step_ts: TSDataset):
     """Check that Pipeline.backtest gives correct forecasts according to the simple case."""
     ts, expected_metrics_df, expected_forecast_df = step_ts
@@ -1206,3 +1228,84 @@ def test_predict_return_components(
     target_components_df = TSDataset.to_flatten(forecast.get_target_components())
     assert (target_components_df["target_component_a"] == expected_component_a).all()
     assert (target_components_df["target_component_b"] == expected_component_b).all()
+
+
+@pytest.fixture
+def chunked_pipeline_params():
+    return dict(
+        model=LinearPerSegmentModel(),
+        transforms=[DateFlagsTransform(), LagTransform(in_column="target", lags=list(range(7, 15)))],
+        horizon=7,
+    )
+
+
+@pytest.mark.parametrize("segment_chunk_size", [1, 2, 5])
+def test_fit_forecast_segment_chunks(chunked_pipeline_params, example_tsds, segment_chunk_size):
+    expected_forecast = Pipeline(**deepcopy(chunked_pipeline_params)).fit(deepcopy(example_tsds)).forecast()
+
+    pipeline = Pipeline(**deepcopy(chunked_pipeline_params))
+    pipeline.fit(example_tsds, segment_chunk_size=segment_chunk_size)
+    forecast = pipeline.forecast()
+
+    pd.testing.assert_frame_equal(
+        forecast.to_pandas().sort_index(axis=1), expected_forecast.to_pandas().sort_index(axis=1)
+    )
+
+
+def test_fit_segment_chunks_transforms_ts(chunked_pipeline_params, example_tsds):
+    expected_pipeline = Pipeline(**deepcopy(chunked_pipeline_params)).fit(deepcopy(example_tsds))
+    pipeline = Pipeline(**deepcopy(chunked_pipeline_params))
+    pipeline.fit(example_tsds, segment_chunk_size=1)
+    assert pipeline.ts is example_tsds
+    pd.testing.assert_frame_equal(pipeline.ts.to_pandas(), expected_pipeline.ts.to_pandas())
+    assert sorted(pipeline.ts.regressors) == sorted(expected_pipeline.ts.regressors)
+
+
+@pytest.mark.parametrize("segment_chunk_size", [1, 2])
+def test_fit_forecast_segment_chunks_n_jobs(chunked_pipeline_params, example_tsds, segment_chunk_size):
+    expected_forecast = Pipeline(**deepcopy(chunked_pipeline_params)).fit(deepcopy(example_tsds)).forecast()
+
+    pipeline = Pipeline(**deepcopy(chunked_pipeline_params))
+    pipeline.fit(example_tsds, segment_chunk_size=segment_chunk_size, n_jobs=2)
+    forecast = pipeline.forecast(n_jobs=2)
+
+    pd.testing.assert_frame_equal(
+        forecast.to_pandas().sort_index(axis=1), expected_forecast.to_pandas().sort_index(axis=1)
+    )
+
+
+def test_forecast_segment_chunks_fitted_without_chunks(chunked_pipeline_params, example_tsds):
+    pipeline = Pipeline(**chunked_pipeline_params)
+    pipeline.fit(example_tsds)
+    expected_forecast = pipeline.forecast()
+    forecast = pipeline.forecast(segment_chunk_size=1)
+
+    pd.testing.assert_frame_equal(
+        forecast.to_pandas().sort_index(axis=1), expected_forecast.to_pandas().sort_index(axis=1)
+    )
+
+
+def test_predict_segment_chunks(chunked_pipeline_params, example_tsds):
+    start_timestamp = example_tsds.index[50]
+    expected_pipeline = Pipeline(**deepcopy(chunked_pipeline_params)).fit(deepcopy(example_tsds))
+    expected_prediction = expected_pipeline.predict(ts=example_tsds, start_timestamp=start_timestamp)
+
+    pipeline = Pipeline(**deepcopy(chunked_pipeline_params))
+    pipeline.fit(example_tsds, segment_chunk_size=1)
+    prediction = pipeline.predict(ts=example_tsds, start_timestamp=start_timestamp)
+
+    pd.testing.assert_frame_equal(
+        prediction.to_pandas().sort_index(axis=1), expected_prediction.to_pandas().sort_index(axis=1)
+    )
+
+
+def test_fit_segment_chunks_fail_not_per_segment_model(example_tsds):
+    pipeline = Pipeline(model=CatBoostMultiSegmentModel(), transforms=[LagTransform(in_column="target", lags=[1])])
+    with pytest.raises(ValueError, match="Processing by segment chunks is allowed only for per-segment models"):
+        pipeline.fit(example_tsds, segment_chunk_size=1)
+
+
+def test_fit_segment_chunks_fail_non_positive_size(chunked_pipeline_params, example_tsds):
+    pipeline = Pipeline(**chunked_pipeline_params)
+    with pytest.raises(ValueError, match="Segment chunk size should be positive"):
+        pipeline.fit(example_tsds, segment_chunk_size=0)
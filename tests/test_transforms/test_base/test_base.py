@@ -102,7 +102,7 @@ def test_fit_request_correct_columns(required_features):
     transform = TransformMock(required_features=required_features)
 
     transform.fit(ts=ts)
-    ts.to_pandas.assert_called_with(flatten=False, features=required_features)
+    ts.get_features_view.assert_called_with(features=required_features)
 
 
 @pytest.mark.parametrize(
@@ -63,6 +63,22 @@ def test_level_transform_inverse_transform(ts_with_local_levels: TSDataset):
     np.testing.assert_array_almost_equal(ts_with_local_levels.df, original_ts.df)
 
 
+def test_level_transform_parallel(ts_with_local_levels: TSDataset):
+    ts_parallel = deepcopy(ts_with_local_levels)
+    transform_kwargs = dict(
+        in_column="target",
+        change_points_model=RupturesChangePointsModel(change_points_model=Binseg(model="l2"), n_bkps=4),
+        per_interval_model=MeanPerIntervalModel(),
+    )
+    transform = ChangePointsLevelTransform(**transform_kwargs)
+    transform_parallel = ChangePointsLevelTransform(
+        **transform_kwargs, n_jobs=2, joblib_params=dict(backend="threading")
+    )
+    ts_with_local_levels.fit_transform(transforms=[transform])
+    ts_parallel.fit_transform(transforms=[transform_parallel])
+    pd.testing.assert_frame_equal(ts_parallel.to_pandas(), ts_with_local_levels.to_pandas())
+
+
 def test_save_load(ts_with_local_levels):
     transform = ChangePointsLevelTransform(
         in_column="target",
@@ -67,6 +67,13 @@ def df_quadratic() -> pd.DataFrame:
     return df
 
 
+@pytest.fixture
+def ts_quadratic(df_quadratic) -> TSDataset:
+    df = TSDataset.to_dataset(df_quadratic)
+    ts = TSDataset(df=df, freq="H")
+    return ts
+
+
 @pytest.fixture
 def df_one_segment_linear(df_quadratic) -> pd.DataFrame:
     return df_quadratic[df_quadratic["segment"] == "segment_1"].set_index("timestamp")
@@ -377,3 +384,35 @@ def test_fit_transform_with_nans(transformer, ts_with_nans, decimal):
 def test_save_load(transform, ts_two_segments_linear):
     ts = ts_two_segments_linear
     assert_transformation_equals_loaded_original(transform=transform, ts=ts)
+
+
+@pytest.mark.parametrize("poly_degree", (1, 2))
+@pytest.mark.parametrize("fit_intercept", (True, False))
+@pytest.mark.parametrize("ts_name", ("ts_two_segments_diff_size", "ts_quadratic"))
+def test_linear_trend_all_segments_at_once(ts_name, poly_degree, fit_intercept, monkeypatch, request):
+    """Check that linear trend gives the same results on all the segments at once and segment by segment."""
+    ts = request.getfixturevalue(ts_name)
+    df = ts.to_pandas()
+    transform_at_once = LinearTrendTransform(in_column="target", poly_degree=poly_degree, fit_intercept=fit_intercept)
+    transform_at_once.fit(ts)
+    df_at_once = transform_at_once._transform(df.copy())
+    df_at_once_inversed = transform_at_once._inverse_transform(df_at_once.copy())
+
+    for method in ("_fit_segments", "_transform_segments", "_inverse_transform_segments"):
+        monkeypatch.setattr(_OneSegmentLinearTrendBaseTransform, method, lambda *args, **kwargs: None)
+    transform_one_by_one = LinearTrendTransform(
+        in_column="target", poly_degree=poly_degree, fit_intercept=fit_intercept
+    )
+    transform_one_by_one.fit(ts)
+    df_one_by_one = transform_one_by_one._transform(df.copy())
+    df_one_by_one_inversed = transform_one_by_one._inverse_transform(df_one_by_one.copy())
+
+    pd.testing.assert_frame_equal(df_at_once, df_one_by_one, check_exact=False, atol=1e-4)
+    pd.testing.assert_frame_equal(df_at_once_inversed, df_one_by_one_inversed, check_exact=False, atol=1e-4)
+    pd.testing.assert_frame_equal(df_at_once_inversed, df, check_exact=False, atol=1e-4)
+
+
+def test_theil_sen_trend_segment_by_segment(ts_two_segments):
+    """Check that Theil-Sen trend isn't fitted on all the segments at once."""
+    transform = TheilSenTrendTransform(in_column="target")
+    assert transform._base_transform._fit_segments(ts_two_segments.to_pandas()) is None
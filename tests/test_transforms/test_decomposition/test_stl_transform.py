@@ -1,3 +1,5 @@
+from copy import deepcopy
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -197,3 +199,20 @@ def test_fit_transform_with_nans_in_middle_raise_error(ts_with_nans):
 )
 def test_save_load(transform, ts_trend_seasonal):
     assert_transformation_equals_loaded_original(transform=transform, ts=ts_trend_seasonal)
+
+
+@pytest.mark.parametrize("joblib_params", [dict(backend="threading"), None])
+def test_parallel_fit_transform_inverse_transform(ts_trend_seasonal, joblib_params):
+    """Test that transform processing segments in parallel gives the same results as sequential one."""
+    ts_sequential = deepcopy(ts_trend_seasonal)
+    ts_parallel = deepcopy(ts_trend_seasonal)
+    transform_sequential = STLTransform(in_column="target", period=7)
+    transform_parallel = STLTransform(in_column="target", period=7, n_jobs=2, joblib_params=joblib_params)
+
+    transform_sequential.fit_transform(ts_sequential)
+    transform_parallel.fit_transform(ts_parallel)
+    pd.testing.assert_frame_equal(ts_parallel.to_pandas(), ts_sequential.to_pandas())
+
+    transform_sequential.inverse_transform(ts_sequential)
+    transform_parallel.inverse_transform(ts_parallel)
+    pd.testing.assert_frame_equal(ts_parallel.to_pandas(), ts_sequential.to_pandas())
@@ -0,0 +1,104 @@
+from copy import deepcopy
+
+import pytest
+from pandas.util.testing import assert_frame_equal
+from ruptures import Binseg
+from sklearn.tree import DecisionTreeRegressor
+
+from etna.analysis import StatisticsRelevanceTable
+from etna.models import ProphetModel
+from etna.transforms import BoxCoxTransform
+from etna.transforms import ChangePointsLevelTransform
+from etna.transforms import ChangePointsSegmentationTransform
+from etna.transforms import ChangePointsTrendTransform
+from etna.transforms import DensityOutliersTransform
+from etna.transforms import DifferencingTransform
+from etna.transforms import GaleShapleyFeatureSelectionTransform
+from etna.transforms import LabelEncoderTransform
+from etna.transforms import LinearTrendTransform
+from etna.transforms import MeanSegmentEncoderTransform
+from etna.transforms import MedianOutliersTransform
+from etna.transforms import MinMaxScalerTransform
+from etna.transforms import MRMRFeatureSelectionTransform
+from etna.transforms import OneHotEncoderTransform
+from etna.transforms import PredictionIntervalOutliersTransform
+from etna.transforms import ResampleWithDistributionTransform
+from etna.transforms import SpecialDaysTransform
+from etna.transforms import StandardScalerTransform
+from etna.transforms import STLTransform
+from etna.transforms import TheilSenTrendTransform
+from etna.transforms import TimeSeriesImputerTransform
+from etna.transforms import TreeFeatureSelectionTransform
+from etna.transforms import TrendTransform
+from etna.transforms import YeoJohnsonTransform
+from etna.transforms.decomposition import RupturesChangePointsModel
+
+
+class TestFitDoesNotModifyDataset:
+    """Test that fit doesn't modify the dataset.
+
+    Transforms are fitted on the dataframe that can share memory with the dataset, so they shouldn't modify it.
+    """
+
+    @pytest.mark.parametrize(
+        "transform, dataset_name",
+        [
+            # decomposition
+            (
+                ChangePointsSegmentationTransform(
+                    in_column="target",
+                    change_points_model=RupturesChangePointsModel(change_points_model=Binseg(), n_bkps=5),
+                ),
+                "regular_ts",
+            ),
+            (ChangePointsTrendTransform(in_column="target"), "regular_ts"),
+            (ChangePointsLevelTransform(in_column="target"), "regular_ts"),
+            (LinearTrendTransform(in_column="target"), "regular_ts"),
+            (TheilSenTrendTransform(in_column="target"), "regular_ts"),
+            (STLTransform(in_column="target", period=7), "regular_ts"),
+            (
+                TrendTransform(
+                    in_column="target",
+                    change_points_model=RupturesChangePointsModel(change_points_model=Binseg(), n_bkps=5),
+                ),
+                "regular_ts",
+            ),
+            # encoders
+            (LabelEncoderTransform(in_column="weekday"), "ts_with_exog"),
+            (OneHotEncoderTransform(in_column="weekday"), "ts_with_exog"),
+            (MeanSegmentEncoderTransform(), "regular_ts"),
+            # feature_selection
+            (GaleShapleyFeatureSelectionTransform(relevance_table=StatisticsRelevanceTable(), top_k=2), "ts_with_exog"),
+            (MRMRFeatureSelectionTransform(relevance_table=StatisticsRelevanceTable(), top_k=2), "ts_with_exog"),
+            (TreeFeatureSelectionTransform(model=DecisionTreeRegressor(random_state=42), top_k=2), "ts_with_exog"),
+            # math
+            (DifferencingTransform(in_column="target", inplace=True), "regular_ts"),
+            (BoxCoxTransform(in_column="target", mode="per-segment", inplace=True), "positive_ts"),
+            (MinMaxScalerTransform(in_column="target", mode="macro", inplace=True), "regular_ts"),
+            (StandardScalerTransform(in_column="target", mode="per-segment", inplace=True), "regular_ts"),
+            (YeoJohnsonTransform(in_column="target", mode="macro", inplace=True), "regular_ts"),
+            # missing_values
+            (
+                ResampleWithDistributionTransform(
+                    in_column="regressor_exog", distribution_column="target", inplace=True
+                ),
+                "ts_to_resample",
+            ),
+            (TimeSeriesImputerTransform(in_column="target", strategy="mean"), "ts_to_fill"),
+            (TimeSeriesImputerTransform(in_column="target", strategy="forward_fill"), "ts_to_fill"),
+            (TimeSeriesImputerTransform(in_column="target", strategy="running_mean"), "ts_to_fill"),
+            # outliers
+            (DensityOutliersTransform(in_column="target"), "ts_with_outliers"),
+            (MedianOutliersTransform(in_column="target"), "ts_with_outliers"),
+            (PredictionIntervalOutliersTransform(in_column="target", model=ProphetModel), "ts_with_outliers"),
+            # timestamp
+            (SpecialDaysTransform(), "regular_ts"),
+        ],
+    )
+    def test_fit_does_not_modify_dataset(self, transform, dataset_name, request):
+        ts = request.getfixturevalue(dataset_name)
+        df_before = deepcopy(ts.to_pandas())
+
+        transform.fit(ts)
+
+        assert_frame_equal(ts.to_pandas(), df_before)
@@ -111,6 +111,34 @@ def test_lags_values_two_segments(lags: Union[int, Sequence[int]], int_ts_two_se
             assert_almost_equal(true_values.values, lags_df[segment, f"regressor_lag_feature_{lag}"].values)
 
 
+@pytest.mark.parametrize("lags", ([1], [16, 4, 8], [5, 200]))
+def test_lags_values_match_shift(lags: List[int], int_ts_two_segments):
+    """Test that transform generates the same values as shift of the column, including lags longer than the data."""
+    lf = LagTransform(in_column="target", lags=lags, out_column="regressor_lag_feature")
+    lags_df = lf.fit_transform(ts=deepcopy(int_ts_two_segments)).to_pandas()
+    df = int_ts_two_segments.to_pandas()
+    for segment in int_ts_two_segments.segments:
+        for lag in lags:
+            expected = df[segment, "target"].shift(lag).astype(float)
+            pd.testing.assert_series_equal(
+                lags_df[segment, f"regressor_lag_feature_{lag}"], expected, check_names=False
+            )
+
+
+@pytest.mark.parametrize("dtype", ("category", "Int64"))
+def test_lags_keep_dtype(dtype, int_ts_two_segments):
+    """Test that transform keeps the dtype of the non-float column."""
+    df = int_ts_two_segments.to_pandas()
+    df_exog = df.rename(columns={"target": "exog"}, level="feature").astype(dtype)
+    ts = TSDataset(df=df, df_exog=df_exog, freq="D")
+    lf = LagTransform(in_column="exog", lags=[1, 5], out_column="exog_lag")
+    lags_df = lf.fit_transform(ts=ts).to_pandas()
+    for segment in ts.segments:
+        for lag in [1, 5]:
+            expected = df_exog[segment, "exog"].shift(lag)
+            pd.testing.assert_series_equal(lags_df[segment, f"exog_lag_{lag}"], expected, check_names=False)
+
+
 @pytest.mark.parametrize("lags", (0, -1, (10, 15, -2)))
 def test_invalid_lags_value_two_segments(lags):
     """Test that LagTransform can't be created with non-positive lags."""
@@ -1,3 +1,5 @@
+from copy import deepcopy
+from functools import partial
 from typing import Any
 
 import numpy as np
@@ -357,6 +359,109 @@ def test_sum_feature(
     np.testing.assert_array_almost_equal(expected, res.to_pandas()["segment_1"]["result"])
 
 
+@pytest.fixture
+def ts_for_rolling() -> TSDataset:
+    n = 100
+    rng = np.random.default_rng(0)
+    dfs = []
+    for i in range(3):
+        df = pd.DataFrame({"timestamp": pd.date_range("2020-01-01", periods=n)})
+        df["target"] = rng.normal(loc=1000 * i, scale=10, size=n)
+        df.loc[rng.choice(n, size=20, replace=False), "target"] = np.NaN
+        df["segment"] = f"segment_{i}"
+        dfs.append(df)
+    df = TSDataset.to_dataset(pd.concat(dfs))
+    df.loc[:"2020-01-15", ("segment_2", "target")] = np.NaN
+    ts = TSDataset(df, freq="D")
+    return ts
+
+
+def _naive_window_statistics(x: np.ndarray, window: int, seasonality: int, min_periods: int, func) -> np.ndarray:
+    result = np.full(len(x), np.NaN)
+    window = window if window != -1 else len(x)
+    for t in range(len(x)):
+        values = np.array([x[t - k * seasonality] for k in range(window) if t - k * seasonality >= 0])
+        if np.sum(~np.isnan(values)) >= min_periods:
+            result[t] = func(values)
+    return result
+
+
+@pytest.mark.parametrize("window", (1, 5, 30, -1))
+@pytest.mark.parametrize("seasonality", (1, 3))
+@pytest.mark.parametrize("min_periods", (1, 3))
+@pytest.mark.parametrize(
+    "transform_class,func",
+    (
+        (MeanTransform, np.nanmean),
+        (SumTransform, np.nansum),
+        (StdTransform, lambda values: np.nanstd(values, ddof=1) if np.sum(~np.isnan(values)) > 1 else np.NaN),
+        (MinTransform, np.nanmin),
+        (MaxTransform, np.nanmax),
+        (MinMaxDifferenceTransform, lambda values: np.nanmax(values) - np.nanmin(values)),
+        (MedianTransform, np.nanmedian),
+        (partial(QuantileTransform, quantile=0.3), partial(np.nanquantile, q=0.3)),
+        (partial(QuantileTransform, quantile=0.9), partial(np.nanquantile, q=0.9)),
+        (MADTransform, lambda values: np.nanmean(np.abs(values - np.nanmean(values)))),
+    ),
+)
+def test_rolling_kernels_match_naive_computation(
+    ts_for_rolling, transform_class, func, window, seasonality, min_periods
+):
+    transform = transform_class(
+        in_column="target",
+        window=window,
+        seasonality=seasonality,
+        min_periods=min_periods,
+        fillna=-100,
+        out_column="result",
+    )
+    df = transform.fit_transform(ts_for_rolling).to_pandas()
+    for segment in ts_for_rolling.segments:
+        expected = _naive_window_statistics(
+            x=df[segment]["target"].values, window=window, seasonality=seasonality, min_periods=min_periods, func=func
+        )
+        expected = np.nan_to_num(expected, nan=-100)
+        np.testing.assert_allclose(df[segment]["result"].values, expected, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize(
+    "transform",
+    (
+        MeanTransform(in_column="target", window=5, seasonality=2),
+        StdTransform(in_column="target", window=5, seasonality=2),
+        MinTransform(in_column="target", window=5, seasonality=2),
+        MaxTransform(in_column="target", window=5, seasonality=2),
+        MinMaxDifferenceTransform(in_column="target", window=5, seasonality=2),
+        SumTransform(in_column="target", window=5, seasonality=2),
+        MedianTransform(in_column="target", window=5, seasonality=2),
+        QuantileTransform(in_column="target", quantile=0.7, window=5, seasonality=2),
+        MADTransform(in_column="target", window=5, seasonality=2),
+    ),
+)
+def test_rolling_kernels_match_sliding_window(transform, ts_for_rolling):
+    sliding_window_transform = deepcopy(transform)
+    # without the streaming kernel the aggregation is applied to the materialized windows
+    sliding_window_transform._aggregate_rolling = lambda x, window, counts: None
+    rolling = transform.fit_transform(deepcopy(ts_for_rolling)).to_pandas()
+    sliding_window = sliding_window_transform.fit_transform(deepcopy(ts_for_rolling)).to_pandas()
+    pd.testing.assert_frame_equal(rolling, sliding_window, check_exact=False, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize("dtype", (np.float32, np.float64))
+@pytest.mark.parametrize(
+    "transform",
+    (
+        MeanTransform(in_column="target", window=5, out_column="result"),
+        StdTransform(in_column="target", window=5, out_column="result"),
+        MedianTransform(in_column="target", window=5, out_column="result"),
+    ),
+)
+def test_transform_keeps_float_dtype(transform, dtype, ts_for_rolling):
+    df = ts_for_rolling.to_pandas().astype(dtype)
+    result = transform._transform(df)
+    assert (result.loc[:, pd.IndexSlice[:, "result"]].dtypes == dtype).all()
+
+
 @pytest.mark.parametrize(
     "transform",
     (
@@ -393,3 +393,29 @@ def test_constant_fill_strategy(ts_with_missing_range_x_index_two_segments: TSDa
 def test_save_load(ts_to_fill):
     transform = TimeSeriesImputerTransform()
     assert_transformation_equals_loaded_original(transform=transform, ts=ts_to_fill)
+
+
+@pytest.mark.parametrize(
+    "strategy,default_value",
+    (("mean", None), ("constant", None), ("forward_fill", None), ("forward_fill", 100), ("running_mean", None)),
+)
+def test_fit_transform_all_segments_at_once(ts_nans_beginning, strategy, default_value, monkeypatch):
+    """Check that imputer gives the same results on all the segments at once and segment by segment."""
+    ts_one_by_one = deepcopy(ts_nans_beginning)
+    ts_at_once = deepcopy(ts_nans_beginning)
+    transform_at_once = TimeSeriesImputerTransform(strategy=strategy, default_value=default_value)
+    ts_at_once = transform_at_once.fit_transform(ts_at_once)
+    ts_at_once_inversed = transform_at_once.inverse_transform(deepcopy(ts_at_once))
+
+    for method in ("_fit_segments", "_transform_segments", "_inverse_transform_segments"):
+        monkeypatch.setattr(_OneSegmentTimeSeriesImputerTransform, method, lambda *args, **kwargs: None)
+    transform_one_by_one = TimeSeriesImputerTransform(strategy=strategy, default_value=default_value)
+    ts_one_by_one = transform_one_by_one.fit_transform(ts_one_by_one)
+    ts_one_by_one_inversed = transform_one_by_one.inverse_transform(deepcopy(ts_one_by_one))
+
+    pd.testing.assert_frame_equal(ts_at_once.to_pandas(), ts_one_by_one.to_pandas())
+    pd.testing.assert_frame_equal(ts_at_once_inversed.to_pandas(), ts_one_by_one_inversed.to_pandas())
+    for segment in ts_nans_beginning.segments:
+        assert transform_at_once.segment_transforms[segment].nan_timestamps.equals(
+            transform_one_by_one.segment_transforms[segment].nan_timestamps
+        )
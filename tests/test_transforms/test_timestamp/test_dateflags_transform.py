@@ -285,6 +285,44 @@ def test_feature_values(
         assert (true_df == result_df).all().all()
 
 
+@pytest.mark.parametrize("start, end", (("1968-12-20", "1971-01-10"), ("2019-12-25", "2021-01-10 23:00")))
+def test_feature_values_around_year_boundaries(start, end):
+    """Test that transform generates correct values before epoch and around the boundaries of ISO years."""
+    timestamps = pd.date_range(start, end, freq="7h")
+    df = pd.DataFrame({"timestamp": timestamps, "segment": "segment_0", "target": 1})
+    ts = TSDataset(df=TSDataset.to_dataset(df), freq="7H")
+    transform = DateFlagsTransform(
+        day_number_in_week=True,
+        day_number_in_month=True,
+        day_number_in_year=True,
+        week_number_in_month=True,
+        week_number_in_year=True,
+        month_number_in_year=True,
+        year_number=True,
+        is_weekend=True,
+        out_column="dateflag",
+    )
+    result = transform.fit_transform(ts).to_pandas()["segment_0"]
+
+    timestamp_series = pd.Series(timestamps, index=timestamps)
+    expected = {
+        "day_number_in_week": timestamp_series.dt.weekday,
+        "day_number_in_month": timestamp_series.dt.day,
+        "day_number_in_year": timestamp_series.apply(
+            lambda dt: dt.dayofyear + 1 if not dt.is_leap_year and dt.month >= 3 else dt.dayofyear
+        ),
+        "week_number_in_month": timestamp_series.apply(
+            lambda x: int(x.weekday() < (x - timedelta(days=x.day - 1)).weekday()) + (x.day - 1) // 7 + 1
+        ),
+        "week_number_in_year": timestamp_series.apply(lambda x: x.isocalendar()[1]),
+        "month_number_in_year": timestamp_series.dt.month,
+        "year_number": timestamp_series.dt.year,
+        "is_weekend": timestamp_series.dt.weekday >= 5,
+    }
+    for feature, expected_values in expected.items():
+        np.testing.assert_array_equal(result[f"dateflag_{feature}"].astype(expected_values.dtype), expected_values)
+
+
 def test_save_load(train_ts):
     ts = train_ts
     transform = DateFlagsTransform()
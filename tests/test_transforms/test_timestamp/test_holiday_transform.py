@@ -1,3 +1,4 @@
+import holidays
 import numpy as np
 import pandas as pd
 import pytest
@@ -166,6 +167,20 @@ def test_holidays_min(iso_code: str, answer: np.array, two_segments_simple_ts_mi
         assert np.array_equal(df[segment]["regressor_holidays"].values, answer)
 
 
+@pytest.mark.parametrize("iso_code", ("RUS", "US", "GB"))
+@pytest.mark.parametrize("start, end, freq", (("2019-12-20", "2021-01-10", "D"), ("2020-12-24", "2021-01-09", "15T")))
+def test_holidays_match_holidays_package(iso_code: str, start: str, end: str, freq: str):
+    periods = len(pd.date_range(start, end, freq=freq))
+    df = generate_const_df(start_time=start, periods=periods, scale=1, n_segments=2, freq=freq)
+    ts = TSDataset(TSDataset.to_dataset(df), freq=freq)
+    holidays_finder = HolidayTransform(iso_code=iso_code, out_column="regressor_holidays")
+    df = holidays_finder.fit_transform(ts).to_pandas()
+    country_holidays = holidays.CountryHoliday(iso_code)
+    expected = np.array([int(timestamp in country_holidays) for timestamp in df.index])
+    for segment in df.columns.get_level_values("segment").unique():
+        np.testing.assert_array_equal(df[segment]["regressor_holidays"].astype(int).values, expected)
+
+
 @pytest.mark.parametrize(
     "index",
     (
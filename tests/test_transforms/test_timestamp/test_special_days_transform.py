@@ -200,3 +200,31 @@ def test_save_load(df_with_specials):
     ts = TSDataset(df=TSDataset.to_dataset(df), freq="D")
     transform = SpecialDaysTransform()
     assert_transformation_equals_loaded_original(transform=transform, ts=ts)
+
+
+@pytest.mark.parametrize("find_special_weekday,find_special_month_day", ((True, True), (True, False), (False, True)))
+def test_fit_transform_all_segments_at_once(
+    df_with_specials, find_special_weekday, find_special_month_day, monkeypatch
+):
+    """Check that special days are found on all the segments at once as segment by segment."""
+    df_1 = df_with_specials[["target"]].reset_index()
+    df_1["segment"] = "segment_1"
+    df_2 = df_with_specials[["target"]].reset_index()
+    df_2["target"] = df_2["target"].sample(frac=1, random_state=0).values
+    df_2.loc[:10, "target"] = None
+    df_2["segment"] = "segment_2"
+    df = TSDataset.to_dataset(pd.concat([df_1, df_2], ignore_index=True))
+
+    transform_at_once = SpecialDaysTransform(
+        find_special_weekday=find_special_weekday, find_special_month_day=find_special_month_day
+    )
+    df_at_once = transform_at_once.fit_transform(TSDataset(df=df, freq="D")).to_pandas()
+
+    for method in ("_fit_segments", "_transform_segments"):
+        monkeypatch.setattr(_OneSegmentSpecialDaysTransform, method, lambda *args, **kwargs: None)
+    transform_one_by_one = SpecialDaysTransform(
+        find_special_weekday=find_special_weekday, find_special_month_day=find_special_month_day
+    )
+    df_one_by_one = transform_one_by_one.fit_transform(TSDataset(df=df, freq="D")).to_pandas()
+
+    pd.testing.assert_frame_equal(df_at_once, df_one_by_one)
@@ -0,0 +1,97 @@
+from copy import deepcopy
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from etna.transforms.timestamp import DateFlagsTransform
+from etna.transforms.timestamp import FourierTransform
+from etna.transforms.timestamp import TimeFlagsTransform
+from etna.transforms.timestamp.utils import _CalendarFeaturesCache
+from etna.transforms.timestamp.utils import clear_calendar_cache
+from etna.transforms.timestamp.utils import get_unique_days
+
+
+@pytest.fixture
+def index() -> pd.DatetimeIndex:
+    return pd.date_range("2020-01-01", periods=100, freq="H")
+
+
+class _CountingCompute:
+    def __init__(self):
+        self.num_calls = 0
+
+    def __call__(self, index: pd.DatetimeIndex) -> np.ndarray:
+        self.num_calls += 1
+        return np.arange(len(index), dtype=np.int64)
+
+
+def test_cache_computes_feature_once(index):
+    cache = _CalendarFeaturesCache(max_bytes=2**20)
+    compute = _CountingCompute()
+    first = cache.get(index=index, spec=("feature",), compute=compute)
+    second = cache.get(index=index.copy(), spec=("feature",), compute=compute)
+    assert first is second
+    assert compute.num_calls == 1
+
+
+def test_cache_distinguishes_indices_and_specs(index):
+    cache = _CalendarFeaturesCache(max_bytes=2**20)
+    compute = _CountingCompute()
+    cache.get(index=index, spec=("feature",), compute=compute)
+    cache.get(index=index, spec=("other_feature",), compute=compute)
+    cache.get(index=index[1:], spec=("feature",), compute=compute)
+    cache.get(index=pd.date_range("2020-01-01", periods=100, freq="D"), spec=("feature",), compute=compute)
+    assert compute.num_calls == 4
+
+
+def test_cache_returns_read_only_arrays(index):
+    cache = _CalendarFeaturesCache(max_bytes=2**20)
+    feature = cache.get(index=index, spec=("feature",), compute=_CountingCompute())
+    with pytest.raises(ValueError, match="read-only"):
+        feature[0] = 1
+
+
+def test_cache_evicts_least_recently_used(index):
+    feature_num_bytes = len(index) * np.dtype(np.int64).itemsize
+    cache = _CalendarFeaturesCache(max_bytes=2 * feature_num_bytes)
+    compute = _CountingCompute()
+    cache.get(index=index, spec=("first",), compute=compute)
+    cache.get(index=index, spec=("second",), compute=compute)
+    cache.get(index=index, spec=("first",), compute=compute)
+    cache.get(index=index, spec=("third",), compute=compute)
+    assert compute.num_calls == 3
+
+    cache.get(index=index, spec=("first",), compute=compute)
+    assert compute.num_calls == 3
+    cache.get(index=index, spec=("second",), compute=compute)
+    assert compute.num_calls == 4
+
+
+def test_cache_skips_irregular_index():
+    index = pd.DatetimeIndex(["2020-01-01", "2020-01-02", "2020-01-04", "2020-01-05"])
+    cache = _CalendarFeaturesCache(max_bytes=2**20)
+    compute = _CountingCompute()
+    cache.get(index=index, spec=("feature",), compute=compute)
+    cache.get(index=index, spec=("feature",), compute=compute)
+    assert compute.num_calls == 2
+
+
+def test_get_unique_days(index):
+    days, day_indices = get_unique_days(index=index)
+    np.testing.assert_array_equal(days[day_indices], index.floor("D").values.astype("datetime64[D]"))
+
+
+@pytest.mark.parametrize(
+    "transform",
+    [
+        DateFlagsTransform(day_number_in_year=True, week_number_in_year=True, special_days_in_week=(1, 2)),
+        TimeFlagsTransform(),
+        FourierTransform(period=24, order=3),
+    ],
+)
+def test_transform_with_cached_features(transform, example_tsds):
+    clear_calendar_cache()
+    expected = transform.fit_transform(deepcopy(example_tsds)).to_pandas()
+    result = transform.fit_transform(deepcopy(example_tsds)).to_pandas()
+    pd.testing.assert_frame_equal(result, expected)